@@ -4,11 +4,15 @@ from pymongo import MongoClient     # MongoDB/DocumentDB 연결 및 문서 조
 from datetime import datetime, date # 날짜/시간 처리 (이관 시점 기록용)
 import hashlib                      # 해시 함수 제공 (비밀번호 암호화 등에 사용 가능)
 import re                           # 정규표현식 패턴 매칭 (데이터 검증 및 변환용)
+from connection_profiles import resolve_connection_profile  # 압축/풀 크기 등 연결 설정 프로필
 
-def connect_to_mysql():
+def connect_to_mysql(profile=None):
     """
     MySQL RDS 데이터베이스 연결 함수
     
+    Args:
+        profile (str | dict): 연결 설정 프로필 (없으면 CONNECTION_PROFILE 환경변수, 기본값: default)
+    
     Returns:
         mysql.connector.connection.MySQLConnection: MySQL 데이터베이스 연결 객체
         
@@ -17,6 +21,7 @@ def connect_to_mysql():
         - MYSQL_USER: MySQL 사용자명
         - MYSQL_PASSWORD: MySQL 비밀번호
         - MYSQL_DATABASE: MySQL 데이터베이스명 (기본값: shopping_db)
+        - CONNECTION_PROFILE: 연결 설정 프로필 이름 (선택, 예: cross_network)
     """
     # 환경 변수에서 데이터베이스 연결 정보 읽기
     # 보안을 위해 하드코딩 대신 환경 변수 사용
@@ -26,19 +31,25 @@ def connect_to_mysql():
         'password': os.environ.get('MYSQL_PASSWORD'),
         'database': os.environ.get('MYSQL_DATABASE')
     }
+    # 프로토콜 압축 등 프로필의 연결 인자 추가
+    mysql_config.update(resolve_connection_profile(profile or os.environ.get('CONNECTION_PROFILE'))['mysql'])
     
     return mysql.connector.connect(**mysql_config)
 
-def connect_to_mongodb():
+def connect_to_mongodb(profile=None):
     """
     MongoDB(DocumentDB) 연결 함수
     
+    Args:
+        profile (str | dict): 연결 설정 프로필 (없으면 CONNECTION_PROFILE 환경변수, 기본값: default)
+    
     Returns:
         pymongo.database.Database: MongoDB(DocumentDB) 데이터베이스 객체
 
     Environment Variables Required:
         - MONGODB_URI: MongoDB 연결 URI
         - MONGODB_DATABASE: MongoDB 데이터베이스명 (기본값: shopping_db)
+        - CONNECTION_PROFILE: 연결 설정 프로필 이름 (선택, 예: cross_network)
         
     Note:
         DocumentDB 사용 시 실제 연결 문자열로 변경 필요
@@ -50,7 +61,8 @@ def connect_to_mongodb():
     mongodb_database = os.environ.get('MONGODB_DATABASE')
     
     # MongoDB 로컬 연결(DocumentDB 사용 시 실제 연결 문자열로 변경 필요)
-    client = MongoClient(mongodb_uri)
+    # compressors(zstd/snappy/zlib), 타임아웃, 연결 풀 크기는 연결 프로필에서 지정
+    client = MongoClient(mongodb_uri, **resolve_connection_profile(profile or os.environ.get('CONNECTION_PROFILE'))['mongodb'])
     
     return client[mongodb_database]  # 'shopping_db' 데이터베이스 선택
 
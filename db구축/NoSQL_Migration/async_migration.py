@@ -0,0 +1,402 @@
+import asyncio                      # 비동기 이벤트 루프 및 동시 실행 제어 (Semaphore, gather)
+import logging                      # 구조화된 로깅 시스템 (CloudWatch 로그 출력용)
+from datetime import datetime       # 컬렉션별 처리 시간 측정용
+import aiomysql                     # asyncio 기반 MySQL 드라이버 (연결 풀 제공)
+from motor.motor_asyncio import AsyncIOMotorClient  # asyncio 기반 MongoDB/DocumentDB 드라이버
+from pymongo.errors import BulkWriteError  # motor도 pymongo와 같은 삽입 오류 타입 사용
+
+# 문서 변환 규칙과 쓰기 재시도/dead-letter 규칙은 동기 이관(index.py)과 동일한 함수를 공유하여
+# 결과 문서와 write_stats를 일치시킴
+from index import (
+    BULK_WRITE_BATCH_SIZE,
+    DEAD_LETTER_COLLECTION,
+    WRITE_MAX_RETRIES,
+    build_dead_letters,
+    build_product_doc,
+    build_customer_doc,
+    build_order_item_doc,
+    build_order_doc,
+    build_review_doc,
+    is_retryable_write_error,
+    replace_operations,
+    split_bulk_write_errors,
+    write_retry_delay
+)
+
+logger = logging.getLogger()
+
+# 동시에 실행할 MySQL 쿼리 및 MongoDB 삽입 배치 수 기본값
+DEFAULT_CONCURRENCY = 8
+
+class AsyncMigrationContext:
+    """
+    비동기 이관 중 공유하는 연결 풀, MongoDB 데이터베이스, 동시 실행 제한 세마포어
+
+    Attributes:
+        mysql_pool: aiomysql 연결 풀 (동시 실행 수만큼 연결 유지)
+        mongodb: motor 데이터베이스 객체
+        semaphore: 동시에 진행 중인 MySQL 쿼리 + MongoDB 삽입 배치 수 제한
+    """
+
+    def __init__(self, mysql_pool, mongodb, concurrency):
+        self.mysql_pool = mysql_pool
+        self.mongodb = mongodb
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_all(self, query, args=None):
+        """
+        연결 풀에서 연결을 빌려 쿼리를 실행하고 모든 결과를 반환
+
+        Args:
+            query (str): 실행할 SQL 쿼리문 (%s 파라미터 사용)
+            args (tuple): 쿼리 파라미터
+
+        Returns:
+            tuple: 쿼리 결과 행 목록
+        """
+        async with self.semaphore:
+            async with self.mysql_pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(query, args)
+                    return await cursor.fetchall()
+
+    async def record_dead_letters(self, collection, failures):
+        """반복 실패한 문서를 DEAD_LETTER_COLLECTION에 기록 (index.record_dead_letters의 비동기 버전)"""
+        dead_letters = build_dead_letters(collection.name, failures)
+        if dead_letters:
+            await collection.database[DEAD_LETTER_COLLECTION].insert_many(dead_letters)
+
+    async def insert_batch(self, collection_name, docs, idempotent=False):
+        """
+        문서 배치를 삽입하고 일시적 오류는 재시도 (index.insert_batch_with_retry의 비동기 버전)
+
+        Args:
+            collection_name (str): 대상 컬렉션명
+            docs (list): 삽입할 문서 목록 (모든 문서에 _id가 있어야 함)
+            idempotent (bool): True이면 첫 시도부터 ReplaceOne upsert로 실행
+
+        Returns:
+            dict: {'inserted', 'retries', 'dead_lettered'}
+
+        Note:
+            세마포어는 쓰기 시도 동안만 잡고 백오프 대기 중에는 놓아 다른 조회/삽입이 진행되도록 함
+        """
+        collection = self.mongodb[collection_name]
+        stats = {'inserted': 0, 'retries': 0, 'dead_lettered': 0}
+        pending = docs
+        attempt = 0
+        while pending:
+            try:
+                async with self.semaphore:
+                    if attempt == 0 and not idempotent:
+                        await collection.insert_many(pending, ordered=False)
+                    else:
+                        await collection.bulk_write(replace_operations(pending), ordered=False)
+                stats['inserted'] += len(pending)
+                return stats
+            except BulkWriteError as e:
+                retry_docs, failures = split_bulk_write_errors(pending, e, attempt)
+                stats['inserted'] += len(pending) - len(retry_docs) - len(failures)
+                await self.record_dead_letters(collection, failures)
+                stats['dead_lettered'] += len(failures)
+                pending = retry_docs
+            except Exception as e:
+                if not is_retryable_write_error(e):
+                    if len(pending) == 1:
+                        await self.record_dead_letters(collection, [(pending[0], str(e), getattr(e, 'code', None),
+                                                                     attempt + 1)])
+                        stats['dead_lettered'] += 1
+                        return stats
+                    # 실패한 insert_many가 일부를 이미 썼을 수 있으므로 나눈 배치는 upsert로 다시 씀
+                    middle = len(pending) // 2
+                    halves = await asyncio.gather(*(self.insert_batch(collection_name, half, idempotent=True)
+                                                    for half in (pending[:middle], pending[middle:])))
+                    return merge_write_stats([stats] + list(halves))
+                if attempt >= WRITE_MAX_RETRIES:
+                    await self.record_dead_letters(collection, [(doc, str(e), getattr(e, 'code', None), attempt + 1)
+                                                                for doc in pending])
+                    stats['dead_lettered'] += len(pending)
+                    return stats
+
+            if pending:
+                delay = write_retry_delay(attempt)
+                attempt += 1
+                stats['retries'] += 1
+                logger.warning(f"[async] {collection_name} 배치 {len(pending)}개 문서 재시도 "
+                               f"{attempt}/{WRITE_MAX_RETRIES} ({delay:.1f}초 대기)")
+                await asyncio.sleep(delay)
+        return stats
+
+    async def insert_all(self, collection_name, docs):
+        """
+        문서 목록을 BULK_WRITE_BATCH_SIZE 단위 배치로 나누어 동시에 삽입
+
+        Returns:
+            dict: 배치별 write_stats 합계
+        """
+        batches = [docs[start:start + BULK_WRITE_BATCH_SIZE] for start in range(0, len(docs), BULK_WRITE_BATCH_SIZE)]
+        return merge_write_stats(await asyncio.gather(*(self.insert_batch(collection_name, batch) for batch in batches)))
+
+def merge_write_stats(stats_list):
+    """배치별 write_stats를 합산"""
+    total = {'inserted': 0, 'retries': 0, 'dead_lettered': 0}
+    for stats in stats_list:
+        for key in total:
+            total[key] += stats[key]
+    return total
+
+def log_dead_letters(collection_name, write_stats):
+    """dead-letter로 기록된 문서가 있으면 insert_documents와 같은 경고 기록"""
+    if write_stats['dead_lettered']:
+        logger.warning(f"[async] {collection_name}: {write_stats['dead_lettered']}개 문서를 {DEAD_LETTER_COLLECTION}에 기록")
+
+async def migrate_products_collection_async(ctx):
+    """
+    migrate_products_collection()의 비동기 버전 (동일한 문서와 결과 dict 생성)
+
+    Args:
+        ctx (AsyncMigrationContext): 비동기 이관 컨텍스트
+
+    Returns:
+        dict: 이관 결과 정보
+    """
+    logger.info("[async] Products 컬렉션 이관 시작")
+    await ctx.mongodb.Products.drop()
+
+    products = await ctx.fetch_all("SELECT * FROM Products")
+    logger.info(f"[async] MySQL에서 {len(products)}개 상품 데이터 조회")
+
+    products_docs = [build_product_doc(product) for product in products]
+    write_stats = await ctx.insert_all('Products', products_docs)
+    log_dead_letters('Products', write_stats)
+    logger.info(f"[async] Products 컬렉션 이관 완료: {write_stats['inserted']}개 문서")
+
+    return {
+        'count': len(products_docs),
+        'collection_name': 'Products',
+        'mysql_records': len(products),
+        'mongodb_documents': len(products_docs),
+        'write_stats': write_stats
+    }
+
+async def migrate_customers_collection_async(ctx):
+    """
+    migrate_customers_collection()의 비동기 버전
+    고객별 장바구니 조회를 배치 단위로 동시에 실행하고, 이전 배치의 삽입과 다음 배치의 조회를 겹쳐 실행
+
+    Args:
+        ctx (AsyncMigrationContext): 비동기 이관 컨텍스트
+
+    Returns:
+        dict: 이관 결과 정보
+    """
+    logger.info("[async] Customers 컬렉션 이관 시작")
+    await ctx.mongodb.Customers.drop()
+
+    customers = await ctx.fetch_all("SELECT * FROM Customers")
+    logger.info(f"[async] MySQL에서 {len(customers)}개 고객 데이터 조회")
+
+    cart_query = """
+        SELECT cart_seq_no, prod_cd, prod_size, ord_qty, ord_yn
+        FROM Carts
+        WHERE cust_id = %s
+        ORDER BY cart_seq_no
+    """
+
+    insert_tasks = []
+    total_cart_items = 0
+    customers_count = 0
+
+    for start in range(0, len(customers), BULK_WRITE_BATCH_SIZE):
+        batch = customers[start:start + BULK_WRITE_BATCH_SIZE]
+
+        # 배치 내 고객들의 장바구니 조회를 동시에 실행 (세마포어가 동시 쿼리 수 제한)
+        cart_results = await asyncio.gather(*(ctx.fetch_all(cart_query, (customer[0],)) for customer in batch))
+
+        customers_docs = []
+        for customer, cart_items in zip(batch, cart_results):
+            total_cart_items += len(cart_items)
+            customers_docs.append(build_customer_doc(customer, cart_items))
+        customers_count += len(customers_docs)
+
+        # 삽입은 백그라운드로 넘기고 바로 다음 배치 조회 진행
+        insert_tasks.append(asyncio.create_task(ctx.insert_batch('Customers', customers_docs)))
+
+    write_stats = merge_write_stats(await asyncio.gather(*insert_tasks))
+    log_dead_letters('Customers', write_stats)
+    logger.info(f"[async] Customers 컬렉션 이관 완료: {write_stats['inserted']}개 문서, {total_cart_items}개 장바구니 항목")
+
+    return {
+        'count': customers_count,
+        'collection_name': 'Customers',
+        'mysql_records': len(customers),
+        'mongodb_documents': customers_count,
+        'total_cart_items': total_cart_items,
+        'write_stats': write_stats
+    }
+
+async def build_order_doc_async(ctx, order):
+    """
+    주문 한 건의 주문상세 및 리뷰 작성 여부를 동시에 조회하여 Orders 문서 생성
+
+    Args:
+        ctx (AsyncMigrationContext): 비동기 이관 컨텍스트
+        order (tuple): SELECT * FROM Orders 결과 행
+
+    Returns:
+        dict: Orders 문서
+    """
+    order_items = await ctx.fetch_all("""
+        SELECT oi.ord_item_no, oi.cart_seq_no, oi.prod_cd, oi.prod_size, oi.ord_qty,
+               p.prod_name, p.price
+        FROM Ord_items oi
+        JOIN Products p ON oi.prod_cd = p.prod_cd
+        WHERE oi.ord_no = %s
+    """, (order[0],))
+
+    # 주문 상품별 리뷰 존재 여부 확인을 동시에 실행
+    review_counts = await asyncio.gather(*(
+        ctx.fetch_all("SELECT COUNT(*) as review_count FROM Prod_evals WHERE ord_item_no = %s", (item[0],))
+        for item in order_items
+    ))
+
+    items = [build_order_item_doc(item, review_count[0][0]) for item, review_count in zip(order_items, review_counts)]
+    return build_order_doc(order, items)
+
+async def migrate_orders_collection_async(ctx):
+    """
+    migrate_orders_collection()의 비동기 버전
+    주문별 주문상세/리뷰 조회를 배치 단위로 동시에 실행
+
+    Args:
+        ctx (AsyncMigrationContext): 비동기 이관 컨텍스트
+
+    Returns:
+        dict: 이관 결과 정보
+    """
+    logger.info("[async] Orders 컬렉션 이관 시작")
+    await ctx.mongodb.Orders.drop()
+
+    orders = await ctx.fetch_all("SELECT * FROM Orders")
+    logger.info(f"[async] MySQL에서 {len(orders)}개 주문 데이터 조회")
+
+    insert_tasks = []
+    orders_count = 0
+    total_order_items = 0
+
+    for start in range(0, len(orders), BULK_WRITE_BATCH_SIZE):
+        batch = orders[start:start + BULK_WRITE_BATCH_SIZE]
+        orders_docs = await asyncio.gather(*(build_order_doc_async(ctx, order) for order in batch))
+
+        orders_count += len(orders_docs)
+        total_order_items += sum(len(order_doc['items']) for order_doc in orders_docs)
+        insert_tasks.append(asyncio.create_task(ctx.insert_batch('Orders', list(orders_docs))))
+
+    write_stats = merge_write_stats(await asyncio.gather(*insert_tasks))
+    log_dead_letters('Orders', write_stats)
+    logger.info(f"[async] Orders 컬렉션 이관 완료: {write_stats['inserted']}개 문서, {total_order_items}개 주문 상품")
+
+    return {
+        'count': orders_count,
+        'collection_name': 'Orders',
+        'mysql_records': len(orders),
+        'mongodb_documents': orders_count,
+        'total_order_items': total_order_items,
+        'write_stats': write_stats
+    }
+
+async def migrate_reviews_collection_async(ctx):
+    """
+    migrate_reviews_collection()의 비동기 버전 (동일한 조인 쿼리와 문서 구조 사용)
+
+    Args:
+        ctx (AsyncMigrationContext): 비동기 이관 컨텍스트
+
+    Returns:
+        dict: 이관 결과 정보
+    """
+    logger.info("[async] Reviews 컬렉션 이관 시작")
+    await ctx.mongodb.Reviews.drop()
+
+    reviews = await ctx.fetch_all("""
+        SELECT pe.eval_seq_no, pe.eval_score, pe.eval_comment, pe.cust_id,
+               pe.prod_cd, pe.ord_item_no, c.cust_name,
+               oi.ord_no
+        FROM Prod_evals pe
+        JOIN Customers c ON pe.cust_id = c.cust_id
+        JOIN Ord_items oi ON pe.ord_item_no = oi.ord_item_no
+        ORDER BY pe.eval_seq_no
+    """)
+    logger.info(f"[async] MySQL에서 {len(reviews)}개 리뷰 데이터 조회")
+
+    reviews_docs = [build_review_doc(review) for review in reviews]
+    write_stats = await ctx.insert_all('Reviews', reviews_docs)
+    log_dead_letters('Reviews', write_stats)
+    logger.info(f"[async] Reviews 컬렉션 이관 완료: {write_stats['inserted']}개 문서")
+
+    return {
+        'count': len(reviews_docs),
+        'collection_name': 'Reviews',
+        'mysql_records': len(reviews),
+        'mongodb_documents': len(reviews_docs),
+        'write_stats': write_stats
+    }
+
+# 컬렉션명별 비동기 이관 함수
+ASYNC_MIGRATIONS = {
+    'Products': migrate_products_collection_async,
+    'Customers': migrate_customers_collection_async,
+    'Orders': migrate_orders_collection_async,
+    'Reviews': migrate_reviews_collection_async
+}
+
+async def migrate_collections_async(mysql_config, mongodb_uri, mongodb_database, collections,
+                                    concurrency=DEFAULT_CONCURRENCY, mongo_client_options=None):
+    """
+    여러 컬렉션 이관을 하나의 이벤트 루프에서 동시에 실행
+
+    Args:
+        mysql_config (dict): MySQL 연결 정보 (host, user, password, database)
+        mongodb_uri (str): MongoDB 연결 URI
+        mongodb_database (str): MongoDB 데이터베이스명
+        collections (list): 이관할 컬렉션 목록
+        concurrency (int): 동시에 실행할 MySQL 쿼리 + MongoDB 삽입 배치 수
+        mongo_client_options (dict): 연결 프로필의 MongoClient 인자 (compressors, 타임아웃 등, maxPoolSize는 concurrency 사용)
+
+    Returns:
+        dict: 컬렉션별 이관 결과 (동기 이관과 같은 형식, duration_seconds 포함)
+
+    Note:
+        - lambda_handler에서 asyncio.run()으로 호출
+        - aiomysql(PyMySQL 기반)은 MySQL 프로토콜 압축을 지원하지 않으므로 mysql_config의 compress는 무시됨
+    """
+    mysql_pool = await aiomysql.create_pool(
+        host=mysql_config['host'],
+        user=mysql_config['user'],
+        password=mysql_config['password'],
+        db=mysql_config['database'],
+        minsize=1,
+        maxsize=concurrency,
+        autocommit=True
+    )
+    if mysql_config.get('compress'):
+        logger.info("[async] aiomysql은 MySQL 프로토콜 압축을 지원하지 않아 MongoDB 압축만 적용")
+    mongo_client = AsyncIOMotorClient(mongodb_uri, **dict(mongo_client_options or {}, maxPoolSize=concurrency))
+    ctx = AsyncMigrationContext(mysql_pool, mongo_client[mongodb_database], concurrency)
+
+    async def run_timed(collection):
+        # 동시에 실행되므로 컬렉션별 소요시간은 각 코루틴 안에서 측정
+        start_time = datetime.now()
+        result = await ASYNC_MIGRATIONS[collection](ctx)
+        result['duration_seconds'] = (datetime.now() - start_time).total_seconds()
+        logger.info(f"[async] {collection} 컬렉션 이관 소요시간: {result['duration_seconds']:.2f}초")
+        return collection, result
+
+    try:
+        results = await asyncio.gather(*(run_timed(collection) for collection in collections
+                                         if collection in ASYNC_MIGRATIONS))
+        return dict(results)
+    finally:
+        mysql_pool.close()
+        await mysql_pool.wait_closed()
+        mongo_client.close()
@@ -0,0 +1,162 @@
+import os                           # 운영체제 환경변수 접근 (데이터베이스 연결정보 읽기용)
+import sys                          # 명령행 인자 처리 (대상 테이블, 반복 횟수)
+import json                         # 측정 결과 출력
+import time                         # 구간별 처리 시간 측정
+import warnings                     # 압축 라이브러리 미설치 경고 감지 (해당 방식은 측정 제외)
+from decimal import Decimal         # MySQL DECIMAL 값을 BSON으로 저장 가능한 float로 변환
+from datetime import datetime, date # MySQL date 값을 BSON datetime으로 변환
+import mysql.connector              # MySQL 데이터베이스 연결 및 쿼리 실행을 위한 공식 드라이버
+from pymongo import MongoClient     # MongoDB/DocumentDB 연결 및 serverStatus 조회
+
+# 이관과 같은 배치 크기로 삽입해야 실제 이관의 전송량/처리량과 비교 가능
+from index import BULK_WRITE_BATCH_SIZE
+
+# 측정할 MongoDB 압축 방식 (None은 압축 없음)
+MONGODB_COMPRESSORS = [None, 'zlib', 'snappy', 'zstd']
+
+# 삽입 측정용 컬렉션 (측정 후 삭제)
+BENCHMARK_COLLECTION = '_connection_benchmark'
+
+def mysql_bytes_sent(cursor):
+    """현재 세션에서 서버가 클라이언트로 보낸 바이트 수 (압축 사용 시 압축된 크기)"""
+    cursor.execute("SHOW SESSION STATUS LIKE 'Bytes_sent'")
+    return int(cursor.fetchone()[1])
+
+def benchmark_mysql_read(mysql_config, table, repeat, compress):
+    """
+    압축 여부별로 테이블 전체 조회를 반복하여 전송량과 처리량 측정
+
+    Returns:
+        tuple: (측정 결과 dict, 조회한 컬럼명 목록, 조회한 행 목록)
+    """
+    conn = mysql.connector.connect(**mysql_config, compress=compress)
+    cursor = conn.cursor()
+    try:
+        before = mysql_bytes_sent(cursor)
+        start = time.perf_counter()
+        rows = []
+        for _ in range(repeat):
+            cursor.execute(f"SELECT * FROM {table}")
+            rows = cursor.fetchall()
+        seconds = time.perf_counter() - start
+        wire_bytes = mysql_bytes_sent(cursor) - before
+        columns = [column[0] for column in cursor.description] if cursor.description else []
+    finally:
+        cursor.close()
+        conn.close()
+
+    return {
+        'driver': 'mysql',
+        'setting': 'compress' if compress else 'none',
+        'rows': len(rows) * repeat,
+        'wire_mb': round(wire_bytes / (1024 * 1024), 3),
+        'seconds': round(seconds, 3),
+        'rows_per_sec': round(len(rows) * repeat / seconds, 1) if seconds else None,
+        'wire_mb_per_sec': round(wire_bytes / (1024 * 1024) / seconds, 2) if seconds else None
+    }, columns, rows
+
+def to_benchmark_doc(columns, row):
+    """MySQL 행을 BSON으로 저장 가능한 문서로 변환 (DECIMAL → float, date → datetime)"""
+    doc = {}
+    for column, value in zip(columns, row):
+        if isinstance(value, Decimal):
+            value = float(value)
+        elif isinstance(value, date) and not isinstance(value, datetime):
+            value = datetime.combine(value, datetime.min.time())
+        doc[column] = value
+    return doc
+
+def server_network_bytes_in(mongodb):
+    """서버가 받은 전체 바이트 수 (로컬 측정용 서버이므로 다른 클라이언트 트래픽은 없다고 가정)"""
+    return mongodb.command('serverStatus')['network']['bytesIn']
+
+def benchmark_mongodb_insert(mongodb_uri, database, docs, compressor):
+    """
+    압축 방식별로 같은 문서를 이관과 같은 배치 크기로 삽입하여 전송량과 처리량 측정
+
+    Returns:
+        dict: 측정 결과 (압축 라이브러리가 없으면 skipped 표시)
+    """
+    setting = compressor or 'none'
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        client = MongoClient(mongodb_uri, **({'compressors': compressor} if compressor else {}))
+    if compressor and any('compression' in str(warning.message) for warning in caught):
+        client.close()
+        return {'driver': 'mongodb', 'setting': setting, 'skipped': '압축 라이브러리 미설치'}
+
+    try:
+        mongodb = client[database]
+        collection = mongodb[BENCHMARK_COLLECTION]
+        collection.drop()
+        before = server_network_bytes_in(mongodb)
+        start = time.perf_counter()
+        for offset in range(0, len(docs), BULK_WRITE_BATCH_SIZE):
+            # insert_many가 _id를 채워 넣으므로 측정마다 같은 문서를 복사해서 사용
+            collection.insert_many([dict(doc) for doc in docs[offset:offset + BULK_WRITE_BATCH_SIZE]], ordered=False)
+        seconds = time.perf_counter() - start
+        wire_bytes = server_network_bytes_in(mongodb) - before
+        collection.drop()
+    finally:
+        client.close()
+
+    return {
+        'driver': 'mongodb',
+        'setting': setting,
+        'documents': len(docs),
+        'wire_mb': round(wire_bytes / (1024 * 1024), 3),
+        'seconds': round(seconds, 3),
+        'docs_per_sec': round(len(docs) / seconds, 1) if seconds else None,
+        'wire_mb_per_sec': round(wire_bytes / (1024 * 1024) / seconds, 2) if seconds else None
+    }
+
+def run_benchmark(mysql_config, mongodb_uri, mongodb_database, table='Products', repeat=10):
+    """
+    MySQL 조회(압축 없음/압축)와 MongoDB 삽입(압축 방식별)의 전송량과 처리량 측정
+
+    Args:
+        mysql_config (dict): MySQL 연결 정보
+        mongodb_uri (str): MongoDB 연결 URI
+        mongodb_database (str): 삽입 측정에 사용할 데이터베이스 (BENCHMARK_COLLECTION만 생성 후 삭제)
+        table (str): 조회 및 삽입 데이터로 사용할 MySQL 테이블
+        repeat (int): 조회 반복 횟수 (삽입 문서 수 = 행 수 x repeat)
+
+    Returns:
+        list: 설정별 측정 결과 (none 대비 전송량 비율 wire_ratio 포함)
+    """
+    results = []
+    columns, rows = [], []
+    for compress in (False, True):
+        result, columns, rows = benchmark_mysql_read(mysql_config, table, repeat, compress)
+        results.append(result)
+
+    docs = [to_benchmark_doc(columns, row) for row in rows] * repeat
+    for compressor in MONGODB_COMPRESSORS:
+        results.append(benchmark_mongodb_insert(mongodb_uri, mongodb_database, docs, compressor))
+
+    # 드라이버별 압축 없음 대비 전송량 비율
+    baselines = {result['driver']: result['wire_mb'] for result in results if result['setting'] == 'none'}
+    for result in results:
+        if 'wire_mb' in result and baselines.get(result['driver']):
+            result['wire_ratio'] = round(result['wire_mb'] / baselines[result['driver']], 3)
+    return results
+
+def main():
+    """
+    명령행 실행: python benchmark_connections.py [테이블명] [반복횟수]
+    로컬 MySQL/MongoDB 서버 기준 (MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DATABASE, MONGODB_URI 환경변수로 변경 가능)
+    """
+    mysql_config = {
+        'host': os.environ.get('MYSQL_HOST', 'localhost'),
+        'user': os.environ.get('MYSQL_USER', 'root'),
+        'password': os.environ.get('MYSQL_PASSWORD', ''),
+        'database': os.environ.get('MYSQL_DATABASE', 'shopping_db')
+    }
+    table = sys.argv[1] if len(sys.argv) > 1 else 'Products'
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    results = run_benchmark(mysql_config, os.environ.get('MONGODB_URI', 'mongodb://localhost:27017/'),
+                            os.environ.get('BENCHMARK_DATABASE', 'migration_benchmark'), table, repeat)
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+if __name__ == '__main__':
+    main()
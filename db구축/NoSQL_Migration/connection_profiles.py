@@ -0,0 +1,77 @@
+import copy                         # 기본 프로필을 변경하지 않도록 깊은 복사
+
+# 이관 데이터는 MySQL → Python, Python → MongoDB/DocumentDB로 네트워크를 두 번 지나므로
+# 리전/VPC를 넘는 이관에서는 프로토콜 압축과 연결 풀/타임아웃 설정이 전체 시간에 큰 영향을 줌
+#
+# - mysql: mysql.connector.connect()에 추가로 전달할 인자
+#     compress: MySQL 클라이언트/서버 프로토콜 압축 (zlib, 서버 설정 없이 연결 단위로 협상)
+# - mongodb: MongoClient()에 추가로 전달할 인자
+#     compressors: 선호 순서대로 나열하면 서버와 클라이언트가 모두 지원하는 첫 번째 방식이 선택됨
+#                  (zstd는 zstandard, snappy는 python-snappy 패키지가 필요하며 없으면 드라이버가 경고 후 제외)
+#
+# 소켓 송수신 버퍼(SO_RCVBUF/SO_SNDBUF)는 두 드라이버 모두 연결 옵션으로 노출하지 않으므로
+# Lambda/EC2의 커널 기본값(자동 조정)을 사용하고, 여기서는 드라이버가 제공하는 타임아웃과 풀 크기만 조정
+CONNECTION_PROFILES = {
+    # 기존 동작과 동일 (드라이버 기본값)
+    'default': {
+        'mysql': {},
+        'mongodb': {}
+    },
+    # 같은 VPC 안에서도 전송량이 많은 경우 (압축만 사용)
+    'compressed': {
+        'mysql': {'compress': True},
+        'mongodb': {'compressors': 'zstd,snappy,zlib', 'zlibCompressionLevel': 6}
+    },
+    # 리전/온프레미스 간 이관 (압축 + 긴 왕복 시간을 고려한 타임아웃, 연결 재수립을 줄이는 풀 유지)
+    'cross_network': {
+        'mysql': {'compress': True, 'connection_timeout': 30},
+        'mongodb': {
+            'compressors': 'zstd,snappy,zlib',
+            'zlibCompressionLevel': 6,
+            'connectTimeoutMS': 10000,
+            'socketTimeoutMS': 300000,          # 대용량 삽입 배치가 느린 링크에서 끊기지 않도록 여유
+            'serverSelectionTimeoutMS': 30000,
+            'maxPoolSize': 16,                  # parallel_readers, 재시도 작업자 수보다 충분히 크게
+            'minPoolSize': 4,                   # 배치 사이 유휴 시간에 연결이 닫혀 TLS 핸드셰이크를 반복하지 않도록 유지
+            'maxIdleTimeMS': 300000,
+            'waitQueueTimeoutMS': 60000
+        }
+    }
+}
+
+DEFAULT_CONNECTION_PROFILE = 'default'
+
+def resolve_connection_profile(profile=None):
+    """
+    이벤트의 connection_profile 값을 MySQL/MongoDB 연결 인자로 변환
+
+    Args:
+        profile (str | dict): 프로필 이름 또는 {'base': 프로필 이름, 'mysql': {...}, 'mongodb': {...}}
+            (dict이면 base 프로필에 mysql/mongodb 인자를 덮어씀)
+
+    Returns:
+        dict: {'name': 프로필 이름, 'mysql': 연결 인자, 'mongodb': 클라이언트 인자}
+
+    Example:
+        resolve_connection_profile('cross_network')
+        resolve_connection_profile({'base': 'compressed', 'mongodb': {'compressors': 'zlib'}})
+    """
+    overrides = profile if isinstance(profile, dict) else {}
+    name = overrides.get('base', DEFAULT_CONNECTION_PROFILE) if overrides else (profile or DEFAULT_CONNECTION_PROFILE)
+    if name not in CONNECTION_PROFILES:
+        raise ValueError(f"지원하지 않는 연결 프로필입니다: {name}")
+
+    resolved = copy.deepcopy(CONNECTION_PROFILES[name])
+    for driver in ('mysql', 'mongodb'):
+        resolved[driver].update(overrides.get(driver, {}))
+    resolved['name'] = name
+    return resolved
+
+def describe_connection_profile(resolved):
+    """migration_results에 기록할 연결 프로필 요약"""
+    return {
+        'name': resolved['name'],
+        'mysql_compress': bool(resolved['mysql'].get('compress')),
+        'mongodb_compressors': resolved['mongodb'].get('compressors'),
+        'mongodb_max_pool_size': resolved['mongodb'].get('maxPoolSize')
+    }
@@ -0,0 +1,341 @@
+import heapq                        # 정렬된 런 파일들의 k-way 병합
+import itertools                    # 병합 결과를 키별로 묶기 (groupby)
+import logging                      # 구조화된 로깅 시스템 (CloudWatch 로그 출력용)
+import mmap                         # 런 파일을 메모리 매핑하여 병합 시 복사 없이 읽기
+import os                           # 런 파일 및 임시 디렉터리 정리
+import pickle                       # 행 튜플을 압축된 바이너리 레코드로 직렬화 (Decimal, date 타입 보존)
+import shutil                       # 임시 디렉터리 삭제
+import struct                       # 레코드 길이 헤더 인코딩
+import tempfile                     # 런 파일을 저장할 임시 디렉터리 생성 (Lambda에서는 /tmp)
+
+# 문서 변환 규칙은 동기 이관(index.py)과 동일한 함수를 공유하여 결과 문서를 일치시킴
+from index import (
+    BULK_WRITE_BATCH_SIZE,
+    build_customer_doc,
+    build_cart_history_buckets,
+    build_order_item_doc,
+    build_order_doc,
+    insert_documents
+)
+
+logger = logging.getLogger()
+
+# 메모리에서 정렬한 뒤 런 파일 하나로 내보낼 행 수 (메모리 사용량 상한을 결정)
+DEFAULT_SPILL_RUN_ROWS = 100000
+
+# MySQL 결과를 스트리밍으로 읽을 때 한 번에 가져올 행 수
+STREAM_FETCH_ROWS = 5000
+
+# 런 파일 레코드 헤더: 뒤따르는 pickle 데이터의 바이트 길이 (4바이트 부호 없는 정수)
+RECORD_HEADER = struct.Struct('<I')
+
+def collation_key(value):
+    """
+    MySQL 기본 정렬 규칙(대소문자 무시 _ci)처럼 문자열 키를 비교하기 위한 정규화 값
+
+    Args:
+        value: 그룹 키 (cust_id 같은 문자열 또는 ord_no 같은 숫자)
+
+    Returns:
+        문자열이면 casefold()한 값, 그 외에는 원래 값
+
+    Note:
+        기존 이관의 WHERE cust_id = %s 조회는 대소문자만 다른 Carts 행도 같은 고객으로 찾으므로
+        외부 정렬의 정렬 키와 병합 조인도 같은 기준으로 비교해야 자식 행이 빠지지 않음
+    """
+    return value.casefold() if isinstance(value, str) else value
+
+class ExternalGrouper:
+    """
+    행을 정해진 개수씩 정렬하여 임시 파일(런)로 내보내고, 런들을 k-way 병합하여 키별로 묶어 반환하는 외부 정렬기
+    메모리에는 런 하나 분량의 행만 유지하므로 테이블 크기와 관계없이 메모리 사용량이 일정함
+
+    Args:
+        sort_key (callable): 행의 정렬 키를 반환하는 함수 (첫 번째 요소가 그룹 키, 문자열 키는 collation_key로 정규화)
+        run_rows (int): 런 하나에 담을 행 수
+        spill_dir (str): 런 파일을 만들 상위 디렉터리 (없으면 시스템 임시 디렉터리)
+
+    Note:
+        with 블록을 벗어나면 런 파일과 임시 디렉터리가 삭제됨
+    """
+
+    def __init__(self, sort_key, run_rows=DEFAULT_SPILL_RUN_ROWS, spill_dir=None):
+        self.sort_key = sort_key
+        self.run_rows = run_rows
+        self.spill_dir = spill_dir
+        self.temp_dir = None
+        self.buffer = []
+        self.run_paths = []
+        self.total_rows = 0
+
+    def __enter__(self):
+        self.temp_dir = tempfile.mkdtemp(prefix='migration_spill_', dir=self.spill_dir)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def add(self, row):
+        """행 하나를 추가하고, 버퍼가 run_rows에 도달하면 정렬하여 런 파일로 내보냄"""
+        self.buffer.append(row)
+        self.total_rows += 1
+        if len(self.buffer) >= self.run_rows:
+            self.spill()
+
+    def add_from_cursor(self, mysql_cursor, query):
+        """쿼리 결과를 STREAM_FETCH_ROWS 단위로 스트리밍하며 추가 (결과 전체를 메모리에 올리지 않음)"""
+        mysql_cursor.execute(query)
+        while True:
+            rows = mysql_cursor.fetchmany(STREAM_FETCH_ROWS)
+            if not rows:
+                break
+            for row in rows:
+                self.add(row)
+
+    def spill(self):
+        """버퍼를 정렬하여 길이 헤더 + pickle 레코드 형식의 런 파일로 기록"""
+        if not self.buffer:
+            return
+        self.buffer.sort(key=self.sort_key)
+        run_path = os.path.join(self.temp_dir, f"run_{len(self.run_paths):05d}.bin")
+        with open(run_path, 'wb') as f:
+            for row in self.buffer:
+                data = pickle.dumps(row, protocol=pickle.HIGHEST_PROTOCOL)
+                f.write(RECORD_HEADER.pack(len(data)))
+                f.write(data)
+        self.run_paths.append(run_path)
+        self.buffer = []
+
+    def read_run(self, run_path):
+        """메모리 매핑한 런 파일에서 레코드를 순서대로 읽음"""
+        with open(run_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            offset = 0
+            while offset < len(mm):
+                (length,) = RECORD_HEADER.unpack_from(mm, offset)
+                offset += RECORD_HEADER.size
+                yield pickle.loads(mm[offset:offset + length])
+                offset += length
+
+    def sorted_rows(self):
+        """모든 행을 정렬 키 순으로 반환 (런이 없으면 디스크를 거치지 않고 메모리에서 정렬)"""
+        if not self.run_paths:
+            return iter(sorted(self.buffer, key=self.sort_key))
+        self.spill()
+        return heapq.merge(*(self.read_run(path) for path in self.run_paths), key=self.sort_key)
+
+    def groups(self):
+        """
+        그룹 키별로 묶인 행 목록을 키 순서대로 반환
+
+        Yields:
+            tuple: (그룹 키, 해당 키의 행 목록)
+        """
+        for key, rows in itertools.groupby(self.sorted_rows(), key=lambda row: self.sort_key(row)[0]):
+            yield key, list(rows)
+
+def merge_join(parent_groups, child_groups):
+    """
+    같은 키 순서로 정렬된 부모 그룹과 자식 그룹을 병합 조인 (키는 collation_key 기준으로 비교)
+
+    Args:
+        parent_groups: (키, 부모 행 목록) 이터레이터
+        child_groups: (키, 자식 행 목록) 이터레이터
+
+    Yields:
+        tuple: (부모 행, 자식 행 목록) - 자식이 없는 부모는 빈 목록
+
+    Note:
+        부모가 없는 자식 그룹(고아 행)은 기존 이관과 동일하게 버려짐
+    """
+    child_groups = iter(child_groups)
+    child_key, children = next(child_groups, (None, None))
+    for parent_key, parents in parent_groups:
+        parent_key = collation_key(parent_key)
+        while children is not None and collation_key(child_key) < parent_key:
+            child_key, children = next(child_groups, (None, None))
+        matched = children if children is not None and collation_key(child_key) == parent_key else []
+        for parent in parents:
+            yield parent, matched
+
+class DocumentBatchWriter:
+    """
+    조립된 문서를 배치 단위로 모아 insert_documents 실행 (전체 문서 목록을 메모리에 유지하지 않음)
+
+    Args:
+        collection: 대상 MongoDB 컬렉션
+        batch_sizer (AdaptiveBatchSizer): 지정 시 적응형 삽입 배치 크기 사용
+        encoder (DocumentEncoder): 지정 시 RawBSONDocument로 미리 인코딩하여 삽입
+    """
+
+    def __init__(self, collection, batch_sizer=None, encoder=None):
+        self.collection = collection
+        self.batch_sizer = batch_sizer
+        self.encoder = encoder
+        self.batch = []
+        self.stats = {'inserted': 0, 'retries': 0, 'dead_lettered': 0}
+
+    def add(self, doc):
+        self.batch.append(doc)
+        batch_size = self.batch_sizer.insert.size if self.batch_sizer else BULK_WRITE_BATCH_SIZE
+        if len(self.batch) >= batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.batch:
+            return
+        batch_stats = insert_documents(self.collection, self.batch, self.batch_sizer, self.encoder)
+        for key in self.stats:
+            self.stats[key] += batch_stats[key]
+        self.batch = []
+
+    @property
+    def inserted(self):
+        return self.stats['inserted']
+
+def migrate_customers_collection_external(mysql_cursor, mongodb, archive_ordered_cart=False, run_rows=DEFAULT_SPILL_RUN_ROWS,
+                                          spill_dir=None, batch_sizer=None, encoder=None, password_hasher=None):
+    """
+    Customers와 Carts를 각각 외부 정렬한 뒤 cust_id로 병합 조인하여 Customers 문서 생성
+
+    Args:
+        mysql_cursor: MySQL 커서 객체
+        mongodb: MongoDB 데이터베이스 객체
+        archive_ordered_cart (bool): True이면 주문완료 장바구니 항목을 CartHistory 컬렉션으로 분리
+        run_rows (int): 런 파일 하나에 담을 행 수
+        spill_dir (str): 런 파일을 만들 디렉터리
+        batch_sizer (AdaptiveBatchSizer): 지정 시 적응형 삽입 배치 크기 사용
+        encoder (DocumentEncoder): 지정 시 RawBSONDocument로 미리 인코딩하여 삽입
+        password_hasher (PasswordHashingStage): 지정 시 병합 조인과 병행하여 passwd를 bcrypt로 해싱
+
+    Returns:
+        dict: 이관 결과 정보 (migrate_customers_collection과 같은 형식)
+
+    Note:
+        MySQL 정렬 규칙(collation)과 파이썬 문자열 비교 순서가 다를 수 있으므로
+        ORDER BY에 의존하지 않고 부모/자식 모두 같은 기준(collation_key)으로 로컬에서 정렬
+        - 대소문자만 다른 cust_id의 Carts 행도 기존 이관처럼 해당 고객 문서에 포함됨
+        - casefold()는 대소문자만 맞추므로 악센트 무시(_ai) 등 다른 정렬 규칙 차이는 반영하지 않음
+    """
+    logger.info("Customers 컬렉션 외부 정렬 이관 시작")
+    mongodb.Customers.drop()
+    if archive_ordered_cart:
+        mongodb.CartHistory.drop()
+
+    with ExternalGrouper(lambda row: (collation_key(row[0]),), run_rows, spill_dir) as customers, \
+         ExternalGrouper(lambda row: (collation_key(row[0]), row[1]), run_rows, spill_dir) as carts:
+        customers.add_from_cursor(mysql_cursor, "SELECT * FROM Customers")
+        carts.add_from_cursor(mysql_cursor, """
+            SELECT cust_id, cart_seq_no, prod_cd, prod_size, ord_qty, ord_yn
+            FROM Carts
+        """)
+        logger.info(f"MySQL에서 {customers.total_rows}개 고객, {carts.total_rows}개 장바구니 행 조회 "
+                    f"(런 파일 {len(customers.run_paths) + len(carts.run_paths)}개)")
+
+        customers_writer = DocumentBatchWriter(mongodb.Customers, batch_sizer, encoder)
+        history_writer = DocumentBatchWriter(mongodb.CartHistory)
+        total_cart_items = 0
+        archived_cart_items = 0
+
+        def write_hashed(docs):
+            # 해싱이 끝난 배치를 조회 순서대로 삽입 배치에 추가
+            for doc in docs:
+                customers_writer.add(doc)
+
+        if password_hasher:
+            password_hasher.start(write_hashed)
+
+        for customer, cart_rows in merge_join(customers.groups(), carts.groups()):
+            cart_items = [row[1:] for row in cart_rows]
+            total_cart_items += len(cart_items)
+            customer_doc = build_customer_doc(customer, cart_items)
+
+            if archive_ordered_cart:
+                ordered_items = [item for item in customer_doc['cart'] if item['ord_yn'] == 'Y']
+                customer_doc['cart'] = [item for item in customer_doc['cart'] if item['ord_yn'] != 'Y']
+                for bucket in build_cart_history_buckets(customer[0], ordered_items):
+                    history_writer.add(bucket)
+                archived_cart_items += len(ordered_items)
+
+            if password_hasher:
+                password_hasher.add(customer_doc)
+            else:
+                customers_writer.add(customer_doc)
+
+        if password_hasher:
+            password_hasher.finish()
+        customers_writer.flush()
+        history_writer.flush()
+        mysql_records = customers.total_rows
+
+    logger.info(f"Customers 컬렉션 이관 완료: {customers_writer.inserted}개 문서, {total_cart_items}개 장바구니 항목")
+    result = {
+        'count': customers_writer.inserted,
+        'collection_name': 'Customers',
+        'mysql_records': mysql_records,
+        'mongodb_documents': customers_writer.inserted,
+        'total_cart_items': total_cart_items,
+        'external_grouping': True,
+        'write_stats': customers_writer.stats
+    }
+    if archive_ordered_cart:
+        result['archived_cart_items'] = archived_cart_items
+        result['cart_history_documents'] = history_writer.inserted
+    if password_hasher:
+        result['hashed_passwords'] = password_hasher.hashed
+    return result
+
+def migrate_orders_collection_external(mysql_cursor, mongodb, run_rows=DEFAULT_SPILL_RUN_ROWS, spill_dir=None,
+                                       batch_sizer=None, encoder=None):
+    """
+    Orders와 Ord_items를 각각 외부 정렬한 뒤 ord_no로 병합 조인하여 Orders 문서 생성
+    리뷰 작성 여부는 주문 상품마다 쿼리하지 않고 Ord_items 조회 시 상관 서브쿼리로 함께 가져옴
+
+    Args:
+        mysql_cursor: MySQL 커서 객체
+        mongodb: MongoDB 데이터베이스 객체
+        run_rows (int): 런 파일 하나에 담을 행 수
+        spill_dir (str): 런 파일을 만들 디렉터리
+        batch_sizer (AdaptiveBatchSizer): 지정 시 적응형 삽입 배치 크기 사용
+        encoder (DocumentEncoder): 지정 시 RawBSONDocument로 미리 인코딩하여 삽입
+
+    Returns:
+        dict: 이관 결과 정보 (migrate_orders_collection과 같은 형식)
+    """
+    logger.info("Orders 컬렉션 외부 정렬 이관 시작")
+    mongodb.Orders.drop()
+
+    with ExternalGrouper(lambda row: (row[0],), run_rows, spill_dir) as orders, \
+         ExternalGrouper(lambda row: (row[0], row[1]), run_rows, spill_dir) as order_items:
+        orders.add_from_cursor(mysql_cursor, "SELECT * FROM Orders")
+        # 행 구성: ord_no + build_order_item_doc() 입력 행 + review_count
+        order_items.add_from_cursor(mysql_cursor, """
+            SELECT oi.ord_no, oi.ord_item_no, oi.cart_seq_no, oi.prod_cd, oi.prod_size, oi.ord_qty,
+                   p.prod_name, p.price, p.prod_img,
+                   (SELECT COUNT(*) FROM Prod_evals pe WHERE pe.ord_item_no = oi.ord_item_no) AS review_count
+            FROM Ord_items oi
+            JOIN Products p ON oi.prod_cd = p.prod_cd
+        """)
+        logger.info(f"MySQL에서 {orders.total_rows}개 주문, {order_items.total_rows}개 주문상품 행 조회 "
+                    f"(런 파일 {len(orders.run_paths) + len(order_items.run_paths)}개)")
+
+        orders_writer = DocumentBatchWriter(mongodb.Orders, batch_sizer, encoder)
+        total_order_items = 0
+
+        for order, item_rows in merge_join(orders.groups(), order_items.groups()):
+            items = [build_order_item_doc(row[1:9], row[9]) for row in item_rows]
+            total_order_items += len(items)
+            orders_writer.add(build_order_doc(order, items))
+
+        orders_writer.flush()
+        mysql_records = orders.total_rows
+
+    logger.info(f"Orders 컬렉션 이관 완료: {orders_writer.inserted}개 문서, {total_order_items}개 주문 상품")
+    return {
+        'count': orders_writer.inserted,
+        'collection_name': 'Orders',
+        'mysql_records': mysql_records,
+        'mongodb_documents': orders_writer.inserted,
+        'total_order_items': total_order_items,
+        'external_grouping': True,
+        'write_stats': orders_writer.stats
+    }
@@ -0,0 +1,266 @@
+import os                           # 이미지 디렉터리 탐색 및 환경변수 접근
+import sys                          # 명령행 인자 처리 (이미지 디렉터리 목록)
+import io                           # 썸네일 이미지 메모리 버퍼
+import json                         # 명령행 실행 결과 출력
+import struct                       # PNG/JPEG/GIF 헤더에서 이미지 크기 읽기
+import hashlib                      # 이미지 내용 SHA-256 해시 (중복 제거 및 변경 감지)
+import logging                      # 구조화된 로깅 시스템 (CloudWatch 로그 출력용)
+from datetime import datetime       # 업로드 시점 기록
+from concurrent.futures import ThreadPoolExecutor  # 해시 계산 및 GridFS 업로드 병렬 실행
+from pymongo import MongoClient, UpdateOne  # MongoDB/DocumentDB 연결 및 Products 벌크 갱신
+from gridfs import GridFSBucket     # 이미지 파일을 청크 단위로 저장하는 GridFS 버킷
+
+logger = logging.getLogger()
+
+# 앱별로 같은 이미지를 복사해 둔 public/img 디렉터리 (저장소에서 명령행으로 실행할 때의 기본값)
+# Lambda 배포 패키지에는 앱 디렉터리가 포함되지 않으므로 Lambda에서는 이벤트의 image_dirs나
+# PRODUCT_IMAGE_DIRS 환경변수로 이미지가 있는 경로(EFS 마운트 등)를 반드시 지정해야 함
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_IMAGE_DIRS = [
+    os.path.join(BASE_DIR, '..', app, 'public', 'img')
+    for app in ('myShop', 'myShop_NoSQL', 'myShop_NoSQL_DocDB')
+]
+
+IMAGE_CONTENT_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp'
+}
+
+GRIDFS_BUCKET_NAME = 'product_images'   # product_images.files / product_images.chunks 컬렉션
+GRIDFS_CHUNK_SIZE = 255 * 1024          # GridFS 기본 청크 크기 (문서 하나가 16MB 제한보다 충분히 작도록)
+READ_BLOCK_SIZE = 1024 * 1024           # 해시 계산/업로드 시 파일을 읽는 단위
+THUMBNAIL_SIZE = (200, 200)             # 썸네일 최대 크기 (가로, 세로)
+DEFAULT_IMAGE_WORKERS = 4
+
+def get_image_dirs():
+    """PRODUCT_IMAGE_DIRS 환경변수(os.pathsep 구분) 또는 기본 앱 이미지 디렉터리 목록"""
+    env_dirs = os.environ.get('PRODUCT_IMAGE_DIRS')
+    return env_dirs.split(os.pathsep) if env_dirs else DEFAULT_IMAGE_DIRS
+
+def scan_image_files(image_dirs):
+    """
+    이미지 디렉터리들에서 이미지 파일 경로를 파일명별로 수집
+
+    Returns:
+        dict: {파일명: [경로, ...]} - 여러 앱에 복사된 같은 이름의 파일은 한 목록에 모임
+        
+    Raises:
+        ValueError: 존재하는 디렉터리가 하나도 없거나 이미지 파일이 없는 경우
+            (Lambda에서 경로를 지정하지 않아 아무것도 올리지 않고 성공으로 보고되는 것을 방지)
+    """
+    files = {}
+    missing_dirs = [image_dir for image_dir in image_dirs if not os.path.isdir(image_dir)]
+    if len(missing_dirs) == len(image_dirs):
+        raise ValueError(f"이미지 디렉터리가 없습니다: {missing_dirs} "
+                         f"(Lambda에서는 image_dirs 또는 PRODUCT_IMAGE_DIRS로 이미지 경로를 지정해야 합니다)")
+    for image_dir in image_dirs:
+        if image_dir in missing_dirs:
+            logger.warning(f"이미지 디렉터리 없음: {image_dir}")
+            continue
+        for filename in sorted(os.listdir(image_dir)):
+            if os.path.splitext(filename)[1].lower() in IMAGE_CONTENT_TYPES:
+                files.setdefault(filename, []).append(os.path.join(image_dir, filename))
+    if not files:
+        raise ValueError(f"이미지 디렉터리에 이미지 파일이 없습니다: {image_dirs}")
+    return files
+
+def sha256_file(path):
+    """파일을 READ_BLOCK_SIZE 단위로 읽으며 SHA-256 계산 (파일 전체를 메모리에 올리지 않음)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(READ_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def read_image_size(path):
+    """
+    PNG/GIF/JPEG 헤더에서 이미지 크기 읽기 (이미지 라이브러리 없이 처리)
+
+    Returns:
+        tuple: (가로, 세로) - 지원하지 않는 형식이면 (None, None)
+    """
+    with open(path, 'rb') as f:
+        header = f.read(26)
+        if header.startswith(b'\x89PNG\r\n\x1a\n'):
+            return struct.unpack('>II', header[16:24])
+        if header[:6] in (b'GIF87a', b'GIF89a'):
+            return struct.unpack('<HH', header[6:10])
+        if header.startswith(b'\xff\xd8'):
+            # JPEG: SOFn 마커(FFC0~FFCF, FFC4/FFC8/FFCC 제외)의 세그먼트에 크기가 있음
+            f.seek(2)
+            while True:
+                marker = f.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    break
+                segment_length = struct.unpack('>H', f.read(2))[0]
+                if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+                    height, width = struct.unpack('>xHH', f.read(5))
+                    return width, height
+                f.seek(segment_length - 2, os.SEEK_CUR)
+    return None, None
+
+def make_thumbnail(path):
+    """
+    THUMBNAIL_SIZE 이내의 PNG 썸네일 바이트 생성
+
+    Returns:
+        bytes: 썸네일 PNG (Pillow가 없거나 읽을 수 없는 이미지면 None)
+    """
+    try:
+        from PIL import Image  # 썸네일 생성에만 필요한 선택 의존성이므로 지연 import
+    except ImportError:
+        return None
+    try:
+        with Image.open(path) as image:
+            image.thumbnail(THUMBNAIL_SIZE)
+            buffer = io.BytesIO()
+            image.save(buffer, format='PNG')
+            return buffer.getvalue()
+    except OSError as e:
+        logger.warning(f"썸네일 생성 실패: {path} ({e})")
+        return None
+
+def upload_image(bucket, path, sha256, filenames):
+    """
+    이미지 파일과 썸네일을 GridFS에 스트리밍 업로드
+
+    Args:
+        bucket (GridFSBucket): 대상 GridFS 버킷
+        path (str): 업로드할 원본 파일 경로
+        sha256 (str): 파일 내용 해시
+        filenames (list): 같은 내용을 가진 모든 파일명
+
+    Returns:
+        dict: Products 문서에 기록할 이미지 정보
+    """
+    extension = os.path.splitext(path)[1].lower()
+    width, height = read_image_size(path)
+    metadata = {
+        'sha256': sha256,
+        'filenames': sorted(filenames),
+        'content_type': IMAGE_CONTENT_TYPES[extension],
+        'width': width,
+        'height': height,
+        'uploaded_at': datetime.now()
+    }
+
+    with open(path, 'rb') as f:
+        file_id = bucket.upload_from_stream(os.path.basename(path), f, chunk_size_bytes=GRIDFS_CHUNK_SIZE,
+                                            metadata=metadata)
+
+    thumbnail_id = None
+    thumbnail = make_thumbnail(path)
+    if thumbnail:
+        thumbnail_id = bucket.upload_from_stream(f"thumb_{sha256}.png", io.BytesIO(thumbnail),
+                                                 metadata={'thumbnail_of': sha256, 'content_type': 'image/png'})
+
+    return {
+        'file_id': file_id,
+        'thumbnail_file_id': thumbnail_id,
+        'sha256': sha256,
+        'content_type': metadata['content_type'],
+        'width': width,
+        'height': height
+    }
+
+def stored_image_info(file_doc, mongodb):
+    """이미 업로드된 GridFS 파일 문서를 Products 문서에 기록할 이미지 정보로 변환"""
+    metadata = file_doc['metadata']
+    thumbnail = mongodb[f"{GRIDFS_BUCKET_NAME}.files"].find_one({'metadata.thumbnail_of': metadata['sha256']}, {'_id': 1})
+    return {
+        'file_id': file_doc['_id'],
+        'thumbnail_file_id': thumbnail['_id'] if thumbnail else None,
+        'sha256': metadata['sha256'],
+        'content_type': metadata['content_type'],
+        'width': metadata['width'],
+        'height': metadata['height']
+    }
+
+def migrate_product_images(mongodb, image_dirs=None, workers=DEFAULT_IMAGE_WORKERS):
+    """
+    앱 이미지 디렉터리의 상품 이미지를 GridFS로 이관하고 Products 문서에 이미지 정보 기록
+
+    Args:
+        mongodb: MongoDB 데이터베이스 객체
+        image_dirs (list): 이미지 디렉터리 목록 (없으면 get_image_dirs() - Lambda에서는 지정 필수)
+        workers (int): 해시 계산/업로드 병렬 작업자 수
+
+    Returns:
+        dict: 이관 결과 (스캔/고유/업로드/재사용 파일 수, 업로드 바이트, 갱신 상품 수)
+
+    Process:
+        1. 디렉터리별 이미지 파일 수집 후 SHA-256 병렬 계산
+        2. 내용이 같은 파일(앱마다 복사된 이미지)은 하나로 묶어 한 번만 업로드
+        3. 같은 해시가 이미 GridFS에 있으면 업로드 생략 (재실행 시 변경 없는 파일 건너뜀)
+        4. Products.prod_img 파일명으로 매칭하여 image 필드 갱신
+    """
+    logger.info("상품 이미지 GridFS 이관 시작")
+    files = scan_image_files(image_dirs or get_image_dirs())
+    paths = [path for file_paths in files.values() for path in file_paths]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # hashlib은 큰 블록을 해싱하는 동안 GIL을 해제하므로 스레드로 병렬 계산
+        path_hashes = dict(zip(paths, executor.map(sha256_file, paths)))
+
+        contents = {}  # sha256 -> {'path': 대표 경로, 'filenames': 파일명 집합}
+        for path, sha256 in path_hashes.items():
+            content = contents.setdefault(sha256, {'path': path, 'filenames': set()})
+            content['filenames'].add(os.path.basename(path))
+
+        files_collection = mongodb[f"{GRIDFS_BUCKET_NAME}.files"]
+        files_collection.create_index([('metadata.sha256', 1)])
+        existing = {doc['metadata']['sha256']: doc
+                    for doc in files_collection.find({'metadata.sha256': {'$in': list(contents)}})}
+
+        bucket = GridFSBucket(mongodb, bucket_name=GRIDFS_BUCKET_NAME)
+        uploads = {sha256: executor.submit(upload_image, bucket, content['path'], sha256, content['filenames'])
+                   for sha256, content in contents.items() if sha256 not in existing}
+        image_infos = {sha256: future.result() for sha256, future in uploads.items()}
+
+    for sha256, file_doc in existing.items():
+        # 같은 내용이 새 파일명으로 추가된 경우 파일명 목록만 보강
+        files_collection.update_one({'_id': file_doc['_id']},
+                                    {'$addToSet': {'metadata.filenames': {'$each': sorted(contents[sha256]['filenames'])}}})
+        image_infos[sha256] = stored_image_info(file_doc, mongodb)
+
+    # 파일명 -> 이미지 정보 (같은 파일명이 앱마다 내용이 다르면 처음 발견된 디렉터리 기준)
+    filename_infos = {filename: image_infos[path_hashes[file_paths[0]]] for filename, file_paths in files.items()}
+
+    product_updates = [
+        UpdateOne({'prod_img': filename}, {'$set': {'image': info}})
+        for filename, info in filename_infos.items()
+    ]
+    products_updated = mongodb.Products.bulk_write(product_updates, ordered=False).modified_count if product_updates else 0
+    missing_images = mongodb.Products.count_documents({'prod_img': {'$nin': list(filename_infos)}})
+
+    result = {
+        'files_scanned': len(paths),
+        'unique_images': len(contents),
+        'uploaded': len(uploads),
+        'skipped_existing': len(existing),
+        'bytes_uploaded': sum(os.path.getsize(contents[sha256]['path']) for sha256 in uploads),
+        'products_updated': products_updated,
+        'products_missing_image': missing_images
+    }
+    logger.info(f"상품 이미지 GridFS 이관 완료: {result}")
+    return result
+
+def main():
+    """
+    명령행 실행: python image_migration.py [이미지 디렉터리 ...]
+    MONGODB_URI, MONGODB_DATABASE 환경변수로 대상 데이터베이스 지정
+    """
+    logging.basicConfig(level=logging.INFO)
+    mongo_client = MongoClient(os.environ.get('MONGODB_URI', 'mongodb://localhost:27017/'))
+    try:
+        mongodb = mongo_client[os.environ.get('MONGODB_DATABASE', 'shopping_db')]
+        result = migrate_product_images(mongodb, image_dirs=sys.argv[1:] or None)
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    finally:
+        mongo_client.close()
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,87 @@
 import json                    # JSON 데이터 직렬화/역직렬화 (Lambda 응답 형식 생성용)
+import asyncio                 # 비동기 이관 모드 실행 (asyncio.run)
 import os                      # 운영체제 환경변수 접근 (데이터베이스 연결정보 읽기용)
+import sys                     # 조회 배치 행 객체 크기 추정 (sys.getsizeof)
 import logging                 # 구조화된 로깅 시스템 (CloudWatch 로그 출력용)
+import time                    # 배치 단위 왕복 시간 측정 (적응형 배치 크기 조정용)
+import random                  # 재시도 대기 시간 지터 (동시 재시도 분산용)
+import itertools               # 지연 인코딩된 문서 스트림을 배치로 자르기 (islice)
+from collections import deque  # 인코딩 작업자에 제출한 청크를 제출 순서대로 보관 (제한된 선행 인코딩 창)
+import threading               # 병렬 조회 작업자 간 부하 제어 상태 보호
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor  # 컬렉션별 병렬 조회 작업자 / BSON 인코딩 작업자 실행
 from datetime import datetime, date  # 날짜/시간 처리 (이관 시점 기록 및 MySQL date 타입 변환용)
+from decimal import Decimal, ROUND_HALF_UP  # 평균 평점 반올림 (prodDetail.js의 toFixed(1)과 같은 방식)
 import mysql.connector         # MySQL 데이터베이스 연결 및 쿼리 실행을 위한 공식 드라이버
-from pymongo import MongoClient # MongoDB/DocumentDB 연결 및 문서 조작을 위한 클라이언트
+from pymongo import MongoClient, InsertOne, UpdateOne, ReplaceOne, DeleteMany  # MongoDB/DocumentDB 연결 및 벌크 연산 모델
+from pymongo.errors import BulkWriteError, ConnectionFailure, OperationFailure  # 삽입 실패 유형 판별 (재시도 여부 결정)
+from bson import encode as bson_encode, ObjectId  # 문서 BSON 크기 측정 및 결정적 _id 생성
+from bson.raw_bson import RawBSONDocument  # 미리 인코딩한 BSON 바이트를 재인코딩 없이 전송
+from snapshot_coordinator import open_snapshot_connections, close_snapshot_connections  # 병렬 조회용 동일 시점 스냅샷 연결
+from search_tokens import build_search_tokens  # 한글 상품 검색용 n-gram/초성 토큰 생성
+from connection_profiles import resolve_connection_profile, describe_connection_profile  # 압축/풀 크기 등 연결 설정 프로필
 
 # Lambda 로깅 설정 - CloudWatch에서 모니터링 가능
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# 증분 동기화 시 비교에서 제외할 필드 (이관할 때마다 datetime.now()로 새로 기록되는 값)
+VOLATILE_FIELDS = {'created_at', 'added_date', 'eval_date'}
+
+# 웹 앱이 완료 상태로만 바꾸는 배열 항목 필드와 그 완료 값
+# (cartView.js 주문 시 cart.ord_yn='Y', myPage.js 리뷰 등록 시 items.review_written=true)
+# 증분 동기화는 저장된 값이 완료 값이면 MySQL 값으로 되돌리지 않음
+WEB_COMPLETED_FIELDS = {'ord_yn': 'Y', 'review_written': True}
+
+# bulk_write 한 번에 전송할 최대 문서 수 (DocumentDB 요청 크기 제한 고려)
+BULK_WRITE_BATCH_SIZE = 1000
+
+# CartHistory 버킷 문서 하나에 담을 최대 주문완료 장바구니 항목 수 (문서 크기 상한 유지)
+CART_HISTORY_BUCKET_SIZE = 200
+
+# ProductStats 문서에 미리 담아둘 최신 리뷰 수 (상품 상세 페이지 첫 화면 분량)
+LATEST_REVIEWS_PER_PRODUCT = 5
+
+# PurchaseSummaries 문서에 담을 최근 주문 수와 리뷰 미작성 항목 수 상한 (myPage 첫 화면 분량)
+PURCHASE_SUMMARY_RECENT_ORDERS = 10
+PURCHASE_SUMMARY_PENDING_REVIEWS = 100
+
+# 적응형 배치 크기 조정 설정
+# - 삽입 배치 하나의 BSON 총량 상한 (DocumentDB/MongoDB 메시지 분할 전에 지연시간이 커지지 않도록 제한)
+# - 메모리 예산 중 이 비율은 이미 읽어 둔 행/문서 몫, 나머지는 배치 하나가 일시적으로 쓰는 몫
+#   (배치 하나의 메모리가 나머지 몫을 넘으면 배치 크기를 절반으로 감소, 누적 RSS가 이 비율을 넘으면 경고)
+# - Lambda 메모리 설정을 알 수 없을 때 사용할 기본 메모리 예산
+MAX_INSERT_BATCH_BYTES = 8 * 1024 * 1024
+MEMORY_PRESSURE_RATIO = 0.8
+DEFAULT_MEMORY_BUDGET_MB = 512
+
+# 사전 BSON 인코딩 시 작업자 하나에 넘기는 문서 수 (프로세스 간 전달 오버헤드와 병렬성의 균형)
+# 작성 스레드보다 앞서 인코딩해 둘 청크 수는 작업자 수 x ENCODE_WINDOW_PER_WORKER로 제한
+# (인코딩이 삽입보다 빨라도 dict와 BSON 바이트가 컬렉션 전체만큼 동시에 메모리에 쌓이지 않도록)
+ENCODE_CHUNK_SIZE = 500
+ENCODE_WINDOW_PER_WORKER = 2
+
+# 쓰기 재시도 설정
+# - 일시적 오류(네트워크 단절, DocumentDB 처리량 제한 등)는 지수 백오프로 최대 WRITE_MAX_RETRIES회 재시도
+# - 재시도 후에도 실패하거나 재시도해도 소용없는 오류가 난 문서는 DEAD_LETTER_COLLECTION에 기록하고 계속 진행
+WRITE_MAX_RETRIES = 5
+WRITE_RETRY_BASE_SECONDS = 0.5
+WRITE_RETRY_MAX_SECONDS = 30
+DEAD_LETTER_COLLECTION = 'MigrationDeadLetters'
+RETRYABLE_WRITE_ERROR_CODES = {
+    6, 7, 89, 91, 189, 262, 9001, 10107, 11600, 11602, 13435, 13436,  # 네트워크/선출/종료 관련 오류
+    16500,                                                           # 요청 처리량 초과 (throttling)
+    50                                                               # 실행 시간 초과
+}
+
+# 소스 DB 부하 제어 설정
+# - 복제 지연은 매 쿼리가 아니라 이 간격(초)마다 확인
+# - 임계치 초과 시 대기 시간은 1초부터 2배씩 늘리되 이 값(초)을 넘지 않음
+REPLICA_LAG_CHECK_INTERVAL = 5
+MAX_THROTTLE_BACKOFF_SECONDS = 30
+
+class InvalidOptionError(ValueError):
+    """이벤트 옵션 값이 잘못되었거나 서로 충돌하는 경우 (lambda_handler가 400 응답으로 반환)"""
+
 def lambda_handler(event, context):
     """
     AWS Lambda 메인 핸들러 함수
@@ -18,12 +91,63 @@ def lambda_handler(event, context):
         event (dict): Lambda 이벤트 객체
             - collections (list): 이관할 컬렉션 목록 ['Products', 'Customers', 'Orders', 'Reviews']
             - create_indexes (bool): 인덱스 생성 여부 (기본값: True)
+            - index_plan (list): index_advisor.py가 출력한 권장 인덱스 목록 (지정 시 기본 인덱스 대신 적용)
             - validate (bool): 이관 결과 검증 여부 (기본값: True)
+            - validation_mode (str): 'counts' (건수 비교 + 샘플 문서 확인) 또는 'sample' (층화 표본 키의 문서를
+              MySQL에서 다시 구성하여 필드별 비교, 오류율 신뢰구간 보고 - 데이터 크기와 무관한 고정 비용, 기본값: 'counts')
+            - validation_sample_size (int): sample 모드의 컬렉션별 표본 크기 (기본값: 1000)
+            - validation_strata (int): sample 모드의 키 범위 층 수 (기본값: 10)
+            - validation_confidence (float): sample 모드의 신뢰수준 (기본값: 0.95)
+            - validation_seed (int): sample 모드 난수 seed (지정 시 같은 표본으로 재검증)
+            - mode (str): 'full' (drop 후 전체 삽입) 또는 'incremental' (변경분만 부분 업데이트, 기본값: 'full')
+            - prune_deleted (bool): incremental 모드에서 MySQL에 없는 문서와 cart/items 배열 항목을 삭제 (기본값: False)
+              웹 앱이 MongoDB에 직접 만든 주문/회원/장바구니 항목/리뷰도 MySQL에 없으므로 함께 삭제됨 -
+              웹 쓰기가 MongoDB로 전환되기 전(MySQL이 유일한 원본일 때)에만 사용
+            - archive_ordered_cart (bool): 주문완료 장바구니 항목을 CartHistory 컬렉션으로 분리 (기본값: False)
+            - product_stats (bool): Reviews 이관 시 상품별 평점 요약을 ProductStats 컬렉션에 생성 (기본값: False)
+              실행할 때마다 전체를 다시 만드는 스냅샷이며 웹의 리뷰 등록/수정/삭제로는 갱신되지 않음
+              (full 모드는 MySQL 리뷰, incremental 모드는 웹 리뷰를 포함한 동기화 후 Reviews 컬렉션 기준)
+            - purchase_summaries (bool): Orders 이관 시 고객별 구매 요약을 PurchaseSummaries 컬렉션에 생성 (기본값: False)
+              MySQL 주문 기준 이관 시점 요약이며 웹에서 생긴 주문은 다음 Orders 이관 때까지 반영되지 않음
+            - execution (str): 'sync' (단일 커서 순차 실행) 또는 'async' (aiomysql + motor 동시 실행, 기본값: 'sync')
+            - concurrency (int): async 실행 시 동시에 진행할 쿼리/삽입 배치 수 (기본값: 8)
+            - adaptive_batching (bool): 조회/삽입 배치 크기를 지연시간, 문서 크기, RSS에 맞춰 자동 조정 (기본값: False)
+            - memory_budget_mb (int): 적응형 배치의 메모리 예산 (기본값: Lambda 메모리 설정의 70%)
+              배치 하나의 메모리를 예산의 20% 이내로 제한하며, 컬렉션 전체가 예산을 넘으면 경고만 기록
+              (누적 메모리를 줄이려면 external_grouping 사용)
+            - source (str): 'primary' (MYSQL_HOST) 또는 'replica' (MYSQL_REPLICA_HOST) 에서 조회 (기본값: 'primary')
+            - throttle (dict): 소스 DB 부하 제한 (max_queries_per_sec, max_rows_per_sec,
+              max_replica_lag_seconds, max_query_latency_ms 중 필요한 항목만 지정)
+            - consistent_snapshot (bool): 모든 조회를 하나의 일관된 스냅샷 트랜잭션에서 실행
+              (기본값: throttle 지정 시 True, 그 외 False)
+            - parallel_readers (int): 같은 시점 스냅샷을 보는 MySQL 연결 수만큼 컬렉션을 병렬 이관 (기본값: 1)
+              2 이상이면 consistent_snapshot=False와 함께 지정할 수 없음 (400 응답)
+            - snapshot_strategy (str): 병렬 스냅샷 시점 맞추기 방식 'auto', 'ftwrl', 'gtid' (기본값: 'auto')
+            - external_grouping (bool): Customers/Orders의 부모/자식 행을 임시 파일로 외부 정렬 후 병합하여
+              테이블 크기와 관계없이 일정한 메모리로 문서 조립 (기본값: False, mode='full'에서만 사용 가능)
+            - spill_run_rows (int): 외부 정렬 시 런 파일 하나에 담을 행 수 (기본값: 100000)
+            - pre_encode (bool): 삽입 전에 문서를 RawBSONDocument로 미리 인코딩 (기본값: False)
+            - encode_workers (int): pre_encode 시 BSON 인코딩 프로세스 수 (기본값: 0)
+              2 미만이거나 프로세스 풀을 만들 수 없으면 병렬성이 없으므로 미리 인코딩하지 않고 dict 그대로 삽입
+            - hash_passwords (bool): Customers 이관 시 평문 passwd를 웹과 같은 bcrypt 형식으로 해싱 (기본값: False)
+            - hash_workers (int): 비밀번호 해싱 작업자 수 (기본값: CPU 코어 수)
+            - hash_rounds (int): bcrypt 작업 계수 (기본값: 10, auth.js의 saltRounds와 동일)
+            - migrate_images (bool): 앱 public/img의 상품 이미지를 GridFS로 이관하고 Products.image에 기록 (기본값: False)
+            - image_dirs (list): 이미지 디렉터리 목록 (기본값: PRODUCT_IMAGE_DIRS 환경변수 또는 앱 이미지 디렉터리)
+              Lambda 배포 패키지에는 앱 디렉터리가 없으므로 migrate_images 사용 시 image_dirs나
+              PRODUCT_IMAGE_DIRS(EFS 마운트 경로 등) 지정 필수 - 디렉터리나 이미지가 없으면 오류 반환
+            - image_workers (int): 이미지 해시 계산/업로드 병렬 작업자 수 (기본값: 4)
+            - connection_profile (str | dict): 연결 설정 프로필 ('default', 'compressed', 'cross_network'
+              또는 {'base': 프로필, 'mysql': {...}, 'mongodb': {...}}) - MySQL 프로토콜 압축, MongoDB compressors,
+              타임아웃/연결 풀 크기 (기본값: 'default')
+            - dry_run (bool): 이관하지 않고 테이블 통계와 표본 문서로 컬렉션별 문서 수/BSON 크기/쿼리 수/
+              최대 메모리/실행 시간을 예측하고 권장 옵션(배치 크기, parallel_readers, 호출 분할)만 반환 (기본값: False)
+              parallel_readers/consistent_snapshot을 지정해도 스냅샷 잠금 없이 일반 연결의 읽기 쿼리만 실행
         context: Lambda 런타임 컨텍스트 객체
         
     Returns:
         dict: API Gateway 호환 응답 형식
-            - statusCode: HTTP 상태 코드
+            - statusCode: HTTP 상태 코드 (잘못된 이벤트 옵션은 400, 그 외 오류는 500)
             - body: JSON 문자열 형태의 응답 본문
             
     Environment Variables Required:
@@ -31,8 +155,10 @@ def lambda_handler(event, context):
         - MYSQL_USER: MySQL 사용자명
         - MYSQL_PASSWORD: MySQL 비밀번호
         - MYSQL_DATABASE: MySQL 데이터베이스명 (기본값: shopping_db)
+        - MYSQL_REPLICA_HOST: MySQL 읽기 전용 복제본 엔드포인트 (source='replica'일 때만 필요)
         - MONGODB_URI: MongoDB 연결 URI
         - MONGODB_DATABASE: MongoDB 데이터베이스명 (기본값: shopping_db)
+        - PRODUCT_IMAGE_DIRS: 상품 이미지 디렉터리 목록 (migrate_images 사용 시 image_dirs를 지정하지 않으면 필요)
     """
     try:
         logger.info("=== MySQL to MongoDB 이관 프로세스 시작 ===")
@@ -52,66 +178,203 @@ def lambda_handler(event, context):
         mongodb_uri = os.environ.get('MONGODB_URI')
         mongodb_database = os.environ.get('MONGODB_DATABASE', 'shopping_db')
         
+        # 운영 시간대 이관 시 기존 myShop 서비스 부하를 줄이기 위해 복제본에서 조회 가능
+        source = event.get('source', 'primary')
+        if source not in ('primary', 'replica'):
+            raise InvalidOptionError(f"지원하지 않는 조회 대상입니다: {source}")
+        
         # 필수 환경 변수 검증 - Lambda 배포 시 설정 누락 방지
         required_vars = ['MYSQL_HOST', 'MYSQL_USER', 'MYSQL_PASSWORD', 'MONGODB_URI']
+        if source == 'replica':
+            required_vars.append('MYSQL_REPLICA_HOST')
+            mysql_config['host'] = os.environ.get('MYSQL_REPLICA_HOST')
         missing_vars = [var for var in required_vars if not os.environ.get(var)]
         if missing_vars:
             raise ValueError(f"필수 환경 변수가 누락되었습니다: {missing_vars}")
         
+        # 리전/VPC 간 이관 시 압축 및 타임아웃/풀 설정 적용 (스냅샷 연결도 같은 mysql_config 사용)
+        connection_profile = resolve_connection_profile(event.get('connection_profile'))
+        mysql_config.update(connection_profile['mysql'])
+        logger.info(f"연결 프로필: {describe_connection_profile(connection_profile)}")
+        
         logger.info(f"MySQL 연결 대상: {mysql_config['host']}")
         logger.info(f"MongoDB 연결 대상: {mongodb_uri.split('@')[1] if '@' in mongodb_uri else mongodb_uri}")
         
+        throttle_config = event.get('throttle')
+        collections_to_migrate = event.get('collections', ['Products', 'Customers', 'Orders', 'Reviews'])
+        parallel_readers = min(event.get('parallel_readers', 1), len(collections_to_migrate))
+        # 병렬 조회는 항상 스냅샷 연결을 사용하므로 일관된 스냅샷이 기본 적용됨
+        if parallel_readers > 1 and event.get('consistent_snapshot') is False:
+            # 명시한 설정을 조용히 무시하지 않도록 요청 오류로 반환
+            raise InvalidOptionError("parallel_readers > 1은 항상 일관된 스냅샷을 사용하므로 consistent_snapshot=False와 "
+                                     "함께 지정할 수 없습니다")
+        consistent_snapshot = event.get('consistent_snapshot', bool(throttle_config) or parallel_readers > 1)
+        extraction_governor = ExtractionGovernor(**throttle_config) if throttle_config else None
+        snapshot_info = None
+        
+        # 이벤트에서 이관 옵션 파싱 (기본값 설정)
+        create_indexes_flag = event.get('create_indexes', True)
+        index_plan = event.get('index_plan')
+        validate_flag = event.get('validate', True)
+        migration_mode = event.get('mode', 'full')
+        if migration_mode not in ('full', 'incremental'):
+            raise InvalidOptionError(f"지원하지 않는 이관 모드입니다: {migration_mode}")
+        incremental = migration_mode == 'incremental'
+        prune_deleted = event.get('prune_deleted', False)
+        archive_ordered_cart = event.get('archive_ordered_cart', False)
+        product_stats_flag = event.get('product_stats', False)
+        purchase_summaries_flag = event.get('purchase_summaries', False)
+        adaptive_batching = event.get('adaptive_batching', False)
+        memory_budget_mb = event.get('memory_budget_mb')
+        external_grouping = event.get('external_grouping', False)
+        pre_encode = event.get('pre_encode', False)
+        hash_passwords_flag = event.get('hash_passwords', False)
+        if external_grouping and (incremental or purchase_summaries_flag):
+            # 외부 정렬 경로는 문서를 조립하는 즉시 삽입하므로 전체 문서 목록이 필요한 기능과 함께 사용할 수 없음
+            raise InvalidOptionError("external_grouping은 mode='full'이고 purchase_summaries가 없는 경우에만 지원합니다")
+        execution = event.get('execution', 'sync')
+        if execution not in ('sync', 'async'):
+            raise InvalidOptionError(f"지원하지 않는 실행 방식입니다: {execution}")
+        if execution == 'async' and (incremental or archive_ordered_cart or product_stats_flag or purchase_summaries_flag
+                                     or adaptive_batching or throttle_config or consistent_snapshot or external_grouping
+                                     or pre_encode or hash_passwords_flag):
+            # 비동기 엔진은 기본 전체 이관 경로만 구현 (증분/부가 컬렉션 옵션은 동기 실행에서만 지원)
+            raise InvalidOptionError("async 실행은 mode='full'이고 부가 컬렉션 옵션이 없는 경우에만 지원합니다")
+        if event.get('migrate_images', False):
+            # 컬렉션 이관 후에야 이미지 경로 누락을 알게 되지 않도록 이관 전에 디렉터리/파일 존재 확인
+            from image_migration import get_image_dirs, scan_image_files
+            scan_image_files(event.get('image_dirs') or get_image_dirs())
+        
+        if event.get('dry_run', False):
+            # 쓰기 없이 비용만 예측하고 종료 (표본 문서 생성에 index.py 함수를 사용하므로 지연 import)
+            # 스냅샷 연결(FLUSH TABLES WITH READ LOCK)이나 스냅샷 트랜잭션을 열기 전에 처리하여
+            # 운영 DB에는 일반 연결의 읽기 쿼리만, MongoDB에는 ping만 보냄
+            from migration_planner import plan_migration
+            mysql_conn = mysql.connector.connect(**mysql_config)
+            mysql_conns = [mysql_conn]
+            mysql_cursor = mysql_conn.cursor()
+            if extraction_governor:
+                mysql_cursor = ThrottledCursor(mysql_cursor, extraction_governor)
+            mongo_client = MongoClient(mongodb_uri, **connection_profile['mongodb'])
+            plan = plan_migration(mysql_cursor, mongo_client[mongodb_database], mysql_config['database'],
+                                  collections_to_migrate, options=event,
+                                  time_limit_seconds=context.get_remaining_time_in_millis() / 1000)
+            mysql_cursor.close()
+            close_snapshot_connections(mysql_conns)
+            mongo_client.close()
+            return {
+                'statusCode': 200,
+                'headers': {
+                    'Content-Type': 'application/json',
+                    'Access-Control-Allow-Origin': '*'
+                },
+                'body': json.dumps({
+                    'success': True,
+                    'message': '이관 계획 예측이 완료되었습니다. (데이터는 변경되지 않았습니다)',
+                    'plan': plan,
+                    'request_id': context.aws_request_id,
+                    'timestamp': datetime.now().isoformat()
+                }, ensure_ascii=False, indent=2)
+            }
+        
         # 데이터베이스 연결 수립
         # MySQL 연결 (RDS 또는 온프레미스)
-        mysql_conn = mysql.connector.connect(**mysql_config)
+        if parallel_readers > 1:
+            # 작업자별 연결이 모두 같은 시점을 보도록 스냅샷을 맞춰서 시작 (첫 연결은 검증에도 사용)
+            mysql_conns, snapshot_info = open_snapshot_connections(
+                mysql_config, parallel_readers, strategy=event.get('snapshot_strategy', 'auto'))
+            mysql_conn = mysql_conns[0]
+        else:
+            mysql_conn = mysql.connector.connect(**mysql_config)
+            mysql_conns = [mysql_conn]
+            if consistent_snapshot:
+                # 부하 제한으로 조회가 길어져도 Customers/Carts/Orders/Ord_items를 같은 시점 기준으로 읽도록
+                # 하나의 REPEATABLE READ 스냅샷 트랜잭션 안에서 모든 조회 수행
+                mysql_conn.start_transaction(consistent_snapshot=True, isolation_level='REPEATABLE READ', readonly=True)
+                logger.info("MySQL 일관된 스냅샷 트랜잭션 시작")
         mysql_cursor = mysql_conn.cursor()
+        if extraction_governor:
+            mysql_cursor = ThrottledCursor(mysql_cursor, extraction_governor)
         logger.info("MySQL 연결 성공")
         
         # MongoDB 연결 (DocumentDB, Atlas, 또는 로컬)
-        mongo_client = MongoClient(mongodb_uri)
+        mongo_client = MongoClient(mongodb_uri, **connection_profile['mongodb'])
         mongodb = mongo_client[mongodb_database]
         logger.info("MongoDB 연결 성공")
         
-        # 이벤트에서 이관 옵션 파싱 (기본값 설정)
-        collections_to_migrate = event.get('collections', ['Products', 'Customers', 'Orders', 'Reviews'])
-        create_indexes_flag = event.get('create_indexes', True)
-        validate_flag = event.get('validate', True)
-        
-        logger.info(f"이관 대상 컬렉션: {collections_to_migrate}")
+        logger.info(f"이관 대상 컬렉션: {collections_to_migrate} (모드: {migration_mode}, 실행: {execution})")
         
         migration_results = {}
         total_start_time = datetime.now()
         
-        # 각 컬렉션별 순차 이관 수행
-        # 참조 관계를 고려하여 Products를 먼저 이관
-        for collection in collections_to_migrate:
-            collection_start_time = datetime.now()
-            
-            if collection == 'Products':
-                result = migrate_products_collection(mysql_cursor, mongodb)
-                migration_results['Products'] = result
-                
-            elif collection == 'Customers':
-                result = migrate_customers_collection(mysql_cursor, mongodb)
-                migration_results['Customers'] = result
+        if execution == 'async':
+            # 네트워크 대기 시간을 겹치기 위해 여러 쿼리와 삽입 배치를 동시에 실행
+            # (aiomysql, motor는 async 실행 시에만 필요하므로 지연 import)
+            from async_migration import migrate_collections_async
+            concurrency = event.get('concurrency', 8)
+            migration_results.update(asyncio.run(migrate_collections_async(
+                mysql_config, mongodb_uri, mongodb_database, collections_to_migrate, concurrency=concurrency,
+                mongo_client_options=connection_profile['mongodb'])))
+        else:
+            migration_options = {
+                'incremental': incremental,
+                'prune_deleted': prune_deleted,
+                'archive_ordered_cart': archive_ordered_cart,
+                'product_stats': product_stats_flag,
+                'purchase_summaries': purchase_summaries_flag,
+                'adaptive_batching': adaptive_batching,
+                'memory_budget_mb': memory_budget_mb,
+                'external_grouping': external_grouping,
+                'spill_run_rows': event.get('spill_run_rows'),
+                'encoder': DocumentEncoder(event.get('encode_workers', 0)) if pre_encode else None,
+                'password_hasher': None
+            }
+            if hash_passwords_flag and 'Customers' in collections_to_migrate:
+                # bcrypt는 해싱 옵션을 사용할 때만 필요하므로 지연 import
+                from password_hashing import BCRYPT_ROUNDS, PasswordHashingStage
+                migration_options['password_hasher'] = PasswordHashingStage(
+                    workers=event.get('hash_workers'), rounds=event.get('hash_rounds', BCRYPT_ROUNDS))
+            if parallel_readers > 1:
+                # 스냅샷 연결 하나당 작업자 하나가 컬렉션 단위로 이관 (MongoClient는 스레드 간 공유 가능)
+                worker_cursors = [mysql_cursor] + [
+                    ThrottledCursor(conn.cursor(), extraction_governor) if extraction_governor else conn.cursor()
+                    for conn in mysql_conns[1:]
+                ]
+                collection_groups = [collections_to_migrate[i::parallel_readers] for i in range(parallel_readers)]
                 
-            elif collection == 'Orders':
-                result = migrate_orders_collection(mysql_cursor, mongodb)
-                migration_results['Orders'] = result
+                def run_worker(worker_cursor, collections):
+                    return {collection: run_collection_migration(collection, worker_cursor, mongodb, migration_options)
+                            for collection in collections}
                 
-            elif collection == 'Reviews':
-                result = migrate_reviews_collection(mysql_cursor, mongodb)
-                migration_results['Reviews'] = result
-            
-            # 각 컬렉션별 처리 시간 기록
-            collection_duration = (datetime.now() - collection_start_time).total_seconds()
-            migration_results[collection]['duration_seconds'] = collection_duration
-            logger.info(f"{collection} 컬렉션 이관 소요시간: {collection_duration:.2f}초")
+                with ThreadPoolExecutor(max_workers=parallel_readers) as executor:
+                    futures = [executor.submit(run_worker, worker_cursor, collections)
+                               for worker_cursor, collections in zip(worker_cursors, collection_groups)]
+                    for future in futures:
+                        migration_results.update(future.result())
+                for worker_cursor in worker_cursors[1:]:
+                    worker_cursor.close()
+            else:
+                # 각 컬렉션별 순차 이관 수행
+                # 참조 관계를 고려하여 Products를 먼저 이관
+                for collection in collections_to_migrate:
+                    migration_results[collection] = run_collection_migration(
+                        collection, mysql_cursor, mongodb, migration_options)
+            for stage in ('encoder', 'password_hasher'):
+                if migration_options[stage]:
+                    migration_options[stage].shutdown()
+        
+        # 상품 이미지 GridFS 이관 (옵션) - Products 문서에 image 필드를 기록하므로 Products 이관 후 실행
+        if event.get('migrate_images', False):
+            from image_migration import DEFAULT_IMAGE_WORKERS, migrate_product_images
+            image_start_time = datetime.now()
+            migration_results['product_images'] = migrate_product_images(
+                mongodb, image_dirs=event.get('image_dirs'), workers=event.get('image_workers', DEFAULT_IMAGE_WORKERS))
+            migration_results['product_images']['duration'] = (datetime.now() - image_start_time).total_seconds()
         
         # 성능 최적화를 위한 인덱스 생성 (옵션)
         if create_indexes_flag:
             index_start_time = datetime.now()
-            create_indexes(mongodb)
+            create_indexes(mongodb, index_plan=index_plan)
             index_duration = (datetime.now() - index_start_time).total_seconds()
             migration_results['indexes_created'] = True
             migration_results['index_creation_duration'] = index_duration
@@ -120,7 +383,19 @@ def lambda_handler(event, context):
         # 데이터 정합성 검증 수행 (옵션)
         if validate_flag:
             validation_start_time = datetime.now()
-            validation_results = validate_migration(mysql_cursor, mongodb)
+            if event.get('validation_mode', 'counts') == 'sample':
+                # 전체 비교는 이관만큼 비용이 크므로 표본 크기에 비례하는 비용으로 오류율만 추정
+                from sampling_validator import (DEFAULT_CONFIDENCE, DEFAULT_SAMPLE_SIZE, DEFAULT_STRATA,
+                                                validate_migration_by_sampling)
+                validation_results = validate_migration_by_sampling(
+                    mysql_cursor, mongodb, collections_to_migrate,
+                    sample_size=event.get('validation_sample_size', DEFAULT_SAMPLE_SIZE),
+                    strata=event.get('validation_strata', DEFAULT_STRATA),
+                    confidence=event.get('validation_confidence', DEFAULT_CONFIDENCE),
+                    options={'archive_ordered_cart': archive_ordered_cart, 'hash_passwords': hash_passwords_flag},
+                    seed=event.get('validation_seed'))
+            else:
+                validation_results = validate_migration(mysql_cursor, mongodb)
             validation_duration = (datetime.now() - validation_start_time).total_seconds()
             migration_results['validation'] = validation_results
             migration_results['validation_duration'] = validation_duration
@@ -129,10 +404,17 @@ def lambda_handler(event, context):
         # 전체 처리 시간 계산
         total_duration = (datetime.now() - total_start_time).total_seconds()
         migration_results['total_duration_seconds'] = total_duration
+        migration_results['extraction'] = {
+            'source': source,
+            'consistent_snapshot': consistent_snapshot,
+            'snapshot': snapshot_info,
+            'throttle': extraction_governor.summary() if extraction_governor else None
+        }
+        migration_results['connection_profile'] = describe_connection_profile(connection_profile)
         
         # 데이터베이스 연결 리소스 정리
         mysql_cursor.close()
-        mysql_conn.close()
+        close_snapshot_connections(mysql_conns)  # 스냅샷 트랜잭션 종료 후 연결 닫기
         mongo_client.close()
         logger.info("데이터베이스 연결 정리 완료")
         
@@ -163,16 +445,20 @@ def lambda_handler(event, context):
         try:
             if 'mysql_cursor' in locals():
                 mysql_cursor.close()
-            if 'mysql_conn' in locals():
-                mysql_conn.close()
+            if 'mysql_conns' in locals():
+                close_snapshot_connections(mysql_conns)
             if 'mongo_client' in locals():
                 mongo_client.close()
+            if 'migration_options' in locals():
+                for stage in ('encoder', 'password_hasher'):
+                    if migration_options[stage]:
+                        migration_options[stage].shutdown()
         except:
             pass
         
-        # Lambda 에러 응답 반환
+        # Lambda 에러 응답 반환 (잘못된 이벤트 옵션은 호출자 오류로 구분)
         return {
-            'statusCode': 500,
+            'statusCode': 400 if isinstance(e, InvalidOptionError) else 500,
             'headers': {
                 'Content-Type': 'application/json'
             },
@@ -185,7 +471,74 @@ def lambda_handler(event, context):
             }, ensure_ascii=False, indent=2)
         }
 
-def migrate_products_collection(mysql_cursor, mongodb):
+def run_collection_migration(collection, mysql_cursor, mongodb, options):
+    """
+    컬렉션 하나의 이관 함수를 이벤트 옵션에 맞춰 호출하고 처리 시간을 기록
+    
+    Args:
+        collection (str): 'Products', 'Customers', 'Orders', 'Reviews' 중 하나
+        mysql_cursor: MySQL 커서 객체 (병렬 조회 시 작업자별 스냅샷 연결의 커서)
+        mongodb: MongoDB 데이터베이스 객체
+        options (dict): lambda_handler에서 파싱한 이관 옵션
+        
+    Returns:
+        dict: 컬렉션 이관 결과 (duration_seconds, 적응형 배치 사용 시 batch_sizing 포함)
+    """
+    collection_start_time = datetime.now()
+    
+    # 컬렉션마다 행/문서 크기가 다르므로 배치 크기 조정기를 컬렉션별로 새로 생성
+    batch_sizer = AdaptiveBatchSizer(options['memory_budget_mb']) if options['adaptive_batching'] else None
+    
+    if options['external_grouping'] and collection in ('Customers', 'Orders'):
+        # 부모/자식 테이블을 통째로 외부 정렬하므로 필요할 때만 import
+        from external_grouping import (DEFAULT_SPILL_RUN_ROWS, migrate_customers_collection_external,
+                                       migrate_orders_collection_external)
+        run_rows = options['spill_run_rows'] or DEFAULT_SPILL_RUN_ROWS
+        if collection == 'Customers':
+            result = migrate_customers_collection_external(mysql_cursor, mongodb,
+                                                           archive_ordered_cart=options['archive_ordered_cart'],
+                                                           run_rows=run_rows, batch_sizer=batch_sizer,
+                                                           encoder=options['encoder'],
+                                                           password_hasher=options['password_hasher'])
+        else:
+            result = migrate_orders_collection_external(mysql_cursor, mongodb, run_rows=run_rows,
+                                                        batch_sizer=batch_sizer, encoder=options['encoder'])
+        
+    elif collection == 'Products':
+        result = migrate_products_collection(mysql_cursor, mongodb, incremental=options['incremental'],
+                                             prune_deleted=options['prune_deleted'], batch_sizer=batch_sizer, encoder=options['encoder'])
+        
+    elif collection == 'Customers':
+        result = migrate_customers_collection(mysql_cursor, mongodb, incremental=options['incremental'],
+                                              prune_deleted=options['prune_deleted'],
+                                              archive_ordered_cart=options['archive_ordered_cart'],
+                                              batch_sizer=batch_sizer, encoder=options['encoder'],
+                                              password_hasher=options['password_hasher'])
+        
+    elif collection == 'Orders':
+        result = migrate_orders_collection(mysql_cursor, mongodb, incremental=options['incremental'],
+                                           prune_deleted=options['prune_deleted'],
+                                           build_purchase_summaries=options['purchase_summaries'],
+                                           batch_sizer=batch_sizer, encoder=options['encoder'])
+        
+    elif collection == 'Reviews':
+        result = migrate_reviews_collection(mysql_cursor, mongodb, incremental=options['incremental'],
+                                            prune_deleted=options['prune_deleted'],
+                                            build_product_stats=options['product_stats'],
+                                            batch_sizer=batch_sizer, encoder=options['encoder'])
+    else:
+        raise ValueError(f"지원하지 않는 컬렉션입니다: {collection}")
+    
+    # 각 컬렉션별 처리 시간 및 최종 배치 크기 기록
+    collection_duration = (datetime.now() - collection_start_time).total_seconds()
+    result['duration_seconds'] = collection_duration
+    if batch_sizer:
+        result['batch_sizing'] = batch_sizer.summary()
+    logger.info(f"{collection} 컬렉션 이관 소요시간: {collection_duration:.2f}초")
+    return result
+
+def migrate_products_collection(mysql_cursor, mongodb, incremental=False, prune_deleted=False, batch_sizer=None,
+                                encoder=None):
     """
     MySQL Products 테이블을 MongoDB Products 컬렉션으로 이관
     상품의 기본 정보와 상세 정보(MEDIUMTEXT)를 분리하여 구조화
@@ -193,6 +546,10 @@ def migrate_products_collection(mysql_cursor, mongodb):
     Args:
         mysql_cursor: MySQL 데이터베이스 커서
         mongodb: MongoDB 데이터베이스 객체
+        incremental (bool): True이면 컬렉션을 삭제하지 않고 변경된 필드만 $set으로 반영
+        prune_deleted (bool): incremental 모드에서 MySQL에 없는 상품 문서 삭제
+        batch_sizer (AdaptiveBatchSizer): 지정 시 조회/삽입을 적응형 크기 배치로 나누어 실행
+        encoder (DocumentEncoder): 지정 시 삽입 전에 문서를 RawBSONDocument로 미리 인코딩
         
     Returns:
         dict: 이관 결과 정보 (문서 수, 처리 시간 등)
@@ -203,46 +560,71 @@ def migrate_products_collection(mysql_cursor, mongodb):
     """
     logger.info("Products 컬렉션 이관 시작")
     
-    # 기존 Products 컬렉션 삭제 (Clean Start)
-    mongodb.Products.drop()
-    logger.info("기존 Products 컬렉션 삭제 완료")
+    # 기존 Products 컬렉션 삭제 (Clean Start, 증분 모드에서는 기존 문서 유지)
+    if not incremental:
+        mongodb.Products.drop()
+        logger.info("기존 Products 컬렉션 삭제 완료")
     
     # MySQL Products 테이블에서 모든 상품 데이터 조회
-    mysql_cursor.execute("SELECT * FROM Products")
-    products = mysql_cursor.fetchall()
+    if batch_sizer:
+        products = fetch_rows_adaptively(mysql_cursor, "SELECT * FROM Products", 'prod_cd', batch_sizer)
+    else:
+        mysql_cursor.execute("SELECT * FROM Products")
+        products = mysql_cursor.fetchall()
     logger.info(f"MySQL에서 {len(products)}개 상품 데이터 조회")
     
-    products_docs = []
-    for product in products:
-        # MongoDB 문서 구조로 변환
-        # 메인 화면 성능 최적화를 위해 상품소개를 detail 객체로 분리
-        product_doc = {
-            '_id': product[0],                                    # 상품코드를 _id로 사용
-            'prod_name': product[1],                              # 상품명
-            'price': int(product[2]),                             # 가격 (Decimal을 int로 변환)
-            'prod_type': product[3],                              # 상품유형 (상의, 하의 등)
-            'material': product[4],                               # 소재 (면, 폴리에스터 등)
-            'prod_img': product[5],                               # 상품이미지 파일명
-            'detail': {                                           # 상세정보를 별도 객체로 분리
-                'prod_intro': product[6] if product[6] else ""    # 상품소개 (MEDIUMTEXT, null 처리)
-            }
-        }
-        products_docs.append(product_doc)
+    products_docs = [build_product_doc(product) for product in products]
     
-    # MongoDB에 벌크 삽입 (성능 최적화)
-    if products_docs:
-        result = mongodb.Products.insert_many(products_docs)
-        logger.info(f"MongoDB에 {len(result.inserted_ids)}개 상품 문서 삽입 완료")
+    sync_stats = None
+    if incremental:
+        # 저장된 문서와 비교하여 변경분만 반영 (쓰기 증폭 및 oplog 감소)
+        sync_stats = sync_collection_incrementally(mongodb.Products, products_docs, key_field='_id',
+                                                   prune_deleted=prune_deleted)
+    else:
+        # MongoDB에 배치 단위 벌크 삽입 (실패 배치는 재시도, 반복 실패 문서는 dead-letter 기록)
+        write_stats = insert_documents(mongodb.Products, products_docs, batch_sizer, encoder)
+        logger.info(f"MongoDB에 {write_stats['inserted']}개 상품 문서 삽입 완료")
     
     logger.info(f"Products 컬렉션 이관 완료: {len(products_docs)}개 문서")
-    return {
+    result = {
         'count': len(products_docs),
         'collection_name': 'Products',
         'mysql_records': len(products),
         'mongodb_documents': len(products_docs)
     }
+    if sync_stats:
+        result['incremental_sync'] = sync_stats
+    else:
+        result['write_stats'] = write_stats
+    return result
+
+def build_product_doc(product):
+    """
+    MySQL Products 행을 MongoDB Products 문서로 변환
+    
+    Args:
+        product (tuple): SELECT * FROM Products 결과 행
+        
+    Returns:
+        dict: Products 문서
+    """
+    # 메인 화면 성능 최적화를 위해 상품소개를 detail 객체로 분리
+    return {
+        '_id': product[0],                                    # 상품코드를 _id로 사용
+        'prod_name': product[1],                              # 상품명
+        'price': int(product[2]),                             # 가격 (Decimal을 int로 변환)
+        'prod_type': product[3],                              # 상품유형 (상의, 하의 등)
+        'material': product[4],                               # 소재 (면, 폴리에스터 등)
+        'prod_img': product[5],                               # 상품이미지 파일명
+        'detail': {                                           # 상세정보를 별도 객체로 분리
+            'prod_intro': product[6] if product[6] else ""    # 상품소개 (MEDIUMTEXT, null 처리)
+        },
+        # 한글 부분 문자열/초성 검색용 토큰 (search_tokens.search_products로 인덱스 조회)
+        'search_tokens': build_search_tokens(product[1], product[4], product[3])
+    }
 
-def migrate_customers_collection(mysql_cursor, mongodb):
+def migrate_customers_collection(mysql_cursor, mongodb, incremental=False, prune_deleted=False,
+                                 archive_ordered_cart=False, batch_sizer=None, encoder=None, password_hasher=None):
     """
     MySQL Customers 테이블을 MongoDB Customers 컬렉션으로 이관
     각 고객의 기본 정보와 장바구니 데이터를 통합하여 하나의 문서로 구성
@@ -250,27 +632,52 @@ def migrate_customers_collection(mysql_cursor, mongodb):
     Args:
         mysql_cursor: MySQL 데이터베이스 커서
         mongodb: MongoDB 데이터베이스 객체
+        incremental (bool): True이면 저장된 문서와 비교하여 cart 배열을 $push/$set으로 부분 갱신
+        prune_deleted (bool): incremental 모드에서 MySQL에 없는 고객 문서와 cart 항목도 삭제 ($pull)
+            (기본값 False: auth.js 회원가입 고객과 Main.js가 추가한 cart 항목 보존)
+        archive_ordered_cart (bool): True이면 미주문(ord_yn='N') 항목만 내장하고
+            주문완료 항목은 CartHistory 컬렉션으로 분리
+        batch_sizer (AdaptiveBatchSizer): 지정 시 고객 조회/삽입을 적응형 크기 배치로 나누어 실행
+        encoder (DocumentEncoder): 지정 시 삽입 전에 문서를 RawBSONDocument로 미리 인코딩
+        password_hasher (PasswordHashingStage): 지정 시 고객 조회와 병행하여 passwd를 bcrypt로 해싱
         
     Returns:
         dict: 이관 결과 정보
         
     Data Structure:
         - 고객 기본정보 (이메일, 비밀번호, 이름, 전화번호, 동의사항)
-        - 장바구니 배열 (주문된 항목과 미주문 항목 모두 포함)
+        - 장바구니 배열 (기본: 주문된 항목과 미주문 항목 모두 포함)
+        - archive_ordered_cart 사용 시 CartHistory 버킷 문서
+          (_id: '{cust_id}#{bucket_no}', 버킷당 최대 CART_HISTORY_BUCKET_SIZE개 항목)
     """
     logger.info("Customers 컬렉션 이관 시작")
     
-    # 기존 Customers 컬렉션 삭제 (Clean Start)
-    mongodb.Customers.drop()
-    logger.info("기존 Customers 컬렉션 삭제 완료")
+    # 기존 Customers 컬렉션 삭제 (Clean Start, 증분 모드에서는 기존 문서 유지)
+    if not incremental:
+        mongodb.Customers.drop()
+        if archive_ordered_cart:
+            mongodb.CartHistory.drop()
+        logger.info("기존 Customers 컬렉션 삭제 완료")
     
     # MySQL Customers 테이블에서 모든 고객 데이터 조회
-    mysql_cursor.execute("SELECT * FROM Customers")
-    customers = mysql_cursor.fetchall()
+    if batch_sizer:
+        customers = fetch_rows_adaptively(mysql_cursor, "SELECT * FROM Customers", 'cust_id', batch_sizer)
+    else:
+        mysql_cursor.execute("SELECT * FROM Customers")
+        customers = mysql_cursor.fetchall()
     logger.info(f"MySQL에서 {len(customers)}개 고객 데이터 조회")
     
     customers_docs = []
+    cart_history_docs = []
+    archived_cart_keys = {}  # 고객별로 CartHistory로 옮긴 cart_seq_no (증분 모드에서 Customers.cart에서 제거)
     total_cart_items = 0
+    archived_cart_items = 0
+    
+    if password_hasher:
+        if incremental:
+            password_hasher.load_stored_hashes(mongodb.Customers)
+        # 해싱이 끝난 문서는 조회 순서대로 customers_docs에 추가됨
+        password_hasher.start(customers_docs.extend)
     
     # 각 고객별로 데이터 처리
     for customer in customers:
@@ -287,45 +694,131 @@ def migrate_customers_collection(mysql_cursor, mongodb):
         total_cart_items += len(cart_items)
         
         # MongoDB 문서 구조에 맞게 데이터 변환
-        # NoSQL의 비정규화 특성을 활용하여 관련 데이터를 하나의 문서로 통합
-        customer_doc = {
-            '_id': customer[0],          # 이메일을 MongoDB의 _id로 사용 (중복 방지 및 빠른 조회)
-            'passwd': customer[1],       # 비밀번호 (실제 운영시 해싱 처리 필요)
-            'cust_name': customer[2],    # 고객명
-            'm_phone': customer[3],      # 휴대폰번호
-            'agreements': {              # 동의사항을 중첩 객체로 구조화
-                'terms': customer[4],    # 이용약관 동의 (Y/N)
-                'privacy': customer[5],  # 개인정보활용 동의 (Y/N)
-                'marketing': customer[6] # 마케팅수신 동의 (Y/N)
-            },
-            'created_at': datetime.now(), # 이관 시점을 생성일로 기록
-            # 장바구니 데이터를 배열 형태로 내장 (Embedded Document)
-            'cart': [{
-                'cart_seq_no': item[0],   # 장바구니 순번
-                'prod_cd': item[1],       # 상품코드
-                'prod_size': item[2],     # 상품사이즈
-                'ord_qty': item[3],       # 주문수량
-                'ord_yn': item[4],        # 주문여부 (Y: 주문완료, N: 장바구니 상태)
-                'added_date': datetime.now()  # 장바구니 추가 시점 (이관 시점으로 기록)
-            } for item in cart_items]
-        }
-        customers_docs.append(customer_doc)
+        customer_doc = build_customer_doc(customer, cart_items)
+        
+        if archive_ordered_cart:
+            # 주문완료 항목은 이력 컬렉션으로 분리하여 자주 읽히는 고객 문서를 작게 유지
+            ordered_items = [item for item in customer_doc['cart'] if item['ord_yn'] == 'Y']
+            customer_doc['cart'] = [item for item in customer_doc['cart'] if item['ord_yn'] != 'Y']
+            cart_history_docs.extend(build_cart_history_buckets(customer[0], ordered_items))
+            archived_cart_keys[customer[0]] = [item['cart_seq_no'] for item in ordered_items]
+            archived_cart_items += len(ordered_items)
+        
+        if password_hasher:
+            password_hasher.add(customer_doc)
+        else:
+            customers_docs.append(customer_doc)
+    
+    if password_hasher:
+        password_hasher.finish()
+    
+    sync_stats = None
+    if incremental:
+        # 장바구니 한 줄만 바뀌어도 문서 전체를 다시 쓰지 않도록 cart 배열을 항목 단위로 비교
+        # CartHistory로 옮긴 주문완료 항목은 두 컬렉션에 중복으로 남지 않도록 prune_deleted와 관계없이 $pull
+        sync_stats = sync_collection_incrementally(mongodb.Customers, customers_docs, key_field='_id',
+                                                   array_field='cart', item_key='cart_seq_no',
+                                                   prune_deleted=prune_deleted, removed_items=archived_cart_keys)
+    else:
+        # MongoDB에 배치 단위 벌크 삽입 (실패 배치는 재시도, 반복 실패 문서는 dead-letter 기록)
+        write_stats = insert_documents(mongodb.Customers, customers_docs, batch_sizer, encoder)
+        logger.info(f"MongoDB에 {write_stats['inserted']}개 고객 문서 삽입 완료")
     
-    # MongoDB에 벌크 삽입 (성능 최적화)
-    if customers_docs:
-        result = mongodb.Customers.insert_many(customers_docs)
-        logger.info(f"MongoDB에 {len(result.inserted_ids)}개 고객 문서 삽입 완료")
+    history_sync_stats = None
+    if archive_ordered_cart:
+        if incremental:
+            # 다른 버킷으로 밀린 항목은 원래 버킷에서 $pull, 새 버킷에 $push (버킷 수가 줄면 남는 버킷 삭제)
+            history_sync_stats = sync_collection_incrementally(mongodb.CartHistory, cart_history_docs, key_field='_id',
+                                                               array_field='items', item_key='cart_seq_no',
+                                                               prune_deleted=True)
+        else:
+            insert_documents(mongodb.CartHistory, cart_history_docs)
+        logger.info(f"CartHistory 컬렉션 이관 완료: {len(cart_history_docs)}개 버킷, {archived_cart_items}개 주문완료 항목")
     
     logger.info(f"Customers 컬렉션 이관 완료: {len(customers_docs)}개 문서, {total_cart_items}개 장바구니 항목")
-    return {
+    result = {
         'count': len(customers_docs),
         'collection_name': 'Customers',
         'mysql_records': len(customers),
         'mongodb_documents': len(customers_docs),
         'total_cart_items': total_cart_items
     }
+    if password_hasher:
+        result['hashed_passwords'] = password_hasher.hashed
+    if archive_ordered_cart:
+        result['archived_cart_items'] = archived_cart_items
+        result['cart_history_documents'] = len(cart_history_docs)
+    if sync_stats:
+        result['incremental_sync'] = sync_stats
+    else:
+        result['write_stats'] = write_stats
+    if history_sync_stats:
+        result['cart_history_incremental_sync'] = history_sync_stats
+    return result
+
+def build_customer_doc(customer, cart_items):
+    """
+    MySQL Customers 행과 해당 고객의 Carts 행들을 MongoDB Customers 문서로 변환
+    
+    Args:
+        customer (tuple): SELECT * FROM Customers 결과 행
+        cart_items (list): (cart_seq_no, prod_cd, prod_size, ord_qty, ord_yn) 행 목록
+        
+    Returns:
+        dict: Customers 문서
+    """
+    # NoSQL의 비정규화 특성을 활용하여 관련 데이터를 하나의 문서로 통합
+    return {
+        '_id': customer[0],          # 이메일을 MongoDB의 _id로 사용 (중복 방지 및 빠른 조회)
+        'passwd': customer[1],       # 비밀번호 (hash_passwords 옵션 사용 시 PasswordHashingStage에서 bcrypt로 해싱)
+        'cust_name': customer[2],    # 고객명
+        'm_phone': customer[3],      # 휴대폰번호
+        'agreements': {              # 동의사항을 중첩 객체로 구조화
+            'terms': customer[4],    # 이용약관 동의 (Y/N)
+            'privacy': customer[5],  # 개인정보활용 동의 (Y/N)
+            'marketing': customer[6] # 마케팅수신 동의 (Y/N)
+        },
+        'created_at': datetime.now(), # 이관 시점을 생성일로 기록
+        # 장바구니 데이터를 배열 형태로 내장 (Embedded Document)
+        'cart': [{
+            'cart_seq_no': item[0],   # 장바구니 순번
+            'prod_cd': item[1],       # 상품코드
+            'prod_size': item[2],     # 상품사이즈
+            'ord_qty': item[3],       # 주문수량
+            'ord_yn': item[4],        # 주문여부 (Y: 주문완료, N: 장바구니 상태)
+            'added_date': datetime.now()  # 장바구니 추가 시점 (이관 시점으로 기록)
+        } for item in cart_items]
+    }
+
+def build_cart_history_buckets(cust_id, ordered_items):
+    """
+    주문완료 장바구니 항목을 고객별 고정 크기 버킷 문서로 분할
+    
+    Args:
+        cust_id (str): 고객 ID (이메일)
+        ordered_items (list): cart_seq_no 순으로 정렬된 주문완료 장바구니 항목
+        
+    Returns:
+        list: CartHistory 버킷 문서 목록
+        
+    Note:
+        버킷 번호는 주문완료 항목을 cart_seq_no 순으로 나열한 위치로 정해지므로, 오래된 cart_seq_no가
+        나중에 주문되면 그 뒤의 항목이 모두 다음 버킷으로 밀림 - 증분 동기화는 이런 재배치를 버킷 간
+        $pull/$push로 반영하므로 결과는 정확하지만 밀린 버킷들은 다시 쓰여짐
+    """
+    buckets = []
+    for bucket_no, start in enumerate(range(0, len(ordered_items), CART_HISTORY_BUCKET_SIZE)):
+        items = ordered_items[start:start + CART_HISTORY_BUCKET_SIZE]
+        buckets.append({
+            '_id': f"{cust_id}#{bucket_no}",  # 고객별 버킷 식별자
+            'cust_id': cust_id,               # 고객 ID (고객별 이력 조회용)
+            'bucket_no': bucket_no,           # 버킷 순번 (0부터 오래된 항목 순)
+            'items': items                    # 주문완료 장바구니 항목 (최대 CART_HISTORY_BUCKET_SIZE개)
+        })
+    return buckets
 
-def migrate_orders_collection(mysql_cursor, mongodb):
+def migrate_orders_collection(mysql_cursor, mongodb, incremental=False, prune_deleted=False,
+                              build_purchase_summaries=False, batch_sizer=None, encoder=None):
     """
     MySQL Orders와 Ord_items 테이블을 MongoDB Orders 컬렉션으로 통합 이관
     주문 기본정보와 주문상세를 하나의 문서로 결합하여 조인 비용 제거
@@ -333,6 +826,13 @@ def migrate_orders_collection(mysql_cursor, mongodb):
     Args:
         mysql_cursor: MySQL 데이터베이스 커서
         mongodb: MongoDB 데이터베이스 객체
+        incremental (bool): True이면 ord_no 기준으로 저장된 문서와 비교하여 items 배열을 부분 갱신
+        prune_deleted (bool): incremental 모드에서 MySQL에 없는 주문 문서와 items 항목도 삭제
+            (기본값 False: cartView.js가 MongoDB에 직접 만든 주문 보존)
+        build_purchase_summaries (bool): True이면 같은 패스에서 고객별 구매 요약을 PurchaseSummaries 컬렉션에 생성
+            (MySQL 주문만으로 다시 만들므로 웹에서 생긴 주문은 포함되지 않음)
+        batch_sizer (AdaptiveBatchSizer): 지정 시 주문 조회/삽입을 적응형 크기 배치로 나누어 실행
+        encoder (DocumentEncoder): 지정 시 삽입 전에 문서를 RawBSONDocument로 미리 인코딩
         
     Returns:
         dict: 이관 결과 정보
@@ -344,17 +844,22 @@ def migrate_orders_collection(mysql_cursor, mongodb):
     """
     logger.info("Orders 컬렉션 이관 시작")
     
-    # 기존 Orders 컬렉션 삭제 (Clean Start)
-    mongodb.Orders.drop()
-    logger.info("기존 Orders 컬렉션 삭제 완료")
+    # 기존 Orders 컬렉션 삭제 (Clean Start, 증분 모드에서는 기존 문서 유지)
+    if not incremental:
+        mongodb.Orders.drop()
+        logger.info("기존 Orders 컬렉션 삭제 완료")
     
     # MySQL Orders 테이블에서 모든 주문 데이터 조회
-    mysql_cursor.execute("SELECT * FROM Orders")
-    orders = mysql_cursor.fetchall()
+    if batch_sizer:
+        orders = fetch_rows_adaptively(mysql_cursor, "SELECT * FROM Orders", 'ord_no', batch_sizer)
+    else:
+        mysql_cursor.execute("SELECT * FROM Orders")
+        orders = mysql_cursor.fetchall()
     logger.info(f"MySQL에서 {len(orders)}개 주문 데이터 조회")
     
     orders_docs = []
     total_order_items = 0
+    product_images = {}  # 구매 요약용 상품코드별 이미지 파일명 (Orders 문서에는 저장하지 않음)
     
     for order in orders:
         ord_no = order[0]  # 주문번호 추출
@@ -363,7 +868,7 @@ def migrate_orders_collection(mysql_cursor, mongodb):
         # 성능 최적화를 위해 상품명을 미리 조인하여 가져옴
         order_items_query = f"""
             SELECT oi.ord_item_no, oi.cart_seq_no, oi.prod_cd, oi.prod_size, oi.ord_qty,
-                   p.prod_name, p.price
+                   p.prod_name, p.price, p.prod_img
             FROM Ord_items oi
             JOIN Products p ON oi.prod_cd = p.prod_cd
             WHERE oi.ord_no = {ord_no}
@@ -385,44 +890,192 @@ def migrate_orders_collection(mysql_cursor, mongodb):
             review_count = mysql_cursor.fetchone()[0]
             
             # 주문 상품 문서 구성 (Embedded Document)
-            item_doc = {
-                'ord_item_no': item[0],                    # 주문상품번호
-                'prod_cd': item[2],                        # 상품코드
-                'prod_name': item[5],                      # 상품명 (성능을 위한 의도적 중복 저장)
-                'prod_size': item[3],                      # 상품사이즈
-                'unit_price': int(item[6]),                # 단가
-                'ord_qty': item[4],                        # 주문수량
-                'cart_seq_no': item[1],                    # 원본 장바구니 순번 (추적용)
-                'review_written': review_count > 0         # 리뷰 작성 완료 여부 (UX 개선용)
-            }
-            items_with_review_status.append(item_doc)
+            items_with_review_status.append(build_order_item_doc(item, review_count))
+            product_images[item[2]] = item[7]
         
         # MongoDB 주문 문서 생성 (주문 기본정보 + 주문상세 배열)
-        # MySQL date 타입을 MongoDB datetime 타입으로 안전하게 변환
-        order_doc = {
-            'ord_no': ord_no,                                      # 주문번호
-            'ord_date': datetime.combine(order[1], datetime.min.time()) if isinstance(order[1], date) else order[1],  # MySQL date를 datetime으로 변환
-            'ord_amount': int(order[2]) if order[2] else 0,        # 주문금액
-            'cust_id': order[3],                                   # 주문 고객 ID
-            'items': items_with_review_status                      # 주문상세 배열 (Embedded Array)
-        }
-        orders_docs.append(order_doc)
+        orders_docs.append(build_order_doc(order, items_with_review_status))
     
-    # MongoDB에 벌크 삽입 (성능 최적화)
-    if orders_docs:
-        result = mongodb.Orders.insert_many(orders_docs)
-        logger.info(f"MongoDB에 {len(result.inserted_ids)}개 주문 문서 삽입 완료")
+    sync_stats = None
+    if incremental:
+        # 이전 버전에서 이관된 Orders 문서는 _id가 임의의 ObjectId이므로 ord_no를 비교 키로 사용
+        sync_stats = sync_collection_incrementally(mongodb.Orders, orders_docs, key_field='ord_no',
+                                                   array_field='items', item_key='ord_item_no',
+                                                   prune_deleted=prune_deleted)
+    else:
+        # MongoDB에 배치 단위 벌크 삽입 (실패 배치는 재시도, 반복 실패 문서는 dead-letter 기록)
+        write_stats = insert_documents(mongodb.Orders, orders_docs, batch_sizer, encoder)
+        logger.info(f"MongoDB에 {write_stats['inserted']}개 주문 문서 삽입 완료")
     
     logger.info(f"Orders 컬렉션 이관 완료: {len(orders_docs)}개 문서, {total_order_items}개 주문 상품")
-    return {
+    result = {
         'count': len(orders_docs),
         'collection_name': 'Orders',
         'mysql_records': len(orders),
         'mongodb_documents': len(orders_docs),
         'total_order_items': total_order_items
     }
+    if sync_stats:
+        result['incremental_sync'] = sync_stats
+    else:
+        result['write_stats'] = write_stats
+    
+    if build_purchase_summaries:
+        # 이미 메모리에 있는 주문 문서를 고객별로 한 번에 묶어 요약 생성 (MySQL 추가 조회 없음)
+        orders_by_customer = {}
+        for order_doc in orders_docs:
+            orders_by_customer.setdefault(order_doc['cust_id'], []).append(order_doc)
+        summary_docs = [build_purchase_summary(cust_id, customer_orders, product_images)
+                        for cust_id, customer_orders in orders_by_customer.items()]
+        
+        if incremental:
+            result['purchase_summaries_incremental_sync'] = sync_collection_incrementally(
+                mongodb.PurchaseSummaries, summary_docs, key_field='_id', prune_deleted=True)
+        else:
+            mongodb.PurchaseSummaries.drop()
+            insert_documents(mongodb.PurchaseSummaries, summary_docs)
+        logger.info(f"PurchaseSummaries 컬렉션 생성 완료: {len(summary_docs)}명 고객")
+        result['purchase_summary_documents'] = len(summary_docs)
+    
+    return result
 
-def migrate_reviews_collection(mysql_cursor, mongodb):
+def build_order_item_doc(item, review_count):
+    """
+    MySQL Ord_items + Products 조인 행을 Orders 문서의 items 배열 항목으로 변환
+    
+    Args:
+        item (tuple): (ord_item_no, cart_seq_no, prod_cd, prod_size, ord_qty, prod_name, price, ...) 행
+        review_count (int): 해당 주문 상품의 Prod_evals 행 수
+        
+    Returns:
+        dict: 주문 상품 문서
+    """
+    return {
+        'ord_item_no': item[0],                    # 주문상품번호
+        'prod_cd': item[2],                        # 상품코드
+        'prod_name': item[5],                      # 상품명 (성능을 위한 의도적 중복 저장)
+        'prod_size': item[3],                      # 상품사이즈
+        'unit_price': int(item[6]),                # 단가
+        'ord_qty': item[4],                        # 주문수량
+        'cart_seq_no': item[1],                    # 원본 장바구니 순번 (추적용)
+        'review_written': review_count > 0         # 리뷰 작성 완료 여부 (UX 개선용)
+    }
+
+def build_order_doc(order, items):
+    """
+    MySQL Orders 행과 주문 상품 문서 목록을 MongoDB Orders 문서로 변환
+    
+    Args:
+        order (tuple): SELECT * FROM Orders 결과 행 (ord_no, ord_date, ord_amount, cust_id)
+        items (list): build_order_item_doc()로 만든 주문 상품 문서 목록
+        
+    Returns:
+        dict: Orders 문서
+    """
+    # MySQL date 타입을 MongoDB datetime 타입으로 안전하게 변환
+    return {
+        '_id': deterministic_object_id(order[0]),              # 주문번호 기반 _id (재시도/재실행 시 동일)
+        'ord_no': order[0],                                    # 주문번호
+        'ord_date': datetime.combine(order[1], datetime.min.time()) if isinstance(order[1], date) else order[1],  # MySQL date를 datetime으로 변환
+        'ord_amount': int(order[2]) if order[2] else 0,        # 주문금액
+        'cust_id': order[3],                                   # 주문 고객 ID
+        'items': items                                         # 주문상세 배열 (Embedded Array)
+    }
+
+def build_purchase_summary(cust_id, customer_orders, product_images=None):
+    """
+    한 고객의 주문 문서 목록으로 myPage용 구매 요약 문서 생성
+    
+    Args:
+        cust_id (str): 고객 ID (이메일)
+        customer_orders (list): 해당 고객의 Orders 문서 목록
+        product_images (dict): 상품코드별 이미지 파일명 (없으면 no-image.jpg)
+        
+    Returns:
+        dict: PurchaseSummaries 문서
+        
+    Data Structure:
+        - _id: 고객 ID (myPage에서 _id 단건 조회)
+        - 누적 통계 (주문 수, 주문 상품 수, 총 구매금액, 마지막 주문일)
+        - recent_orders: 최근 주문 PURCHASE_SUMMARY_RECENT_ORDERS개 (주문상세 포함, 최신순)
+        - pending_reviews: review_written이 False인 주문 상품 (최신순, 최대 PURCHASE_SUMMARY_PENDING_REVIEWS개)
+    """
+    product_images = product_images or {}
+    
+    # myPage.js와 동일하게 주문일자, 주문번호 역순 정렬
+    sorted_orders = sorted(customer_orders, key=lambda order: (order['ord_date'], order['ord_no']), reverse=True)
+    
+    recent_orders = []
+    for order in sorted_orders[:PURCHASE_SUMMARY_RECENT_ORDERS]:
+        recent_orders.append({
+            'ord_no': order['ord_no'],
+            'ord_date': order['ord_date'],
+            'ord_amount': order['ord_amount'],
+            'items': [{
+                'ord_item_no': item['ord_item_no'],
+                'prod_cd': item['prod_cd'],
+                'prod_name': item['prod_name'],
+                'prod_img': product_images.get(item['prod_cd'], 'no-image.jpg'),
+                'prod_size': item['prod_size'],
+                'unit_price': item['unit_price'],
+                'ord_qty': item['ord_qty'],
+                'review_written': item['review_written']
+            } for item in order['items']]
+        })
+    
+    pending_reviews = [{
+        'ord_no': order['ord_no'],
+        'ord_date': order['ord_date'],
+        'ord_item_no': item['ord_item_no'],
+        'prod_cd': item['prod_cd'],
+        'prod_name': item['prod_name'],
+        'prod_img': product_images.get(item['prod_cd'], 'no-image.jpg')
+    } for order in sorted_orders for item in order['items'] if not item['review_written']]
+    
+    return {
+        '_id': cust_id,
+        'order_count': len(sorted_orders),
+        'total_items': sum(len(order['items']) for order in sorted_orders),
+        'total_amount': sum(order['ord_amount'] for order in sorted_orders),
+        'last_order_date': sorted_orders[0]['ord_date'] if sorted_orders else None,
+        'recent_orders': recent_orders,
+        'pending_review_count': len(pending_reviews),
+        'pending_reviews': pending_reviews[:PURCHASE_SUMMARY_PENDING_REVIEWS]
+    }
+
+def refresh_purchase_summary(mongodb, cust_id):
+    """
+    주문 생성이나 리뷰 작성/삭제 후 한 고객의 구매 요약을 다시 계산하여 저장
+    
+    Args:
+        mongodb: MongoDB 데이터베이스 객체
+        cust_id (str): 고객 ID (이메일)
+        
+    Returns:
+        dict: 갱신된 PurchaseSummaries 문서 (주문이 없으면 요약 문서를 삭제하고 None 반환)
+        
+    Note:
+        - Orders의 (cust_id, ord_date) 인덱스로 해당 고객 주문만 읽고,
+          상품 이미지는 Products에서 필요한 상품코드만 한 번에 조회
+        - 웹 앱(cartView.js 주문 생성, myPage.js 리뷰 등록/삭제)은 이 함수를 호출하지 않으므로
+          PurchaseSummaries는 purchase_summaries 옵션으로 Orders를 이관할 때만 다시 만들어짐
+          (이관 후 웹에서 생긴 주문과 리뷰 상태 변화는 다음 Orders 이관 전까지 요약에 반영되지 않음)
+    """
+    customer_orders = list(mongodb.Orders.find({'cust_id': cust_id}))
+    if not customer_orders:
+        mongodb.PurchaseSummaries.delete_one({'_id': cust_id})
+        return None
+    
+    prod_cds = list({item['prod_cd'] for order in customer_orders for item in order.get('items', [])})
+    product_images = {product['_id']: product.get('prod_img')
+                      for product in mongodb.Products.find({'_id': {'$in': prod_cds}}, {'prod_img': 1})}
+    
+    summary_doc = build_purchase_summary(cust_id, customer_orders, product_images)
+    mongodb.PurchaseSummaries.replace_one({'_id': cust_id}, summary_doc, upsert=True)
+    return summary_doc
+
+def migrate_reviews_collection(mysql_cursor, mongodb, incremental=False, prune_deleted=False,
+                               build_product_stats=False, batch_sizer=None, encoder=None):
     """
     MySQL Prod_evals 테이블을 MongoDB Reviews 컬렉션으로 이관
     상품평 정보와 관련 참조 데이터를 통합하여 조회 성능 최적화
@@ -430,6 +1083,13 @@ def migrate_reviews_collection(mysql_cursor, mongodb):
     Args:
         mysql_cursor: MySQL 데이터베이스 커서
         mongodb: MongoDB 데이터베이스 객체
+        incremental (bool): True이면 컬렉션을 삭제하지 않고 eval_seq_no 기반 _id로 저장된 문서와 비교하여 변경분만 반영
+        prune_deleted (bool): incremental 모드에서 MySQL에 없는 리뷰 문서 삭제
+            (기본값 False: myPage.js가 MongoDB에 직접 등록한 리뷰 보존)
+        build_product_stats (bool): True이면 상품별 평점 요약으로 ProductStats 컬렉션을 다시 생성
+            (incremental 모드에서는 웹에서 등록한 리뷰도 포함하도록 동기화 후 Reviews 컬렉션 기준)
+        batch_sizer (AdaptiveBatchSizer): 지정 시 리뷰 조회/삽입을 적응형 크기 배치로 나누어 실행
+        encoder (DocumentEncoder): 지정 시 삽입 전에 문서를 RawBSONDocument로 미리 인코딩
         
     Returns:
         dict: 이관 결과 정보
@@ -438,12 +1098,18 @@ def migrate_reviews_collection(mysql_cursor, mongodb):
         - 리뷰 기본정보 (평점, 댓글, 작성일)
         - 관계 정보 (상품코드, 고객ID, 주문번호, 주문상품번호)
         - 고객명 전체 저장 (웹 출력시 마스킹 처리 예정)
+        
+    Note:
+        웹에서 등록한 리뷰는 (cust_id, ord_item_no)로 upsert되어 임의의 ObjectId _id를 가지므로
+        증분 동기화의 비교 대상이 아니며 prune_deleted일 때만 삭제됨 - MySQL에도 있는 리뷰를 웹에서
+        수정한 경우에는 MySQL 값으로 다시 맞춰짐
     """
     logger.info("Reviews 컬렉션 이관 시작")
     
-    # 기존 Reviews 컬렉션 삭제 (Clean Start)
-    mongodb.Reviews.drop()
-    logger.info("기존 Reviews 컬렉션 삭제 완료")
+    # 기존 Reviews 컬렉션 삭제 (Clean Start, 증분 모드에서는 웹에서 등록한 리뷰를 포함한 기존 문서 유지)
+    if not incremental:
+        mongodb.Reviews.drop()
+        logger.info("기존 Reviews 컬렉션 삭제 완료")
     
     # MySQL에서 상품평 데이터와 관련 정보를 조인하여 조회
     # 여러 테이블 조인으로 필요한 모든 정보를 한 번에 가져옴
@@ -455,66 +1121,1017 @@ def migrate_reviews_collection(mysql_cursor, mongodb):
         JOIN Customers c ON pe.cust_id = c.cust_id      -- 고객 이름 조회용 조인
         JOIN Ord_items oi ON pe.ord_item_no = oi.ord_item_no  -- 주문번호 조회용 조인
     """
-    mysql_cursor.execute(reviews_query)
-    reviews = mysql_cursor.fetchall()
+    if batch_sizer:
+        # 키 기준 페이지 조회도 eval_seq_no 순서이므로 작성 순서가 유지됨
+        reviews = fetch_rows_adaptively(mysql_cursor, reviews_query, 'pe.eval_seq_no', batch_sizer)
+    else:
+        # 작성 순서 유지 (최신 리뷰 선별용)
+        mysql_cursor.execute(reviews_query + " ORDER BY pe.eval_seq_no")
+        reviews = mysql_cursor.fetchall()
     logger.info(f"MySQL에서 {len(reviews)}개 리뷰 데이터 조회")
     
-    reviews_docs = []
-    for review in reviews:
-        # MongoDB 리뷰 문서 구성
-        # 조인 결과를 활용하여 참조 정보까지 포함한 완전한 문서 생성
-        review_doc = {
-            'prod_cd': review[4],                               # 상품코드
-            'cust_id': review[3],                               # 고객ID (이메일)
-            'cust_name': review[6],                             # 고객명 전체 저장 (웹에서 마스킹 처리)
-            'ord_no': review[7],                                # 주문번호 (리뷰와 주문 연관관계 유지)
-            'ord_item_no': review[5],                           # 주문상품번호 (세부 추적용)
-            'eval_score': review[1],                            # 평점 (1-5점)
-            'eval_comment': review[2] if review[2] else "",     # 리뷰 내용 (null 처리)
-            'eval_date': datetime.now()                         # 리뷰 작성일 (이관 시점으로 기록)
-        }
-        reviews_docs.append(review_doc)
+    reviews_docs = [build_review_doc(review) for review in reviews]
     
-    # MongoDB에 벌크 삽입 (성능 최적화)
-    if reviews_docs:
-        result = mongodb.Reviews.insert_many(reviews_docs)
-        logger.info(f"MongoDB에 {len(result.inserted_ids)}개 리뷰 문서 삽입 완료")
+    sync_stats = None
+    if incremental:
+        # eval_seq_no 기반 결정적 _id로 저장된 문서와 비교하여 변경분만 반영
+        sync_stats = sync_collection_incrementally(mongodb.Reviews, reviews_docs, key_field='_id',
+                                                   prune_deleted=prune_deleted)
+    else:
+        # MongoDB에 배치 단위 벌크 삽입 (실패 배치는 재시도, 반복 실패 문서는 dead-letter 기록)
+        write_stats = insert_documents(mongodb.Reviews, reviews_docs, batch_sizer, encoder)
+        logger.info(f"MongoDB에 {write_stats['inserted']}개 리뷰 문서 삽입 완료")
     
     logger.info(f"Reviews 컬렉션 이관 완료: {len(reviews_docs)}개 문서")
-    return {
+    result = {
         'count': len(reviews_docs),
         'collection_name': 'Reviews',
         'mysql_records': len(reviews),
         'mongodb_documents': len(reviews_docs)
     }
+    if sync_stats:
+        result['incremental_sync'] = sync_stats
+    else:
+        result['write_stats'] = write_stats
+    
+    if build_product_stats:
+        # full 모드: 이미 메모리에 있는 리뷰 문서로 상품별 요약 생성 (MySQL 추가 조회 없음)
+        # incremental 모드: MySQL에 없는 웹 리뷰도 요약에 포함되도록 동기화된 Reviews 컬렉션을 다시 읽음
+        stats_docs = build_product_stats_docs(load_stored_reviews(mongodb) if incremental else reviews_docs)
+        mongodb.ProductStats.drop()
+        insert_documents(mongodb.ProductStats, stats_docs)
+        logger.info(f"ProductStats 컬렉션 생성 완료: {len(stats_docs)}개 상품")
+        result['product_stats_documents'] = len(stats_docs)
+    
+    return result
+
+def build_review_doc(review):
+    """
+    MySQL Prod_evals + Customers + Ord_items 조인 행을 MongoDB Reviews 문서로 변환
+    
+    Args:
+        review (tuple): (eval_seq_no, eval_score, eval_comment, cust_id, prod_cd, ord_item_no, cust_name, ord_no) 행
+        
+    Returns:
+        dict: Reviews 문서
+    """
+    # 조인 결과를 활용하여 참조 정보까지 포함한 완전한 문서 생성
+    return {
+        '_id': deterministic_object_id(review[0]),          # eval_seq_no 기반 _id (재시도/재실행 시 동일)
+        'prod_cd': review[4],                               # 상품코드
+        'cust_id': review[3],                               # 고객ID (이메일)
+        'cust_name': review[6],                             # 고객명 전체 저장 (웹에서 마스킹 처리)
+        'ord_no': review[7],                                # 주문번호 (리뷰와 주문 연관관계 유지)
+        'ord_item_no': review[5],                           # 주문상품번호 (세부 추적용)
+        'eval_score': review[1],                            # 평점 (1-5점)
+        'eval_comment': review[2] if review[2] else "",     # 리뷰 내용 (null 처리)
+        'eval_date': datetime.now()                         # 리뷰 작성일 (이관 시점으로 기록)
+    }
+
+def mask_customer_name(cust_name):
+    """
+    리뷰 작성자 이름 마스킹 (첫 글자만 노출, prodDetail.js의 $substrCP 규칙과 동일)
+    
+    Args:
+        cust_name (str): 고객명
+        
+    Returns:
+        str: 마스킹된 고객명 (예: 홍길동 -> 홍**)
+    """
+    if not cust_name:
+        return '익명*'
+    return cust_name[0] + '*' * (len(cust_name) - 1)
+
+def build_latest_review_entry(review_doc):
+    """
+    ProductStats.latest_reviews 배열에 담을 리뷰 요약 항목 생성
+    
+    Args:
+        review_doc (dict): Reviews 컬렉션 문서 (_id 포함)
+        
+    Returns:
+        dict: 상품 상세 페이지 출력에 필요한 필드만 담은 항목
+    """
+    return {
+        'eval_seq_no': str(review_doc['_id']),              # prodDetail.js와 동일하게 ObjectId 문자열 사용
+        'ord_item_no': review_doc.get('ord_item_no'),       # 리뷰 수정/삭제 시 항목 식별용
+        'eval_score': review_doc.get('eval_score'),         # 평점
+        'eval_comment': review_doc.get('eval_comment') or "",  # 리뷰 내용
+        'cust_name': mask_customer_name(review_doc.get('cust_name')),  # 마스킹된 작성자명
+        'eval_date': review_doc.get('eval_date')            # 작성일
+    }
+
+def load_stored_reviews(mongodb):
+    """
+    ProductStats 재생성용으로 MongoDB Reviews 문서를 작성 순서대로 조회
+    
+    Args:
+        mongodb: MongoDB 데이터베이스 객체
+        
+    Returns:
+        list: _id 순으로 정렬된 Reviews 문서 목록 (cust_name이 없는 웹 리뷰는 Customers에서 채움)
+        
+    Note:
+        이관 리뷰의 _id는 타임스탬프가 0인 결정적 ObjectId이므로 _id 순서는
+        eval_seq_no 순서 다음에 웹에서 등록한 순서가 됨
+    """
+    reviews_docs = list(mongodb.Reviews.find({}).sort('_id', 1))
+    
+    # myPage.js는 리뷰에 cust_name을 저장하지 않으므로 (prodDetail.js는 조회 시 $lookup) 고객명을 한 번에 조회
+    missing_names = list({review_doc['cust_id'] for review_doc in reviews_docs if not review_doc.get('cust_name')})
+    cust_names = {}
+    for start in range(0, len(missing_names), BULK_WRITE_BATCH_SIZE):
+        chunk = missing_names[start:start + BULK_WRITE_BATCH_SIZE]
+        cust_names.update((customer['_id'], customer.get('cust_name'))
+                          for customer in mongodb.Customers.find({'_id': {'$in': chunk}}, {'cust_name': 1}))
+    for review_doc in reviews_docs:
+        if not review_doc.get('cust_name'):
+            review_doc['cust_name'] = cust_names.get(review_doc.get('cust_id'))
+    return reviews_docs
+
+def round_average_score(score_sum, review_count):
+    """
+    평균 평점을 소수 첫째 자리로 반올림 (prodDetail.js의 toFixed(1)과 동일하게 0.05는 올림)
+    
+    Note:
+        round()는 짝수 쪽으로 반올림하므로 4.25가 4.2가 됨 - Decimal(float)는 부동소수점 값을
+        그대로 옮기므로 ROUND_HALF_UP 결과가 toFixed(1)과 일치
+    """
+    return float(Decimal(score_sum / review_count).quantize(Decimal('0.1'), rounding=ROUND_HALF_UP))
+
+def build_product_stats_docs(reviews_docs):
+    """
+    리뷰 문서 목록에서 상품별 평점 요약 문서를 한 번의 순회로 계산
+    
+    Args:
+        reviews_docs (list): 작성 순서로 정렬된 Reviews 문서 목록
+        
+    Returns:
+        list: ProductStats 문서 목록
+        
+    Note:
+        ProductStats는 이관할 때마다 전체를 다시 만드는 스냅샷이며, 웹 앱의 리뷰 등록/수정/삭제는
+        ProductStats를 갱신하지 않으므로 다음 product_stats 이관 전까지 반영되지 않음
+        
+    Data Structure:
+        - _id: 상품코드 (상품 상세 페이지에서 _id 단건 조회)
+        - review_count, score_sum, avg_score: 리뷰 수, 점수 합계, 평균 평점
+        - score_histogram: 점수별 리뷰 수 ('1' ~ '5')
+        - latest_reviews: 최신 리뷰 LATEST_REVIEWS_PER_PRODUCT개 (최신순)
+    """
+    stats_by_product = {}
+    for review_doc in reviews_docs:
+        stats = stats_by_product.setdefault(review_doc['prod_cd'], {
+            '_id': review_doc['prod_cd'],
+            'review_count': 0,
+            'score_sum': 0,
+            'score_histogram': {str(score): 0 for score in range(1, 6)},
+            'latest_reviews': []
+        })
+        stats['review_count'] += 1
+        stats['score_sum'] += review_doc['eval_score']
+        stats['score_histogram'][str(review_doc['eval_score'])] += 1
+        
+        # 작성 순서대로 순회하므로 앞쪽에 추가하고 최대 개수만 유지
+        stats['latest_reviews'].insert(0, build_latest_review_entry(review_doc))
+        del stats['latest_reviews'][LATEST_REVIEWS_PER_PRODUCT:]
+    
+    for stats in stats_by_product.values():
+        stats['avg_score'] = round_average_score(stats['score_sum'], stats['review_count'])
+        stats['updated_at'] = datetime.now()
+    
+    return list(stats_by_product.values())
 
-def create_indexes(mongodb):
+def fields_differ(new_value, stored_value):
+    """
+    새로 구성한 값과 저장된 값이 다른지 비교 (휘발성 필드 제외)
+    
+    Args:
+        new_value: MySQL에서 새로 구성한 값
+        stored_value: MongoDB에 저장된 값
+        
+    Returns:
+        bool: 실제 데이터가 다르면 True
+        
+    Note:
+        웹 애플리케이션이 문서에 추가한 필드(cart의 ord_no, Orders의 status 등)는
+        새 값에 없는 키이므로 비교하지 않고 보존
+    """
+    if isinstance(new_value, dict) and isinstance(stored_value, dict):
+        return any(fields_differ(value, stored_value.get(field))
+                   for field, value in new_value.items() if field not in VOLATILE_FIELDS)
+    if isinstance(new_value, list) and isinstance(stored_value, list):
+        return len(new_value) != len(stored_value) or any(
+            fields_differ(a, b) for a, b in zip(new_value, stored_value))
+    return new_value != stored_value
+
+def build_incremental_updates(new_doc, stored_doc, key_field, array_field=None, item_key=None, prune_deleted=False,
+                              removed_item_keys=()):
+    """
+    새로 구성한 문서와 저장된 문서를 비교하여 최소한의 업데이트 연산 목록 생성
+    
+    Args:
+        new_doc (dict): MySQL 데이터로 새로 구성한 문서
+        stored_doc (dict): MongoDB에 저장되어 있는 문서
+        key_field (str): 문서 식별 필드 (_id 또는 ord_no)
+        array_field (str): 항목 단위로 비교할 내장 배열 필드 (cart, items)
+        item_key (str): 배열 항목 식별 필드 (cart_seq_no, ord_item_no)
+        prune_deleted (bool): True이면 새 문서에 없는 배열 항목을 $pull
+        removed_item_keys (iterable): prune_deleted와 관계없이 $pull할 배열 항목 키
+            (다른 컬렉션으로 옮겨서 새 문서에서 뺀 항목, 예: CartHistory로 분리한 주문완료 cart 항목)
+        
+    Returns:
+        list: UpdateOne 연산 목록 (변경 사항이 없으면 빈 리스트)
+        
+    Update Strategy:
+        - 최상위 필드 변경: $set
+        - 원본에서 사라진 배열 항목: prune_deleted일 때만 $pull (웹이 $push한 항목도 MySQL에는 없으므로 기본은 보존)
+          - removed_item_keys로 지정한 항목은 항상 $pull
+        - 새로 추가된 배열 항목: $push + $each (같은 경로의 $pull과 충돌하므로 별도 연산)
+        - 값이 바뀐 배열 항목: 위치 연산자($)로 바뀐 하위 필드만 $set
+        - 웹이 완료 처리한 항목 필드(WEB_COMPLETED_FIELDS): 저장된 값이 완료 값('Y', True)이면 MySQL 값이
+          달라도 $set하지 않음 (주문한 장바구니 항목이 다시 보이거나 작성한 리뷰가 미작성으로 돌아가지 않도록)
+          - 완료 값으로 바뀌는 변경(MySQL에서 주문/리뷰 작성)은 그대로 반영
+    """
+    doc_filter = {key_field: new_doc[key_field]}
+    operations = []
+    
+    # 1. 최상위 필드 비교 (휘발성 필드와 배열 필드는 제외)
+    set_fields = {}
+    for field, value in new_doc.items():
+        if field in ('_id', key_field, array_field) or field in VOLATILE_FIELDS:
+            continue
+        if fields_differ(value, stored_doc.get(field)):
+            set_fields[field] = value
+    
+    pull_keys, push_items, changed_items = [], [], []
+    if array_field:
+        # 2. 배열 항목을 식별 키 기준으로 비교
+        stored_items = {item.get(item_key): item for item in stored_doc.get(array_field, [])}
+        new_keys = set()
+        for item in new_doc.get(array_field, []):
+            new_keys.add(item[item_key])
+            stored_item = stored_items.get(item[item_key])
+            if stored_item is None:
+                push_items.append(item)
+            else:
+                changed = {f'{array_field}.$.{field}': value for field, value in item.items()
+                           if field not in VOLATILE_FIELDS
+                           and not (field in WEB_COMPLETED_FIELDS
+                                    and stored_item.get(field) == WEB_COMPLETED_FIELDS[field])
+                           and fields_differ(value, stored_item.get(field))}
+                if changed:
+                    changed_items.append((item[item_key], changed))
+        removed_item_keys = set(removed_item_keys)
+        pull_keys = [key for key in stored_items
+                     if key not in new_keys and (prune_deleted or key in removed_item_keys)]
+    
+    update = {}
+    if set_fields:
+        update['$set'] = set_fields
+    if pull_keys:
+        update['$pull'] = {array_field: {item_key: {'$in': pull_keys}}}
+    if update:
+        operations.append(UpdateOne(doc_filter, update))
+    if push_items:
+        operations.append(UpdateOne(doc_filter, {'$push': {array_field: {'$each': push_items}}}))
+    for item_id, changed in changed_items:
+        operations.append(UpdateOne({**doc_filter, f'{array_field}.{item_key}': item_id}, {'$set': changed}))
+    
+    return operations
+
+def sync_collection_incrementally(collection, docs, key_field='_id', array_field=None, item_key=None,
+                                  prune_deleted=False, removed_items=None):
+    """
+    drop 후 재삽입 대신 저장된 문서와 비교하여 변경분만 bulk_write로 반영
+    
+    Args:
+        collection: 대상 MongoDB 컬렉션
+        docs (list): MySQL 데이터로 새로 구성한 문서 목록
+        key_field (str): 문서 식별 필드
+        array_field (str): 항목 단위로 비교할 내장 배열 필드 (없으면 None)
+        item_key (str): 배열 항목 식별 필드
+        prune_deleted (bool): True이면 docs에 없는 저장 문서와 배열 항목을 삭제
+        removed_items (dict): 문서 키별로 prune_deleted와 관계없이 배열에서 제거할 항목 키 목록
+        
+    Returns:
+        dict: 동기화 통계 (삽입/수정/변경없음/삭제 문서 수, 전송한 쓰기 연산 수)
+        
+    Note:
+        웹 앱은 MongoDB에 직접 주문(cartView.js), 회원(auth.js), 장바구니 항목(Main.js), 리뷰(myPage.js)를 추가하므로
+        MySQL에 없다는 이유만으로는 이관 문서인지 구분할 수 없음 - 삭제는 prune_deleted로 명시한 경우만 수행
+        (CartHistory, PurchaseSummaries처럼 이관만 쓰는 파생 컬렉션은 항상 prune_deleted=True)
+    """
+    stats = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'deleted': 0, 'write_ops': 0}
+    
+    for start in range(0, len(docs), BULK_WRITE_BATCH_SIZE):
+        batch = docs[start:start + BULK_WRITE_BATCH_SIZE]
+        
+        # 배치 단위로 저장된 문서를 한 번에 조회 (문서별 find_one 왕복 방지)
+        keys = [doc[key_field] for doc in batch]
+        stored_docs = {doc[key_field]: doc for doc in collection.find({key_field: {'$in': keys}})}
+        
+        operations = []
+        for doc in batch:
+            stored_doc = stored_docs.get(doc[key_field])
+            if stored_doc is None:
+                operations.append(InsertOne(doc))
+                stats['inserted'] += 1
+                continue
+            
+            doc_operations = build_incremental_updates(doc, stored_doc, key_field, array_field, item_key, prune_deleted,
+                                                       (removed_items or {}).get(doc[key_field], ()))
+            if doc_operations:
+                operations.extend(doc_operations)
+                stats['updated'] += 1
+            else:
+                stats['unchanged'] += 1
+        
+        # 같은 문서에 대한 $pull -> $push 순서를 보장하기 위해 ordered 실행
+        if operations:
+            collection.bulk_write(operations, ordered=True)
+            stats['write_ops'] += len(operations)
+    
+    if not prune_deleted:
+        logger.info(f"{collection.name} 증분 동기화: 삽입 {stats['inserted']}, 수정 {stats['updated']}, "
+                    f"변경없음 {stats['unchanged']}, 쓰기 연산 {stats['write_ops']} (삭제 생략)")
+        return stats
+    
+    # MySQL에서 삭제된 행에 해당하는 문서 정리 (식별 필드만 프로젝션하여 조회)
+    source_keys = {doc[key_field] for doc in docs}
+    projection = {key_field: 1} if key_field == '_id' else {key_field: 1, '_id': 0}
+    stale_keys = [doc[key_field] for doc in collection.find({}, projection)
+                  if doc.get(key_field) not in source_keys]
+    for start in range(0, len(stale_keys), BULK_WRITE_BATCH_SIZE):
+        chunk = stale_keys[start:start + BULK_WRITE_BATCH_SIZE]
+        collection.bulk_write([DeleteMany({key_field: {'$in': chunk}})])
+        stats['deleted'] += len(chunk)
+        stats['write_ops'] += 1
+    
+    logger.info(f"{collection.name} 증분 동기화: 삽입 {stats['inserted']}, 수정 {stats['updated']}, "
+                f"변경없음 {stats['unchanged']}, 삭제 {stats['deleted']}, 쓰기 연산 {stats['write_ops']}")
+    return stats
+
+def current_rss_mb():
+    """
+    현재 프로세스의 상주 메모리(RSS)를 MB 단위로 반환
+    
+    Returns:
+        float: 현재 RSS (MB)
+        
+    Note:
+        Linux(Lambda)에서는 /proc/self/statm의 현재 값을 사용하고,
+        그 외 환경에서는 resource 모듈의 최대 RSS로 대체
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        import resource  # Windows에는 없는 모듈이므로 필요할 때만 import
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def estimate_rows_mb(rows):
+    """
+    조회한 행 배치가 차지하는 메모리를 앞쪽 일부 행의 객체 크기로 추정 (MB)
+    
+    Note:
+        RSS 차이는 병렬 조회 작업자의 할당이 섞이고 해제된 메모리를 재사용하면 0이 되므로
+        배치 자체의 튜플/값 객체 크기로 추정
+    """
+    sample = rows[:5]
+    if not sample:
+        return 0
+    sample_bytes = sum(sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row) for row in sample) / len(sample)
+    return len(rows) * sample_bytes / (1024 * 1024)
+
+class BatchSizeController:
+    """
+    측정된 배치 처리량(행/초)에 따라 배치 크기를 조정하는 피드백 제어기
+    
+    Control Strategy:
+        - 처리량이 유지되거나 늘면 확대 (초기에는 2배씩, 한 번 감소한 뒤에는 25%씩)
+        - 처리량이 5% 이상 떨어지면 25% 축소
+        - 배치 하나의 메모리가 배치용 여유 메모리를 넘으면 절반으로 축소
+        - 바이트 상한이 주어지면 그 이하로 제한
+    """
+    
+    def __init__(self, name, initial_size, min_size, max_size):
+        self.name = name
+        self.size = initial_size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.slow_start = True        # 처리량이 처음 떨어지기 전까지 2배씩 확대
+        self.last_throughput = None
+        self.batches = 0
+        self.history = []             # 최근 배치별 측정값 (결과 리포트용)
+    
+    def observe(self, rows, seconds, memory_pressure=False, size_cap=None):
+        """
+        배치 하나의 처리 결과를 반영하여 다음 배치 크기 결정
+        
+        Args:
+            rows (int): 처리한 행/문서 수
+            seconds (float): 배치 왕복 시간 (초)
+            memory_pressure (bool): 이 배치 자체의 메모리가 배치용 여유 메모리를 넘었는지 여부
+            size_cap (int): 문서 크기 기준 최대 배치 크기 (없으면 None)
+            
+        Returns:
+            int: 다음 배치 크기
+        """
+        throughput = rows / max(seconds, 1e-6)
+        
+        if memory_pressure:
+            self.size //= 2
+            self.slow_start = False
+        elif self.last_throughput is None or throughput >= self.last_throughput * 0.95:
+            self.size = self.size * 2 if self.slow_start else self.size + max(1, self.size // 4)
+        else:
+            self.size = int(self.size * 0.75)
+            self.slow_start = False
+        
+        if size_cap:
+            self.size = min(self.size, size_cap)
+        self.size = max(self.min_size, min(self.max_size, self.size))
+        
+        self.last_throughput = throughput
+        self.batches += 1
+        self.history.append({'rows': rows, 'seconds': round(seconds, 4),
+                             'rows_per_sec': round(throughput, 1), 'next_size': self.size})
+        del self.history[:-20]  # 결과 dict가 커지지 않도록 최근 20개만 유지
+        return self.size
+    
+    def summary(self):
+        """현재 배치 크기와 최근 측정 이력을 migration_results 기록용 dict로 반환"""
+        return {'final_size': self.size, 'batches': self.batches, 'recent': self.history}
+
+class AdaptiveBatchSizer:
+    """
+    컬렉션 하나의 MySQL 조회 배치와 MongoDB 삽입 배치 크기를 함께 관리
+    
+    Args:
+        memory_budget_mb (int): 메모리 예산 (없으면 Lambda 메모리 설정의 70%, 알 수 없으면 DEFAULT_MEMORY_BUDGET_MB)
+        
+    Note:
+        배치 크기는 배치 하나가 쓰는 메모리만 줄일 수 있고 이미 읽어 둔 행/문서는 줄이지 못하므로,
+        누적 RSS가 아니라 배치마다 측정한 메모리로 압박 여부를 판단함
+        (누적 RSS가 예산을 넘으면 배치를 계속 줄여도 효과가 없으므로 경고만 기록)
+    """
+    
+    def __init__(self, memory_budget_mb=None):
+        if memory_budget_mb is None:
+            lambda_memory = os.environ.get('AWS_LAMBDA_FUNCTION_MEMORY_SIZE')
+            memory_budget_mb = int(int(lambda_memory) * 0.7) if lambda_memory else DEFAULT_MEMORY_BUDGET_MB
+        self.memory_budget_mb = memory_budget_mb
+        self.peak_rss_mb = current_rss_mb()
+        self.over_budget = False
+        self.avg_doc_bytes = None
+        self.fetch = BatchSizeController('fetch', initial_size=500, min_size=50, max_size=20000)
+        self.insert = BatchSizeController('insert', initial_size=500, min_size=50, max_size=10000)
+    
+    def memory_pressure(self, batch_mb):
+        """
+        배치 하나의 메모리가 예산 중 배치용 몫(1 - MEMORY_PRESSURE_RATIO)을 넘었는지 확인
+        
+        Args:
+            batch_mb (float): 이번 배치가 사용한 메모리 추정값 (MB)
+        """
+        rss = current_rss_mb()
+        self.peak_rss_mb = max(self.peak_rss_mb, rss)
+        if rss > self.memory_budget_mb * MEMORY_PRESSURE_RATIO and not self.over_budget:
+            self.over_budget = True
+            logger.warning(f"누적 메모리 {rss:.0f}MB가 예산 {self.memory_budget_mb}MB의 "
+                           f"{MEMORY_PRESSURE_RATIO:.0%}를 넘음 (배치 크기로는 줄일 수 없으므로 external_grouping 권장)")
+        return batch_mb > self.memory_budget_mb * (1 - MEMORY_PRESSURE_RATIO)
+    
+    def observe_fetch(self, rows, seconds):
+        """MySQL 조회 배치 결과 반영 (조회한 행 객체 크기로 배치 메모리 추정)"""
+        return self.fetch.observe(len(rows), seconds, memory_pressure=self.memory_pressure(estimate_rows_mb(rows)))
+    
+    def observe_insert(self, docs, seconds):
+        """
+        MongoDB 삽입 배치 결과 반영
+        배치 앞쪽 일부 문서의 BSON 크기로 평균 문서 크기를 추정하여 배치 바이트 상한 계산
+        """
+        sample = docs[:5]
+        if sample:
+            sample_bytes = sum(len(doc.raw) if isinstance(doc, RawBSONDocument) else len(bson_encode(doc))
+                               for doc in sample) / len(sample)
+            self.avg_doc_bytes = sample_bytes if self.avg_doc_bytes is None else (self.avg_doc_bytes + sample_bytes) / 2
+        size_cap = int(MAX_INSERT_BATCH_BYTES // self.avg_doc_bytes) if self.avg_doc_bytes else None
+        # 삽입 배치의 일시적 메모리는 드라이버가 만드는 BSON 메시지 크기
+        batch_mb = len(docs) * (self.avg_doc_bytes or 0) / (1024 * 1024)
+        return self.insert.observe(len(docs), seconds, memory_pressure=self.memory_pressure(batch_mb),
+                                   size_cap=size_cap)
+    
+    def summary(self):
+        """migration_results에 기록할 배치 크기 조정 결과"""
+        return {
+            'memory_budget_mb': self.memory_budget_mb,
+            'peak_rss_mb': round(self.peak_rss_mb, 1),
+            'over_budget': self.over_budget,
+            'avg_doc_bytes': int(self.avg_doc_bytes) if self.avg_doc_bytes else None,
+            'fetch': self.fetch.summary(),
+            'insert': self.insert.summary()
+        }
+
+def fetch_rows_adaptively(mysql_cursor, select_query, key_column, batch_sizer):
+    """
+    키 기준 페이지 조회(keyset pagination)로 테이블을 적응형 크기 배치로 나누어 조회
+    
+    Args:
+        mysql_cursor: MySQL 커서 객체
+        select_query (str): WHERE/ORDER BY가 없는 SELECT 문 (첫 번째 컬럼이 key_column이어야 함)
+        key_column (str): 정렬 및 페이지 기준 컬럼 (기본키)
+        batch_sizer (AdaptiveBatchSizer): 배치 크기 조정기
+        
+    Returns:
+        list: 전체 조회 결과 (key_column 순)
+        
+    Note:
+        - 각 페이지를 fetchall로 모두 읽은 뒤 반환하므로, 같은 커서로 자식 테이블을 조회하는
+          Customers/Orders 이관에서도 읽지 않은 결과(Unread result) 오류가 발생하지 않음
+        - 전체 행을 모아 반환하므로 배치 크기는 페이지 하나의 메모리만 제한함
+          (테이블 전체가 메모리 예산을 넘는 경우는 external_grouping 경로가 담당)
+    """
+    rows = []
+    last_key = None
+    while True:
+        batch_size = batch_sizer.fetch.size
+        if last_key is None:
+            query, params = f"{select_query} ORDER BY {key_column} LIMIT %s", (batch_size,)
+        else:
+            query, params = f"{select_query} WHERE {key_column} > %s ORDER BY {key_column} LIMIT %s", (last_key, batch_size)
+        
+        start = time.perf_counter()
+        mysql_cursor.execute(query, params)
+        batch = mysql_cursor.fetchall()
+        batch_sizer.observe_fetch(batch, time.perf_counter() - start)
+        
+        rows.extend(batch)
+        if len(batch) < batch_size:
+            return rows
+        last_key = batch[-1][0]
+
+def deterministic_object_id(seq_no):
+    """
+    MySQL 정수 키로 항상 같은 ObjectId 생성 (재시도/재실행해도 같은 _id로 덮어쓰도록)
+    
+    Args:
+        seq_no (int): ord_no, eval_seq_no 등 MySQL 정수 기본키
+        
+    Returns:
+        ObjectId: 키를 24자리 16진수로 채운 ObjectId
+        
+    Note:
+        웹(myPage.js)이 new ObjectId(eval_seq_no)로 리뷰를 조회하므로 _id 타입은 ObjectId로 유지
+        타임스탬프 부분이 0이 되어 웹에서 새로 생성한 문서보다 항상 앞에 정렬됨
+    """
+    return ObjectId(f"{seq_no:024x}")
+
+def is_retryable_write_error(error):
+    """네트워크 단절, 선출, 처리량 제한처럼 재시도하면 성공할 수 있는 오류인지 판별"""
+    if isinstance(error, ConnectionFailure):  # AutoReconnect, NetworkTimeout 포함
+        return True
+    if isinstance(error, OperationFailure) and error.code in RETRYABLE_WRITE_ERROR_CODES:
+        return True
+    return hasattr(error, 'has_error_label') and error.has_error_label('RetryableWriteError')
+
+def split_bulk_write_errors(pending, error, attempt):
+    """
+    BulkWriteError의 문서별 오류를 재시도할 문서와 dead-letter로 보낼 실패 목록으로 분리
+    
+    Args:
+        pending (list): 방금 전송한 문서 목록 (writeErrors의 index 기준)
+        error (BulkWriteError): 삽입 오류
+        attempt (int): 지금까지의 재시도 횟수
+        
+    Returns:
+        tuple: (재시도할 문서 목록, (문서, 오류 메시지, 오류 코드, 시도 횟수) 실패 목록)
+    """
+    retry_docs, failures = [], []
+    for write_error in error.details.get('writeErrors', []):
+        doc = pending[write_error['index']]
+        if write_error.get('code') in RETRYABLE_WRITE_ERROR_CODES and attempt < WRITE_MAX_RETRIES:
+            retry_docs.append(doc)
+        else:
+            failures.append((doc, write_error.get('errmsg'), write_error.get('code'), attempt + 1))
+    return retry_docs, failures
+
+def write_retry_delay(attempt):
+    """재시도 대기 시간 (지수 백오프 + 동시 재시도 분산용 지터)"""
+    return min(WRITE_RETRY_BASE_SECONDS * (2 ** attempt), WRITE_RETRY_MAX_SECONDS) * random.uniform(0.5, 1.0)
+
+def build_dead_letters(collection_name, failures):
+    """
+    반복 실패한 문서를 DEAD_LETTER_COLLECTION에 기록할 문서로 변환 (동기/비동기 엔진 공용)
+    
+    Args:
+        collection_name (str): 원래 삽입 대상 컬렉션명
+        failures (list): (문서, 오류 메시지, 오류 코드, 시도 횟수) 목록
+        
+    Returns:
+        list: dead-letter 문서 목록
+    """
+    dead_letters = []
+    for doc, message, code, attempts in failures:
+        dead_letter = {
+            'collection': collection_name,
+            'doc_id': doc.get('_id'),
+            'error': message,
+            'error_code': code,
+            'attempts': attempts,
+            'failed_at': datetime.now()
+        }
+        try:
+            bson_encode(doc)
+            dead_letter['document'] = doc
+        except Exception:
+            # BSON으로 인코딩할 수 없는 문서는 원인 분석용 문자열로 저장
+            dead_letter['document_repr'] = repr(doc)
+        dead_letters.append(dead_letter)
+        logger.error(f"{collection_name} 문서 {dead_letter['doc_id']} 삽입 실패 (dead-letter 기록): {message}")
+    return dead_letters
+
+def record_dead_letters(collection, failures):
+    """
+    반복 실패한 문서를 DEAD_LETTER_COLLECTION에 오류 정보와 함께 기록
+    
+    Args:
+        collection: 원래 삽입 대상 컬렉션
+        failures (list): (문서, 오류 메시지, 오류 코드, 시도 횟수) 목록
+    """
+    dead_letters = build_dead_letters(collection.name, failures)
+    if dead_letters:
+        collection.database[DEAD_LETTER_COLLECTION].insert_many(dead_letters)
+
+def replace_operations(docs):
+    """_id 기준 ReplaceOne upsert 목록 (일부가 이미 저장되어 있어도 중복 없이 다시 쓸 수 있는 형태)"""
+    return [ReplaceOne({'_id': doc['_id']}, doc, upsert=True) for doc in docs]
+
+def insert_batch_with_retry(collection, batch, idempotent=False):
+    """
+    문서 배치를 삽입하고, 일시적 오류는 지수 백오프로 재시도
+    
+    Args:
+        collection: 대상 MongoDB 컬렉션
+        batch (list): 삽입할 문서 목록 (모든 문서에 _id가 있어야 함)
+        idempotent (bool): True이면 첫 시도부터 ReplaceOne upsert로 실행 (이미 일부가 저장되었을 수 있는 배치)
+        
+    Returns:
+        dict: {'inserted', 'retries', 'dead_lettered'}
+        
+    Note:
+        - 첫 시도는 빠른 insert_many(ordered=False), 재시도는 _id 기준 ReplaceOne upsert로 실행하여
+          네트워크 오류로 일부만 반영된 배치를 다시 보내도 문서가 중복되지 않음
+        - 배치 전체가 재시도 불가 오류(인코딩 오류 등)로 실패하면 절반씩 나누어 원인 문서만 골라냄
+          (실패한 insert_many가 앞쪽 하위 배치를 이미 썼을 수 있으므로 나눈 배치는 upsert로 다시 씀 -
+          insert_many로 다시 보내면 이미 저장된 문서가 중복 키 오류로 dead-letter에 기록됨)
+    """
+    stats = {'inserted': 0, 'retries': 0, 'dead_lettered': 0}
+    pending = batch
+    attempt = 0
+    while pending:
+        try:
+            if attempt == 0 and not idempotent:
+                collection.insert_many(pending, ordered=False)
+            else:
+                collection.bulk_write(replace_operations(pending), ordered=False)
+            stats['inserted'] += len(pending)
+            return stats
+        except BulkWriteError as e:
+            # 문서별 오류 중 일시적 오류만 재시도하고 나머지는 dead-letter로 기록
+            retry_docs, failures = split_bulk_write_errors(pending, e, attempt)
+            stats['inserted'] += len(pending) - len(retry_docs) - len(failures)
+            record_dead_letters(collection, failures)
+            stats['dead_lettered'] += len(failures)
+            pending = retry_docs
+        except Exception as e:
+            if not is_retryable_write_error(e):
+                if len(pending) == 1:
+                    record_dead_letters(collection, [(pending[0], str(e), getattr(e, 'code', None), attempt + 1)])
+                    stats['dead_lettered'] += 1
+                    return stats
+                # 어느 문서가 원인인지 알 수 없으므로 반으로 나누어 각각 재시도
+                middle = len(pending) // 2
+                for half in (pending[:middle], pending[middle:]):
+                    half_stats = insert_batch_with_retry(collection, half, idempotent=True)
+                    for key in stats:
+                        stats[key] += half_stats[key]
+                return stats
+            if attempt >= WRITE_MAX_RETRIES:
+                record_dead_letters(collection, [(doc, str(e), getattr(e, 'code', None), attempt + 1) for doc in pending])
+                stats['dead_lettered'] += len(pending)
+                return stats
+        
+        if pending:
+            # 지수 백오프 + 지터로 대기 후 재시도
+            delay = write_retry_delay(attempt)
+            attempt += 1
+            stats['retries'] += 1
+            logger.warning(f"{collection.name} 배치 {len(pending)}개 문서 재시도 {attempt}/{WRITE_MAX_RETRIES} "
+                           f"({delay:.1f}초 대기)")
+            time.sleep(delay)
+    return stats
+
+def encode_document_chunk(docs):
+    """문서 목록을 BSON 바이트 목록으로 인코딩 (프로세스 풀 작업자에서 실행되므로 모듈 최상위 함수로 정의)"""
+    return [bson_encode(doc) for doc in docs]
+
+class DocumentEncoder:
+    """
+    삽입할 문서를 RawBSONDocument로 미리 인코딩하는 단계
+    pymongo는 RawBSONDocument의 바이트를 그대로 전송하므로 작성 스레드에서 중첩 dict를 다시 인코딩하지 않음
+    
+    Args:
+        workers (int): 인코딩 프로세스 수 (1 이하이면 미리 인코딩하지 않음)
+        
+    Note:
+        작성 스레드에서 인코딩하면 pymongo가 삽입 시 인코딩하는 것과 비용이 같아 이점이 없으므로,
+        프로세스 풀이 없으면(workers 1 이하, /dev/shm이 없는 AWS Lambda 등) 문서를 그대로 반환
+        문서를 작업자에 전달하는 pickle 비용이 있으므로 items 배열이 큰 Orders처럼 문서가 클수록 효과가 큼
+    """
+    
+    def __init__(self, workers=0):
+        self.executor = None
+        self.window = 0
+        if workers > 1:
+            try:
+                self.executor = ProcessPoolExecutor(max_workers=workers)
+                self.window = workers * ENCODE_WINDOW_PER_WORKER
+            except OSError as e:
+                logger.warning(f"BSON 인코딩 프로세스 풀 생성 실패, 미리 인코딩하지 않고 삽입: {e}")
+    
+    def encode(self, docs):
+        """
+        문서 목록을 ENCODE_CHUNK_SIZE 단위로 인코딩하여 RawBSONDocument를 순서대로 반환 (지연 생성)
+        
+        Args:
+            docs (list): 인코딩할 문서 목록 (모든 문서에 _id가 있어야 함 - RawBSONDocument에는 _id가 추가되지 않음)
+            
+        Note:
+            프로세스 풀이 없으면 인코딩하지 않고 문서를 그대로 반환
+        """
+        if not self.executor:
+            yield from docs
+            return
+        
+        # 최대 window개 청크만 먼저 제출하고, 가장 앞 청크를 넘겨줄 때마다 다음 청크를 제출하여
+        # 인코딩과 삽입을 겹치면서도 아직 삽입하지 않은 BSON 바이트의 양을 제한
+        chunks = (docs[start:start + ENCODE_CHUNK_SIZE] for start in range(0, len(docs), ENCODE_CHUNK_SIZE))
+        pending = deque()
+        for chunk in itertools.islice(chunks, self.window):
+            pending.append(self.executor.submit(encode_document_chunk, chunk))
+        while pending:
+            encoded_chunk = pending.popleft().result()
+            for chunk in itertools.islice(chunks, 1):
+                pending.append(self.executor.submit(encode_document_chunk, chunk))
+            for data in encoded_chunk:
+                yield RawBSONDocument(data)
+    
+    def shutdown(self):
+        if self.executor:
+            self.executor.shutdown()
+
+def insert_documents(collection, docs, batch_sizer=None, encoder=None):
+    """
+    문서 목록을 배치로 나누어 재시도/dead-letter 처리와 함께 삽입
+    
+    Args:
+        collection: 대상 MongoDB 컬렉션
+        docs (list): 삽입할 문서 목록
+        batch_sizer (AdaptiveBatchSizer): 지정 시 적응형 크기 배치 사용 (없으면 BULK_WRITE_BATCH_SIZE)
+        encoder (DocumentEncoder): 지정 시 RawBSONDocument로 미리 인코딩한 문서를 삽입
+        
+    Returns:
+        dict: {'inserted', 'retries', 'dead_lettered'} 합계
+    """
+    stats = {'inserted': 0, 'retries': 0, 'dead_lettered': 0}
+    # 인코더는 문서를 지연 생성하므로, 앞 배치를 쓰는 동안 뒤 배치가 작업자 프로세스에서 인코딩됨
+    pending_docs = encoder.encode(docs) if encoder else iter(docs)
+    while True:
+        batch = list(itertools.islice(pending_docs, batch_sizer.insert.size if batch_sizer else BULK_WRITE_BATCH_SIZE))
+        if not batch:
+            break
+        start = time.perf_counter()
+        batch_stats = insert_batch_with_retry(collection, batch)
+        if batch_sizer:
+            batch_sizer.observe_insert(batch, time.perf_counter() - start)
+        for key in stats:
+            stats[key] += batch_stats[key]
+    if stats['dead_lettered']:
+        logger.warning(f"{collection.name}: {stats['dead_lettered']}개 문서를 {DEAD_LETTER_COLLECTION}에 기록")
+    return stats
+
+class ExtractionGovernor:
+    """
+    MySQL 조회 속도를 제한하고, 복제 지연이나 쿼리 지연이 임계치를 넘으면 자동으로 물러나는 제어기
+    
+    Args:
+        max_queries_per_sec (float): 초당 최대 쿼리 수 (없으면 제한 없음)
+        max_rows_per_sec (float): 초당 최대 조회 행 수 (없으면 제한 없음)
+        max_replica_lag_seconds (int): 허용 복제 지연 (초과 시 지연이 해소될 때까지 대기)
+        max_query_latency_ms (float): 허용 쿼리 지연 (초과 시 조회 속도를 절반으로 낮춤)
+        
+    Note:
+        지연 임계치를 넘으면 rate_scale로 속도 제한을 낮추고,
+        정상 지연이 관측될 때마다 10%씩 원래 속도로 회복
+        rate_scale이 1보다 작은 동안에는 쿼리마다 측정 지연 x (1 / rate_scale - 1)초를 쉬어
+        max_query_latency_ms만 지정해도 DB를 사용하는 시간 비율이 rate_scale로 줄어듦
+    """
+    
+    def __init__(self, max_queries_per_sec=None, max_rows_per_sec=None,
+                 max_replica_lag_seconds=None, max_query_latency_ms=None):
+        self.max_queries_per_sec = max_queries_per_sec
+        self.max_rows_per_sec = max_rows_per_sec
+        self.max_replica_lag_seconds = max_replica_lag_seconds
+        self.max_query_latency_ms = max_query_latency_ms
+        self.rate_scale = 1.0             # 지연 임계치 초과 시 감소하는 속도 배율
+        self.next_query_at = 0.0          # 다음 쿼리를 실행할 수 있는 시각 (perf_counter 기준)
+        self.last_lag_check = None
+        self.lock = threading.Lock()      # 병렬 조회 작업자가 하나의 제한을 공유하도록 보호
+        self.stats = {'queries': 0, 'rows': 0, 'throttle_sleep_seconds': 0.0,
+                      'lag_backoffs': 0, 'latency_backoffs': 0, 'max_replica_lag_seconds': None}
+    
+    def _sleep(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds)
+            self.stats['throttle_sleep_seconds'] += seconds
+    
+    def before_query(self, raw_cursor):
+        """쿼리 실행 전 초당 쿼리/행 수 제한과 복제 지연 확인"""
+        with self.lock:
+            self._wait_turn(raw_cursor)
+    
+    def _wait_turn(self, raw_cursor):
+        self._sleep(self.next_query_at - time.perf_counter())
+        if self.max_queries_per_sec:
+            self.next_query_at = time.perf_counter() + 1 / (self.max_queries_per_sec * self.rate_scale)
+        
+        if self.max_replica_lag_seconds is not None:
+            now = time.perf_counter()
+            if self.last_lag_check is None or now - self.last_lag_check >= REPLICA_LAG_CHECK_INTERVAL:
+                self.wait_for_replica(raw_cursor)
+                self.last_lag_check = time.perf_counter()
+    
+    def pace(self):
+        """스트리밍 조회 중 배치 사이에서 초당 행 수 제한만큼 대기"""
+        with self.lock:
+            self._sleep(self.next_query_at - time.perf_counter())
+    
+    def after_query(self, rows, seconds):
+        """쿼리 결과 행 수와 지연을 반영하여 다음 쿼리 가능 시각과 속도 배율 갱신"""
+        with self.lock:
+            self._record(rows, seconds)
+    
+    def _record(self, rows, seconds):
+        self.stats['queries'] += 1
+        self.stats['rows'] += rows
+        
+        if self.max_query_latency_ms and seconds * 1000 > self.max_query_latency_ms:
+            self.rate_scale = max(0.05, self.rate_scale / 2)
+            self.stats['latency_backoffs'] += 1
+            logger.warning(f"쿼리 지연 {seconds * 1000:.0f}ms - 조회 속도를 {self.rate_scale:.2f}배로 낮춤")
+        else:
+            self.rate_scale = min(1.0, self.rate_scale * 1.1)
+        
+        if self.max_query_latency_ms and self.rate_scale < 1.0:
+            # 초당 쿼리/행 수 제한이 없어도 물러나도록 방금 쿼리 지연에 비례해 다음 쿼리 실행 시각을 미룸
+            latency_delay = seconds * (1 / self.rate_scale - 1)
+            self.next_query_at = max(self.next_query_at, time.perf_counter() + latency_delay)
+        
+        if self.max_rows_per_sec and rows:
+            # 읽은 행 수만큼 다음 쿼리 실행 시각을 뒤로 미룸
+            row_delay = rows / (self.max_rows_per_sec * self.rate_scale)
+            self.next_query_at = max(self.next_query_at, time.perf_counter() + row_delay)
+    
+    def replica_lag(self, raw_cursor):
+        """
+        현재 연결된 서버의 복제 지연(초) 조회
+        
+        Returns:
+            int: 복제 지연 (복제본이 아니거나 복제가 중지되어 알 수 없으면 None)
+        """
+        try:
+            raw_cursor.execute("SHOW REPLICA STATUS")
+        except mysql.connector.Error:
+            try:
+                raw_cursor.execute("SHOW SLAVE STATUS")  # MySQL 8.0.22 미만
+            except mysql.connector.Error as e:
+                # REPLICATION CLIENT 권한이 없으면 지연 확인 없이 속도 제한만 적용
+                logger.warning(f"복제 상태 조회 실패, 복제 지연 확인 비활성화: {e}")
+                self.max_replica_lag_seconds = None
+                return None
+        row = raw_cursor.fetchone()
+        raw_cursor.fetchall()  # 다중 소스 복제의 나머지 채널 결과 정리
+        if row is None:
+            return None
+        status = dict(zip(raw_cursor.column_names, row))
+        return status.get('Seconds_Behind_Source', status.get('Seconds_Behind_Master'))
+    
+    def wait_for_replica(self, raw_cursor):
+        """복제 지연이 임계치 이하가 될 때까지 지수적으로 대기 시간을 늘리며 대기"""
+        backoff = 1
+        while True:
+            lag = self.replica_lag(raw_cursor)
+            if lag is None:
+                return
+            self.stats['max_replica_lag_seconds'] = max(lag, self.stats['max_replica_lag_seconds'] or 0)
+            if lag <= self.max_replica_lag_seconds:
+                return
+            self.stats['lag_backoffs'] += 1
+            logger.warning(f"복제 지연 {lag}초 - {backoff}초 대기 후 재확인")
+            self._sleep(backoff)
+            backoff = min(backoff * 2, MAX_THROTTLE_BACKOFF_SECONDS)
+    
+    def summary(self):
+        """migration_results에 기록할 부하 제어 결과"""
+        return dict(self.stats, throttle_sleep_seconds=round(self.stats['throttle_sleep_seconds'], 2),
+                    final_rate_scale=round(self.rate_scale, 2))
+
+class ThrottledCursor:
+    """
+    MySQL 커서를 감싸 모든 execute/fetch 호출에 ExtractionGovernor의 제한을 적용
+    나머지 속성(close, column_names 등)은 원래 커서로 위임
+    """
+    
+    def __init__(self, cursor, governor):
+        self._cursor = cursor
+        self._governor = governor
+        self._query_start = None
+    
+    def execute(self, query, params=None):
+        self._governor.before_query(self._cursor)
+        self._query_start = time.perf_counter()
+        return self._cursor.execute(query, params)
+    
+    def _record(self, rows):
+        self._governor.after_query(rows, time.perf_counter() - self._query_start)
+    
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._record(len(rows))
+        return rows
+    
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        self._record(1 if row is not None else 0)
+        return row
+    
+    def fetchmany(self, size):
+        # 스트리밍 조회는 결과를 다 읽기 전에는 복제 상태를 조회할 수 없으므로 행 수 제한만 적용
+        rows = self._cursor.fetchmany(size)
+        self._record(len(rows))
+        self._governor.pace()
+        self._query_start = time.perf_counter()
+        return rows
+    
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+def create_indexes(mongodb, index_plan=None):
     """
     MongoDB 컬렉션들에 성능 최적화를 위한 인덱스 생성
     각 컬렉션의 주요 쿼리 패턴을 분석하여 적절한 인덱스 설계
     
     Args:
         mongodb: MongoDB 데이터베이스 객체
+        index_plan (list): index_advisor.py가 실제 쿼리 실행계획으로 도출한 권장 인덱스 목록
+            [{'collection': 'Orders', 'keys': [['cust_id', 1], ['ord_date', -1]], 'options': {}}, ...]
+            지정하면 아래 기본 인덱스 대신 이 목록을 적용
         
     Index Strategy:
         - 복합 인덱스: 여러 필드를 함께 사용하는 쿼리용
         - 텍스트 인덱스: 상품명 검색용
+        - 배열(multikey) 인덱스: 한글 n-gram/초성 토큰 검색용
         - 정렬 인덱스: 날짜순 정렬 쿼리용
     """
     logger.info("인덱스 생성 시작")
     
     try:
+        if index_plan:
+            # 인덱스 어드바이저 권장안 적용
+            for index_spec in index_plan:
+                keys = [(field, direction) for field, direction in index_spec['keys']]
+                mongodb[index_spec['collection']].create_index(keys, **index_spec.get('options', {}))
+            logger.info(f"권장 인덱스 {len(index_plan)}개 생성 완료")
+            return
+        
         # Products 컬렉션 인덱스
         # 1. 상품 타입별 가격 정렬 쿼리용 복합 인덱스
         mongodb.Products.create_index([("prod_type", 1), ("price", 1)])
         # 2. 상품명 전문 검색용 텍스트 인덱스
         mongodb.Products.create_index([("prod_name", "text")])
+        # 3. 한글 상품 검색용 n-gram/초성 토큰 인덱스 (multikey)
+        mongodb.Products.create_index([("search_tokens", 1)])
         
         # Orders 컬렉션 인덱스
         # 1. 고객별 주문내역 조회용 (최신순 정렬)
         mongodb.Orders.create_index([("cust_id", 1), ("ord_date", -1)])
         # 2. 리뷰 미작성 상품 조회용 복합 인덱스
         mongodb.Orders.create_index([("items.review_written", 1), ("cust_id", 1)])
+        # 3. 주문번호 단건 조회 및 증분 동기화 시 기존 문서 매칭용
+        mongodb.Orders.create_index([("ord_no", 1)], unique=True)
         
         # Reviews 컬렉션 인덱스
         # 1. 상품별 리뷰 조회용 (최신순 정렬)
@@ -522,6 +2139,11 @@ def create_indexes(mongodb):
         # 2. 고객별 리뷰 조회용
         mongodb.Reviews.create_index([("cust_id", 1)])
         
+        # CartHistory 컬렉션 인덱스 (archive_ordered_cart 옵션으로 생성된 경우만)
+        # 1. 고객별 장바구니 이력 조회용 (버킷 순)
+        if 'CartHistory' in mongodb.list_collection_names():
+            mongodb.CartHistory.create_index([("cust_id", 1), ("bucket_no", 1)])
+        
         logger.info("인덱스 생성 완료")
         
     except Exception as e:
@@ -0,0 +1,492 @@
+import os                           # 운영체제 환경변수 접근 (데이터베이스 연결정보 읽기용)
+import sys                          # 명령행 인자 처리 (권장 인덱스 출력 파일 경로)
+import json                         # 권장 인덱스 목록 직렬화 (Lambda 이벤트 index_plan 형식)
+import logging                      # 구조화된 로깅 시스템 (CloudWatch 로그 출력용)
+from pymongo import MongoClient     # MongoDB/DocumentDB 연결 및 explain/$indexStats 실행용 클라이언트
+
+logger = logging.getLogger()
+
+# 웹 애플리케이션(myShop_NoSQL의 Main.js, cartView.js, myPage.js, prodDetail.js, auth.js)이
+# 실제로 실행하는 쿼리 형태 목록
+# - 값 자리에는 '{cust_id}' 같은 자리표시자를 두고, 실행 시 저장된 문서에서 실제 값을 뽑아 치환
+# - update/delete 연산은 같은 필터의 find 실행계획으로 평가 (문서 탐색 방식이 동일)
+APP_QUERY_SHAPES = [
+    # Main.js - 상품 목록 조회 (전체 조회이므로 인덱스 대상 아님)
+    {'source': 'Main.js 상품 목록', 'collection': 'Products', 'filter': {}},
+    # Main.js - 장바구니 추가 ($push)
+    {'source': 'Main.js 장바구니 추가', 'collection': 'Customers', 'filter': {'_id': '{cust_id}'}},
+    # cartView.js - 장바구니 조회 aggregate의 첫 $match
+    {'source': 'cartView.js 장바구니 조회', 'collection': 'Customers',
+     'pipeline': [{'$match': {'_id': '{cust_id}'}}, {'$unwind': '$cart'}, {'$match': {'cart.ord_yn': 'N'}}]},
+    # cartView.js - 장바구니 수정 (고객 ID 없이 cart_seq_no로만 검색)
+    {'source': 'cartView.js 장바구니 수정', 'collection': 'Customers',
+     'filter': {'cart.cart_seq_no': '{cart_seq_no}'}},
+    # cartView.js - 장바구니 삭제 ($pull)
+    {'source': 'cartView.js 장바구니 삭제', 'collection': 'Customers', 'filter': {'_id': '{cust_id}'}},
+    # cartView.js - 결제 시 상품 가격 조회
+    {'source': 'cartView.js 결제 상품 조회', 'collection': 'Products', 'filter': {'_id': '{prod_cd}'}},
+    # cartView.js - 결제 확정/롤백 시 주문 갱신 및 삭제
+    {'source': 'cartView.js 주문 확정/롤백', 'collection': 'Orders', 'filter': {'ord_no': '{ord_no}'}},
+    # myPage.js - 주문 내역 aggregate의 첫 $match
+    {'source': 'myPage.js 주문 내역', 'collection': 'Orders',
+     'pipeline': [{'$match': {'cust_id': '{cust_id}'}}, {'$unwind': '$items'}]},
+    # myPage.js - 주문 내역 $lookup이 주문 상품마다 실행하는 Reviews 조회
+    {'source': 'myPage.js 주문별 리뷰 조회', 'collection': 'Reviews',
+     'filter': {'ord_no': '{ord_no}', 'cust_id': '{cust_id}', 'ord_item_no': '{ord_item_no}'}},
+    # myPage.js - 리뷰 등록 시 주문 조회 및 review_written 갱신
+    {'source': 'myPage.js 리뷰 대상 주문 조회', 'collection': 'Orders',
+     'filter': {'cust_id': '{cust_id}', 'items.ord_item_no': '{ord_item_no}'}},
+    # myPage.js - 리뷰 upsert
+    {'source': 'myPage.js 리뷰 등록/수정', 'collection': 'Reviews',
+     'filter': {'cust_id': '{cust_id}', 'ord_item_no': '{ord_item_no}'}},
+    # prodDetail.js - 상품 상세 리뷰 aggregate의 첫 $match
+    {'source': 'prodDetail.js 상품 리뷰', 'collection': 'Reviews',
+     'pipeline': [{'$match': {'prod_cd': '{prod_cd}'}}]},
+    # auth.js, myPage.js - 고객 정보 조회
+    {'source': 'auth.js 로그인/고객 조회', 'collection': 'Customers', 'filter': {'_id': '{cust_id}'}},
+    # search_tokens.py - 상품 검색 (토큰 하나의 실행계획으로 $all 조회를 평가)
+    {'source': 'search_tokens.py 상품 검색', 'collection': 'Products', 'filter': {'search_tokens': '{search_token}'}},
+]
+
+# 자리표시자별 실제 값을 뽑아올 컬렉션과 필드 경로 (배열 필드는 첫 번째 요소 사용)
+SAMPLE_VALUE_SOURCES = {
+    'cust_id': ('Customers', '_id'),
+    'prod_cd': ('Products', '_id'),
+    'ord_no': ('Orders', 'ord_no'),
+    'ord_item_no': ('Orders', 'items.ord_item_no'),
+    'cart_seq_no': ('Customers', 'cart.cart_seq_no'),
+    'search_token': ('Products', 'search_tokens'),
+}
+
+# 인덱스를 사용하더라도 반환 문서 대비 검사 문서 비율이 이 값을 넘으면 비효율 쿼리로 판단
+INEFFICIENT_SCAN_RATIO = 10
+
+# 범위 조건으로 취급할 연산자 (ESR 규칙에서 정렬 필드 뒤에 배치)
+RANGE_OPERATORS = {'$gt', '$gte', '$lt', '$lte', '$ne', '$nin', '$exists', '$regex'}
+
+def get_field_value(doc, path):
+    """
+    점(.) 표기 경로로 문서의 값을 조회 (배열을 만나면 첫 번째 요소로 진입)
+
+    Args:
+        doc (dict): MongoDB 문서
+        path (str): 필드 경로 (예: 'items.ord_item_no')
+
+    Returns:
+        경로에 해당하는 값 (없으면 None)
+    """
+    value = doc
+    for part in path.split('.'):
+        if isinstance(value, list):
+            value = value[0] if value else None
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value[0] if isinstance(value, list) and value else value
+
+def collect_sample_values(mongodb):
+    """
+    쿼리 형태의 자리표시자를 치환할 실제 값을 저장된 문서에서 수집
+
+    Args:
+        mongodb: MongoDB 데이터베이스 객체
+
+    Returns:
+        dict: 자리표시자 이름별 샘플 값
+    """
+    sample_values = {}
+    for name, (collection, path) in SAMPLE_VALUE_SOURCES.items():
+        doc = mongodb[collection].find_one({path: {'$exists': True}}, {path: 1})
+        sample_values[name] = get_field_value(doc, path) if doc else None
+    return sample_values
+
+def fill_placeholders(value, sample_values):
+    """
+    쿼리 형태의 '{이름}' 자리표시자를 샘플 값으로 재귀 치환
+
+    Args:
+        value: 필터, 파이프라인 등 쿼리 구성 요소
+        sample_values (dict): 자리표시자 이름별 샘플 값
+
+    Returns:
+        자리표시자가 치환된 사본
+    """
+    if isinstance(value, dict):
+        return {key: fill_placeholders(item, sample_values) for key, item in value.items()}
+    if isinstance(value, list):
+        return [fill_placeholders(item, sample_values) for item in value]
+    if isinstance(value, str) and value.startswith('{') and value.endswith('}'):
+        return sample_values.get(value[1:-1])
+    return value
+
+def load_profiled_workload(mongodb, limit=1000):
+    """
+    데이터베이스 프로파일러(system.profile)에 기록된 실제 워크로드를 쿼리 형태로 변환
+
+    Args:
+        mongodb: MongoDB 데이터베이스 객체
+        limit (int): 읽어올 최대 프로파일 항목 수
+
+    Returns:
+        list: APP_QUERY_SHAPES와 같은 형식의 쿼리 형태 목록 (중복 형태 제거)
+
+    Note:
+        로컬 MongoDB에서 db.setProfilingLevel(2)로 애플리케이션 트래픽을 캡처한 뒤 사용
+        DocumentDB는 system.profile을 제공하지 않으므로 APP_QUERY_SHAPES만 사용
+    """
+    shapes = []
+    seen = set()
+    for entry in mongodb['system.profile'].find({'op': {'$in': ['query', 'update', 'remove', 'command']}}).limit(limit):
+        command = entry.get('command', {})
+        collection = entry.get('ns', '').split('.', 1)[-1]
+
+        if 'aggregate' in command:
+            shape = {'collection': collection, 'pipeline': command.get('pipeline', [])}
+        elif 'find' in command:
+            shape = {'collection': collection, 'filter': command.get('filter', {}), 'sort': command.get('sort')}
+        elif 'q' in command:
+            # update/delete 항목은 command.q에 필터가 기록됨
+            shape = {'collection': collection, 'filter': command.get('q', {})}
+        else:
+            continue
+
+        # 값은 다르고 필드 구성만 같은 쿼리는 한 번만 평가
+        shape_key = (collection, json.dumps(shape_fields(shape), sort_keys=True))
+        if shape_key in seen:
+            continue
+        seen.add(shape_key)
+        shape['source'] = f"system.profile {entry.get('op')} {collection}"
+        shapes.append(shape)
+    return shapes
+
+def shape_fields(shape):
+    """
+    쿼리 형태에서 인덱스 설계에 필요한 필드 구성 추출 (ESR 규칙)
+
+    Args:
+        shape (dict): 쿼리 형태 (filter/sort 또는 pipeline)
+
+    Returns:
+        dict: {'equality': [...], 'sort': [[필드, 방향], ...], 'range': [...]}
+    """
+    query_filter = shape.get('filter') or {}
+    sort = shape.get('sort') or {}
+    if shape.get('pipeline'):
+        # 파이프라인은 맨 앞의 $match와 바로 뒤 $sort만 인덱스를 사용할 수 있음
+        stages = shape['pipeline']
+        if stages and '$match' in stages[0]:
+            query_filter = stages[0]['$match']
+            if len(stages) > 1 and '$sort' in stages[1]:
+                sort = stages[1]['$sort']
+
+    equality, range_fields = [], []
+    for field, condition in query_filter.items():
+        if field.startswith('$'):
+            continue
+        if isinstance(condition, dict) and any(op in RANGE_OPERATORS for op in condition):
+            range_fields.append(field)
+        else:
+            equality.append(field)
+
+    return {
+        'equality': equality,
+        'sort': [[field, direction] for field, direction in sort.items()],
+        'range': range_fields
+    }
+
+# explain 결과에서 실제로 실행된 계획을 담는 키와, 선택되지 않은 후보 계획을 담는 키
+EXECUTED_PLAN_KEYS = ('winningPlan', 'executionStages')
+REJECTED_PLAN_KEYS = ('rejectedPlans', 'allPlansExecution')
+
+def find_executed_plans(node, plans):
+    """
+    explain 결과에서 queryPlanner.winningPlan과 executionStats.executionStages 하위 트리를 수집
+    (aggregate의 $cursor 단계, 샤드별 결과 등 버전별로 위치가 달라 재귀 탐색하되 rejectedPlans는 건너뜀)
+
+    Args:
+        node: explain 결과의 일부 (dict 또는 list)
+        plans (list): 수집된 실행 계획 하위 트리
+    """
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key in EXECUTED_PLAN_KEYS:
+                plans.append(value)
+            elif key not in REJECTED_PLAN_KEYS:
+                find_executed_plans(value, plans)
+    elif isinstance(node, list):
+        for item in node:
+            find_executed_plans(item, plans)
+
+def walk_plan(node, stages, index_names):
+    """
+    실행 계획 하위 트리를 재귀 순회하며 실행 단계명과 사용 인덱스명을 수집
+    (inputStage/inputStages 중첩 구조가 단계마다 달라 전체 순회)
+
+    Args:
+        node: explain 결과의 일부 (dict 또는 list)
+        stages (set): 수집된 stage 이름
+        index_names (set): 수집된 indexName
+    """
+    if isinstance(node, dict):
+        if 'stage' in node:
+            stages.add(node['stage'])
+        if 'indexName' in node:
+            index_names.add(node['indexName'])
+        for value in node.values():
+            walk_plan(value, stages, index_names)
+    elif isinstance(node, list):
+        for item in node:
+            walk_plan(item, stages, index_names)
+
+def find_first_key(node, key):
+    """
+    explain 결과에서 처음 나타나는 키의 값을 재귀 탐색 (executionStats 위치가 버전별로 다름)
+    """
+    if isinstance(node, dict):
+        if key in node:
+            return node[key]
+        node = list(node.values())
+    if isinstance(node, list):
+        for item in node:
+            found = find_first_key(item, key)
+            if found is not None:
+                return found
+    return None
+
+def explain_query_shape(mongodb, shape, sample_values):
+    """
+    쿼리 형태를 실제 값으로 치환하여 explain()을 실행하고 실행계획을 요약
+
+    Args:
+        mongodb: MongoDB 데이터베이스 객체
+        shape (dict): 쿼리 형태
+        sample_values (dict): 자리표시자 치환 값
+
+    Returns:
+        dict: 쿼리 출처, 실행 단계, 사용 인덱스, 검사/반환 문서 수, COLLSCAN 여부
+    """
+    if shape.get('pipeline'):
+        command = {
+            'aggregate': shape['collection'],
+            'pipeline': fill_placeholders(shape['pipeline'], sample_values),
+            'cursor': {}
+        }
+    else:
+        command = {'find': shape['collection'], 'filter': fill_placeholders(shape.get('filter') or {}, sample_values)}
+        if shape.get('sort'):
+            command['sort'] = shape['sort']
+
+    explain = mongodb.command('explain', command, verbosity='executionStats')
+
+    # 후보로만 평가되고 선택되지 않은 계획(rejectedPlans)의 인덱스는 사용된 것으로 세지 않음
+    executed_plans = []
+    find_executed_plans(explain, executed_plans)
+    stages, index_names = set(), set()
+    for plan in executed_plans:
+        walk_plan(plan, stages, index_names)
+    return {
+        'source': shape.get('source'),
+        'collection': shape['collection'],
+        'stages': sorted(stages),
+        'indexes_used': sorted(index_names),
+        'docs_examined': find_first_key(explain, 'totalDocsExamined'),
+        'returned': find_first_key(explain, 'nReturned'),
+        'collscan': 'COLLSCAN' in stages
+    }
+
+def collect_index_usage(mongodb, collections):
+    """
+    $indexStats로 컬렉션별 인덱스 정의와 서버 기동 이후 사용 횟수를 수집
+
+    Args:
+        mongodb: MongoDB 데이터베이스 객체
+        collections (iterable): 대상 컬렉션 이름
+
+    Returns:
+        dict: {컬렉션: {인덱스명: {'keys': [[필드, 방향], ...], 'ops': 사용횟수, 'options': {...}}}}
+    """
+    usage = {}
+    for collection in collections:
+        indexes = {}
+        for name, info in mongodb[collection].index_information().items():
+            options = {option: info[option] for option in ('unique', 'sparse') if info.get(option)}
+            if 'weights' in info:
+                # 텍스트 인덱스는 내부 키(_fts, _ftsx) 대신 원래 필드로 다시 생성할 수 있게 변환
+                keys = [[field, 'text'] for field in info['weights']]
+            else:
+                keys = [[field, direction] for field, direction in info['key']]
+            indexes[name] = {'keys': keys, 'ops': None, 'options': options}
+        for stat in mongodb[collection].aggregate([{'$indexStats': {}}]):
+            if stat['name'] in indexes:
+                indexes[stat['name']]['ops'] = stat.get('accesses', {}).get('ops')
+        usage[collection] = indexes
+    return usage
+
+def recommend_index_keys(fields):
+    """
+    ESR(Equality - Sort - Range) 규칙으로 복합 인덱스 키 순서 결정
+
+    Args:
+        fields (dict): shape_fields()의 반환값
+
+    Returns:
+        list: [[필드, 방향], ...] (인덱스가 필요 없는 쿼리면 빈 리스트)
+    """
+    keys = [[field, 1] for field in fields['equality']]
+    keys += [[field, direction] for field, direction in fields['sort'] if field not in fields['equality']]
+    keys += [[field, 1] for field in fields['range'] if field not in fields['equality']]
+    # _id 단독 조회는 기본 _id 인덱스로 충분
+    if not keys or keys[0][0] == '_id':
+        return []
+    return keys
+
+def is_prefix(keys, other_keys):
+    """keys가 other_keys의 접두 인덱스인지 확인 (접두 인덱스는 긴 인덱스로 대체 가능)"""
+    return len(keys) <= len(other_keys) and [list(k) for k in other_keys[:len(keys)]] == [list(k) for k in keys]
+
+def advise_indexes(mongodb, shapes=None, include_profiled=True):
+    """
+    워크로드를 explain()으로 재생하여 COLLSCAN과 미사용 인덱스를 찾고 권장 인덱스 목록 생성
+
+    Args:
+        mongodb: MongoDB 데이터베이스 객체
+        shapes (list): 평가할 쿼리 형태 목록 (기본값: APP_QUERY_SHAPES)
+        include_profiled (bool): system.profile에 캡처된 워크로드도 함께 평가
+
+    Returns:
+        dict: 분석 결과
+            - plans: 쿼리 형태별 실행계획 요약
+            - collscans: 인덱스 없이 전체 스캔한 쿼리 출처
+            - inefficient: 인덱스를 쓰지만 검사 문서 비율이 높은 쿼리 출처
+            - unused_indexes: 워크로드에서 쓰이지 않고 $indexStats 사용 횟수도 0인 인덱스
+            - index_plan: create_indexes(index_plan=...)에 그대로 넘길 권장 인덱스 목록
+    """
+    shapes = list(shapes or APP_QUERY_SHAPES)
+    if include_profiled:
+        try:
+            shapes += load_profiled_workload(mongodb)
+        except Exception as e:
+            # 프로파일러 미지원(DocumentDB) 또는 권한 부족 시 앱 쿼리 형태만 사용
+            logger.warning(f"프로파일 워크로드 조회 생략: {str(e)}")
+
+    sample_values = collect_sample_values(mongodb)
+    collections = sorted({shape['collection'] for shape in shapes})
+    usage = collect_index_usage(mongodb, collections)
+
+    plans, collscans, inefficient = [], [], []
+    used_indexes = {collection: set() for collection in collections}
+    candidates = {collection: [] for collection in collections}
+
+    for shape in shapes:
+        plan = explain_query_shape(mongodb, shape, sample_values)
+        plans.append(plan)
+        used_indexes[shape['collection']].update(plan['indexes_used'])
+
+        keys = recommend_index_keys(shape_fields(shape))
+        if not keys:
+            # 전체 조회나 _id 단건 조회는 인덱스 추가 대상이 아님
+            continue
+
+        examined, returned = plan['docs_examined'] or 0, plan['returned'] or 0
+        needs_index = plan['collscan'] or examined > INEFFICIENT_SCAN_RATIO * max(returned, 1)
+        if plan['collscan']:
+            collscans.append(plan['source'])
+        elif needs_index:
+            inefficient.append(plan['source'])
+
+        candidates[shape['collection']].append({'keys': keys, 'new': needs_index, 'source': plan['source']})
+
+    unused_indexes = []
+    index_plan = []
+    for collection in collections:
+        # 1. 워크로드가 실제로 사용한 기존 인덱스는 그대로 유지
+        kept = []
+        for name, info in usage[collection].items():
+            if name == '_id_':
+                continue
+            if name in used_indexes[collection]:
+                kept.append(info['keys'])
+                index_plan.append({'collection': collection, 'keys': info['keys'], 'options': info['options']})
+            elif not info['ops']:
+                unused_indexes.append({'collection': collection, 'name': name, 'keys': info['keys']})
+            else:
+                # 재생한 워크로드에는 없지만 서버에서 사용 기록이 있는 인덱스는 보수적으로 유지
+                kept.append(info['keys'])
+                index_plan.append({'collection': collection, 'keys': info['keys'], 'options': info['options']})
+
+        # 2. COLLSCAN/비효율 쿼리용 신규 인덱스 (긴 인덱스가 짧은 접두 인덱스를 대체)
+        new_keys = [candidate['keys'] for candidate in candidates[collection] if candidate['new']]
+        for keys in sorted(new_keys, key=len, reverse=True):
+            if any(is_prefix(keys, existing) for existing in kept):
+                continue
+            kept.append(keys)
+            index_plan.append({'collection': collection, 'keys': keys, 'options': {}})
+
+    return {
+        'plans': plans,
+        'collscans': collscans,
+        'inefficient': inefficient,
+        'unused_indexes': unused_indexes,
+        'index_plan': index_plan
+    }
+
+def print_report(report):
+    """
+    인덱스 분석 결과를 사람이 읽기 쉬운 형태로 출력
+
+    Args:
+        report (dict): advise_indexes()의 반환값
+    """
+    print("\n=== 쿼리 실행계획 ===")
+    for plan in report['plans']:
+        indexes = ', '.join(plan['indexes_used']) or '-'
+        print(f"[{plan['collection']}] {plan['source']}: {'/'.join(plan['stages'])} "
+              f"(인덱스: {indexes}, 검사 {plan['docs_examined']} / 반환 {plan['returned']})")
+
+    print("\n=== COLLSCAN 쿼리 ===")
+    for source in report['collscans']:
+        print(f"- {source}")
+
+    print("\n=== 비효율 인덱스 스캔 쿼리 ===")
+    for source in report['inefficient']:
+        print(f"- {source}")
+
+    print("\n=== 미사용 인덱스 ===")
+    for index in report['unused_indexes']:
+        print(f"- {index['collection']}.{index['name']} {index['keys']}")
+
+    print("\n=== 권장 인덱스 ===")
+    for index_spec in report['index_plan']:
+        print(f"- {index_spec['collection']}: {index_spec['keys']} {index_spec['options'] or ''}")
+
+def main():
+    """
+    로컬 MongoDB에 이관된 데이터로 인덱스 분석을 실행하는 메인 함수
+
+    Usage:
+        python index_advisor.py [권장인덱스.json]
+        출력된 JSON 목록을 Lambda 이벤트의 index_plan으로 전달하면 create_indexes가 적용
+
+    Environment Variables Required:
+        - MONGODB_URI: MongoDB 연결 URI
+        - MONGODB_DATABASE: MongoDB 데이터베이스명
+    """
+    logging.basicConfig(level=logging.INFO)
+    client = MongoClient(os.environ.get('MONGODB_URI'))
+    mongodb = client[os.environ.get('MONGODB_DATABASE')]
+
+    try:
+        report = advise_indexes(mongodb)
+        print_report(report)
+
+        # 권장 인덱스 목록을 파일로 저장 (Lambda 이벤트에 그대로 사용)
+        if len(sys.argv) > 1:
+            with open(sys.argv[1], 'w', encoding='utf-8') as f:
+                json.dump(report['index_plan'], f, ensure_ascii=False, indent=2)
+            print(f"\n권장 인덱스 저장 완료: {sys.argv[1]}")
+    finally:
+        client.close()
+
+# 스크립트가 직접 실행될 때만 main() 함수 호출
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,406 @@
+import math                         # 배치/쿼리/호출 수 올림 계산
+import os                           # Lambda 메모리 설정 및 CPU 코어 수 확인
+import time                         # MySQL/MongoDB 왕복 시간 측정
+import logging                      # 구조화된 로깅 시스템 (CloudWatch 로그 출력용)
+from statistics import median       # 왕복 시간 측정값의 중앙값 (일시적 지연 영향 제거)
+from bson import encode as bson_encode  # 표본 문서의 BSON 크기 측정
+
+# 문서 변환 규칙과 배치 상한은 실제 이관(index.py)과 같은 값을 사용해야 예측이 맞음
+from index import (
+    BULK_WRITE_BATCH_SIZE,
+    DEFAULT_MEMORY_BUDGET_MB,
+    MAX_INSERT_BATCH_BYTES,
+    MEMORY_PRESSURE_RATIO,
+    build_customer_doc,
+    build_order_doc,
+    build_order_item_doc,
+    build_product_doc,
+    build_review_doc,
+    current_rss_mb
+)
+
+logger = logging.getLogger()
+
+# 컬렉션별 원본 테이블과 내장되는 자식 테이블
+# - child: 부모 문서 하나에 배열로 내장되는 자식 테이블 (child_key로 묶임)
+# - per_child_queries: 동기 이관에서 자식 행마다 추가로 실행되는 쿼리 수 (Orders는 리뷰 작성 여부 조회)
+COLLECTION_SOURCES = {
+    'Products': {'table': 'Products', 'child': None},
+    'Customers': {'table': 'Customers', 'child': 'Carts', 'child_key': 'cust_id', 'per_child_queries': 0},
+    'Orders': {'table': 'Orders', 'child': 'Ord_items', 'child_key': 'ord_no', 'per_child_queries': 1},
+    'Reviews': {'table': 'Prod_evals', 'child': None},
+}
+
+# 문서 크기 측정에 사용할 표본 행 수
+SAMPLE_ROWS = 20
+
+# 표본 조회 쿼리 (실제 이관 쿼리와 같은 컬럼 순서)
+SAMPLE_QUERIES = {
+    'Products': "SELECT * FROM Products LIMIT %s",
+    'Customers': "SELECT * FROM Customers LIMIT %s",
+    'Carts': "SELECT cart_seq_no, prod_cd, prod_size, ord_qty, ord_yn FROM Carts LIMIT %s",
+    'Orders': "SELECT * FROM Orders LIMIT %s",
+    'Ord_items': """
+        SELECT oi.ord_item_no, oi.cart_seq_no, oi.prod_cd, oi.prod_size, oi.ord_qty,
+               p.prod_name, p.price, p.prod_img
+        FROM Ord_items oi
+        JOIN Products p ON oi.prod_cd = p.prod_cd
+        LIMIT %s
+    """,
+    'Reviews': """
+        SELECT pe.eval_seq_no, pe.eval_score, pe.eval_comment, pe.cust_id,
+               pe.prod_cd, pe.ord_item_no, c.cust_name, oi.ord_no
+        FROM Prod_evals pe
+        JOIN Customers c ON pe.cust_id = c.cust_id
+        JOIN Ord_items oi ON pe.ord_item_no = oi.ord_item_no
+        LIMIT %s
+    """,
+}
+
+# 비용 모델 상수 (실측 이관 결과의 duration_seconds/batch_sizing과 비교하여 보정)
+# - 행 튜플/문서 dict는 파이썬 객체 오버헤드로 원본 행/BSON 크기보다 몇 배 큰 메모리를 사용
+# - 전송 속도는 같은 리전 RDS/DocumentDB 기준의 보수적인 값
+ROW_MEMORY_FACTOR = 4
+DOC_MEMORY_FACTOR = 5
+TRANSFER_BYTES_PER_SECOND = 20 * 1024 * 1024
+DOC_BUILD_SECONDS = 0.00002
+BCRYPT_SECONDS_AT_10_ROUNDS = 0.07
+
+# 예측 시간이 제한 시간의 이 비율을 넘으면 분할 권장 (예측 오차 여유)
+TIME_SAFETY_RATIO = 0.8
+
+# 동기 경로의 쿼리 수가 이 값을 넘으면 왕복 시간이 지배적이므로 외부 정렬 경로 권장
+PER_PARENT_QUERY_THRESHOLD = 10000
+
+# Lambda 최대 실행 시간과 기본 /tmp 용량 (외부 정렬 런 파일 저장 위치)
+LAMBDA_MAX_SECONDS = 900
+DEFAULT_EPHEMERAL_STORAGE_MB = 512
+
+# MongoDB 문서 크기 상한 (최대 자식 수 기준 문서가 이 값의 절반을 넘으면 경고)
+MAX_DOCUMENT_BYTES = 16 * 1024 * 1024
+
+# 조회 배치 크기 권장 범위 (AdaptiveBatchSizer의 fetch 컨트롤러 범위와 동일)
+MIN_FETCH_BATCH = 50
+MAX_FETCH_BATCH = 20000
+
+def collect_table_stats(mysql_cursor, database):
+    """
+    information_schema.TABLES에서 테이블별 행 수와 평균 행 길이 조회
+
+    Returns:
+        dict: {테이블명: {'rows': 행 수, 'avg_row_bytes': 평균 행 길이, 'data_bytes': 데이터 크기}}
+
+    Note:
+        InnoDB의 TABLE_ROWS는 통계 기반 추정값이므로 대량 적재 직후에는 ANALYZE TABLE 후 실행하는 것이 정확함
+    """
+    mysql_cursor.execute("""
+        SELECT TABLE_NAME, TABLE_ROWS, AVG_ROW_LENGTH, DATA_LENGTH
+        FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = %s
+    """, (database,))
+    return {
+        name: {'rows': int(rows or 0), 'avg_row_bytes': int(avg_row_length or 0), 'data_bytes': int(data_length or 0)}
+        for name, rows, avg_row_length, data_length in mysql_cursor.fetchall()
+    }
+
+def max_fan_out(mysql_cursor, child_table, child_key):
+    """부모 하나당 최대 자식 행 수 (외래키 인덱스만 읽는 GROUP BY 조회)"""
+    mysql_cursor.execute(f"""
+        SELECT COUNT(*) AS child_count
+        FROM {child_table}
+        GROUP BY {child_key}
+        ORDER BY child_count DESC
+        LIMIT 1
+    """)
+    row = mysql_cursor.fetchone()
+    return row[0] if row else 0
+
+def fetch_sample(mysql_cursor, name):
+    mysql_cursor.execute(SAMPLE_QUERIES[name], (SAMPLE_ROWS,))
+    return mysql_cursor.fetchall()
+
+def mean_bson_bytes(docs):
+    return sum(len(bson_encode(doc)) for doc in docs) / len(docs) if docs else 0
+
+def measure_document_sizes(mysql_cursor, collection):
+    """
+    표본 행을 실제 build_* 함수로 문서화하여 BSON 크기 측정
+
+    Returns:
+        tuple: (자식 배열을 뺀 문서의 평균 BSON 크기, 내장 자식 항목 하나의 평균 BSON 크기)
+    """
+    if collection == 'Products':
+        return mean_bson_bytes([build_product_doc(row) for row in fetch_sample(mysql_cursor, 'Products')]), 0
+    if collection == 'Reviews':
+        return mean_bson_bytes([build_review_doc(row) for row in fetch_sample(mysql_cursor, 'Reviews')]), 0
+
+    if collection == 'Customers':
+        parents, children = fetch_sample(mysql_cursor, 'Customers'), fetch_sample(mysql_cursor, 'Carts')
+        build = build_customer_doc
+    else:
+        parents, children = fetch_sample(mysql_cursor, 'Orders'), fetch_sample(mysql_cursor, 'Ord_items')
+        children = [build_order_item_doc(item, 0) for item in children]
+        build = build_order_doc
+
+    if not parents:
+        return 0, 0
+    base_bytes = mean_bson_bytes([build(parent, []) for parent in parents])
+    if not children:
+        return base_bytes, 0
+    # 배열 항목의 키("0", "1", ...)와 타입 바이트까지 포함되도록 자식을 내장한 문서와의 차이로 측정
+    with_children = len(bson_encode(build(parents[0], children)))
+    item_bytes = (with_children - len(bson_encode(build(parents[0], [])))) / len(children)
+    return base_bytes, item_bytes
+
+def measure_round_trip(operation, repeat=5):
+    """operation을 여러 번 실행한 왕복 시간의 중앙값 (초)"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - start)
+    return median(samples)
+
+def mysql_ping(mysql_cursor):
+    mysql_cursor.execute("SELECT 1")
+    mysql_cursor.fetchall()
+
+def estimate_collection(collection, stats, sizes, fan_out, options, rtt):
+    """
+    컬렉션 하나의 문서 수, BSON 크기, 쿼리 수, 최대 메모리, 실행 시간 예측
+
+    Args:
+        collection (str): 컬렉션명
+        stats (dict): collect_table_stats() 결과
+        sizes (tuple): measure_document_sizes() 결과
+        fan_out (dict): {'avg': 평균 자식 수, 'max': 최대 자식 수}
+        options (dict): 이관 이벤트 옵션
+        rtt (dict): {'mysql': MySQL 왕복 시간, 'mongodb': MongoDB 왕복 시간}
+
+    Returns:
+        dict: 컬렉션별 예측 결과와 권장 배치 크기
+    """
+    source = COLLECTION_SOURCES[collection]
+    parent = stats.get(source['table'], {'rows': 0, 'avg_row_bytes': 0})
+    child = stats.get(source['child'], {'rows': 0, 'avg_row_bytes': 0}) if source['child'] else None
+    base_bytes, item_bytes = sizes
+
+    documents = parent['rows']
+    doc_bytes = base_bytes + fan_out['avg'] * item_bytes
+    bson_bytes = documents * doc_bytes
+    source_bytes = parent['rows'] * parent['avg_row_bytes'] + (child['rows'] * child['avg_row_bytes'] if child else 0)
+    external = options.get('external_grouping', False) and child is not None
+
+    # 권장 배치 크기: 삽입 배치 하나가 MAX_INSERT_BATCH_BYTES를 넘지 않는 문서 수
+    insert_batch = max(1, min(BULK_WRITE_BATCH_SIZE, int(MAX_INSERT_BATCH_BYTES // doc_bytes) if doc_bytes else BULK_WRITE_BATCH_SIZE))
+    row_memory = max(parent['avg_row_bytes'], 1) * ROW_MEMORY_FACTOR
+    fetch_batch = min(MAX_FETCH_BATCH, max(MIN_FETCH_BATCH, int(options['memory_limit_mb'] * 1024 * 1024 * 0.05 // row_memory)))
+
+    # 쿼리 수: 부모 조회 + (동기 경로에서는) 부모마다 자식 조회 + 자식마다 리뷰 여부 조회
+    parent_queries = math.ceil(parent['rows'] / fetch_batch) + 1 if options.get('adaptive_batching') else 1
+    if external:
+        queries = 2
+    elif child:
+        queries = parent_queries + parent['rows'] + child['rows'] * source['per_child_queries']
+    else:
+        queries = parent_queries
+    insert_batches = math.ceil(documents / insert_batch) if documents else 0
+
+    # 메모리: 메모리 내 경로는 전체 행과 문서를 함께 유지, 외부 정렬 경로는 런 하나와 삽입 배치만 유지
+    if external:
+        run_rows = options.get('spill_run_rows') or _default_spill_run_rows()
+        peak_bytes = (run_rows * max(child['avg_row_bytes'], parent['avg_row_bytes']) * ROW_MEMORY_FACTOR
+                      + insert_batch * doc_bytes * DOC_MEMORY_FACTOR)
+    else:
+        peak_bytes = source_bytes * ROW_MEMORY_FACTOR + bson_bytes * DOC_MEMORY_FACTOR
+
+    # 시간: 쿼리 왕복 + 전송 + 문서 변환 + 삽입 왕복
+    concurrency = options.get('concurrency', 8) if options.get('execution') == 'async' else 1
+    seconds = (queries * rtt['mysql'] / concurrency
+               + (source_bytes + bson_bytes) / TRANSFER_BYTES_PER_SECOND
+               + documents * DOC_BUILD_SECONDS
+               + insert_batches * rtt['mongodb'] / concurrency)
+    throttle = options.get('throttle') or {}
+    if throttle.get('max_queries_per_sec'):
+        seconds = max(seconds, queries / throttle['max_queries_per_sec'])
+    if throttle.get('max_rows_per_sec'):
+        seconds = max(seconds, (parent['rows'] + (child['rows'] if child else 0)) / throttle['max_rows_per_sec'])
+    if collection == 'Customers' and options.get('hash_passwords'):
+        workers = options.get('hash_workers') or os.cpu_count() or 1
+        hash_seconds = documents * BCRYPT_SECONDS_AT_10_ROUNDS * 2 ** (options.get('hash_rounds', 10) - 10) / workers
+        seconds = max(seconds, hash_seconds)  # 해싱은 조회/삽입과 겹쳐서 진행되므로 더 긴 쪽이 전체 시간
+
+    estimate = {
+        'mysql_rows': parent['rows'],
+        'child_rows': child['rows'] if child else 0,
+        'documents': documents,
+        'avg_doc_bytes': int(doc_bytes),
+        'bson_mb': round(bson_bytes / (1024 * 1024), 1),
+        'queries': queries,
+        'insert_batches': insert_batches,
+        'peak_memory_mb': round(peak_bytes / (1024 * 1024), 1),
+        'estimated_seconds': round(seconds, 1),
+        'path': 'external_grouping' if external else 'in_memory',
+        'recommended_fetch_batch': fetch_batch,
+        'recommended_insert_batch': insert_batch
+    }
+    if child:
+        estimate['fan_out'] = {'avg': round(fan_out['avg'], 2), 'max': fan_out['max']}
+        estimate['max_doc_bytes'] = int(base_bytes + fan_out['max'] * item_bytes)
+        if external:
+            estimate['spill_mb'] = round(source_bytes / (1024 * 1024), 1)
+    return estimate
+
+def _default_spill_run_rows():
+    from external_grouping import DEFAULT_SPILL_RUN_ROWS  # 외부 정렬 옵션을 예측할 때만 필요하므로 지연 import
+    return DEFAULT_SPILL_RUN_ROWS
+
+def split_collections(estimates, groups):
+    """예측 시간이 긴 컬렉션부터 현재 가장 짧은 그룹에 배정 (LPT 방식)"""
+    buckets = [{'collections': [], 'estimated_seconds': 0.0} for _ in range(groups)]
+    for collection, estimate in sorted(estimates.items(), key=lambda item: -item[1]['estimated_seconds']):
+        bucket = min(buckets, key=lambda b: b['estimated_seconds'])
+        bucket['collections'].append(collection)
+        bucket['estimated_seconds'] += estimate['estimated_seconds']
+    return [bucket for bucket in buckets if bucket['collections']]
+
+def recommend(estimates, options, baseline_mb):
+    """
+    예측 결과로 실행 방식 권장 (외부 정렬, 병렬 조회 수, Lambda 호출 분할)
+
+    Returns:
+        tuple: (권장 이벤트 옵션 dict, 경고 목록)
+    """
+    recommendations = {}
+    warnings = []
+    # lambda_handler와 같은 조건: 외부 정렬 경로는 mode='full', purchase_summaries 없음, 동기 실행에서만 허용
+    external_allowed = (options.get('mode', 'full') != 'incremental' and not options.get('purchase_summaries')
+                        and options.get('execution', 'sync') != 'async')
+    memory_limit_mb = options['memory_limit_mb']
+    usable_memory_mb = memory_limit_mb * MEMORY_PRESSURE_RATIO - baseline_mb
+    time_budget = options['time_limit_seconds'] * TIME_SAFETY_RATIO
+
+    # 메모리 내 경로로 예산을 넘는 부모/자식 컬렉션은 외부 정렬 경로 권장
+    over_memory = [collection for collection, estimate in estimates.items()
+                   if estimate['path'] == 'in_memory' and estimate['peak_memory_mb'] > usable_memory_mb]
+    if over_memory:
+        if not external_allowed:
+            warnings.append(f"메모리 예산({memory_limit_mb}MB) 초과 예상: {over_memory} - 외부 정렬 경로는 "
+                            f"mode='full'이고 purchase_summaries가 없는 동기 실행에서만 사용할 수 있으므로 Lambda 메모리 증설 필요")
+        elif all(COLLECTION_SOURCES[collection]['child'] for collection in over_memory):
+            recommendations['external_grouping'] = True
+            # 런 하나가 사용 가능한 메모리의 1/4 이내가 되는 행 수
+            row_bytes = max(estimates[collection]['avg_doc_bytes'] for collection in over_memory) or 1
+            recommendations['spill_run_rows'] = max(1000, int(usable_memory_mb * 1024 * 1024 / 4 // (row_bytes * ROW_MEMORY_FACTOR)))
+        else:
+            warnings.append(f"메모리 예산({memory_limit_mb}MB) 초과 예상: {over_memory} - Lambda 메모리 증설 필요")
+
+    for collection, estimate in estimates.items():
+        if estimate.get('max_doc_bytes', 0) > MAX_DOCUMENT_BYTES / 2:
+            hint = " - archive_ordered_cart 사용 권장" if collection == 'Customers' else ""
+            warnings.append(f"{collection} 최대 문서 크기 {estimate['max_doc_bytes']}바이트가 16MB 상한에 근접{hint}")
+        if estimate.get('spill_mb', 0) > DEFAULT_EPHEMERAL_STORAGE_MB * MEMORY_PRESSURE_RATIO:
+            warnings.append(f"{collection} 외부 정렬 런 파일 {estimate['spill_mb']}MB - Lambda 임시 저장소 확장 필요")
+
+    # 시간: 병렬 조회 수를 1부터 늘려 제한 시간 안에 들어오는 최소값 선택 (동시 실행 메모리 합도 예산 이내)
+    sequential_seconds = sum(estimate['estimated_seconds'] for estimate in estimates.values())
+    if sequential_seconds > time_budget and options.get('execution') != 'async':
+        for readers in range(2, len(estimates) + 1):
+            groups = split_collections(estimates, readers)
+            concurrent_memory = sum(sorted((estimate['peak_memory_mb'] for estimate in estimates.values()),
+                                           reverse=True)[:readers])
+            if max(group['estimated_seconds'] for group in groups) <= time_budget and concurrent_memory <= usable_memory_mb:
+                recommendations['parallel_readers'] = readers
+                break
+
+    # 병렬 조회로도 부족하면 컬렉션을 여러 Lambda 호출로 분할
+    if sequential_seconds > time_budget and 'parallel_readers' not in recommendations:
+        invocations = max(1, math.ceil(sequential_seconds / time_budget))
+        plan = split_collections(estimates, min(invocations, len(estimates)))
+        recommendations['invocations'] = [group['collections'] for group in plan]
+        for group in plan:
+            if group['estimated_seconds'] > time_budget:
+                warnings.append(f"{group['collections']} 단독 실행도 제한 시간 초과 예상 "
+                                f"({group['estimated_seconds']:.0f}초) - adaptive_batching/external_grouping 및 "
+                                f"Step Functions 등 장시간 실행 환경 검토 필요")
+
+    # 부모마다 자식 조회를 반복하는 경로의 쿼리 수가 많으면 쿼리 2개로 끝나는 외부 정렬 경로 권장
+    if external_allowed and any(estimate['path'] == 'in_memory' and estimate['queries'] > PER_PARENT_QUERY_THRESHOLD
+                         for estimate in estimates.values()):
+        recommendations.setdefault('external_grouping', True)
+
+    if any(estimate['recommended_insert_batch'] < BULK_WRITE_BATCH_SIZE for estimate in estimates.values()):
+        recommendations.setdefault('adaptive_batching', True)
+
+    return recommendations, warnings
+
+def plan_migration(mysql_cursor, mongodb, database, collections, options=None, time_limit_seconds=None):
+    """
+    실제 이관 없이 테이블 통계와 표본 문서로 컬렉션별 비용을 예측하고 실행 옵션을 권장 (dry-run)
+
+    Args:
+        mysql_cursor: MySQL 커서 객체 (읽기 쿼리만 실행)
+        mongodb: MongoDB 데이터베이스 객체 (ping으로 왕복 시간만 측정, 쓰기 없음)
+        database (str): MySQL 스키마명
+        collections (list): 이관 대상 컬렉션 목록
+        options (dict): lambda_handler 이벤트 옵션 (execution, adaptive_batching, external_grouping 등)
+        time_limit_seconds (float): 실행 제한 시간 (없으면 Lambda 최대 실행 시간)
+
+    Returns:
+        dict: 컬렉션별 예측(estimates), 전체 합계(totals), 권장 옵션(recommendations), 경고(warnings)
+    """
+    options = dict(options or {})
+    lambda_memory = os.environ.get('AWS_LAMBDA_FUNCTION_MEMORY_SIZE')
+    options.setdefault('memory_limit_mb', options.get('memory_budget_mb')
+                       or (int(lambda_memory) if lambda_memory else DEFAULT_MEMORY_BUDGET_MB))
+    options['time_limit_seconds'] = time_limit_seconds or LAMBDA_MAX_SECONDS
+
+    logger.info(f"이관 계획 수립 시작 (dry-run): {collections}")
+    stats = collect_table_stats(mysql_cursor, database)
+    rtt = {
+        'mysql': measure_round_trip(lambda: mysql_ping(mysql_cursor)),
+        'mongodb': measure_round_trip(lambda: mongodb.command('ping'))
+    }
+
+    estimates = {}
+    for collection in collections:
+        source = COLLECTION_SOURCES[collection]
+        fan_out = {'avg': 0, 'max': 0}
+        if source['child']:
+            parent_rows = stats.get(source['table'], {}).get('rows', 0)
+            child_rows = stats.get(source['child'], {}).get('rows', 0)
+            fan_out = {'avg': child_rows / parent_rows if parent_rows else 0,
+                       'max': max_fan_out(mysql_cursor, source['child'], source['child_key'])}
+        sizes = measure_document_sizes(mysql_cursor, collection)
+        estimates[collection] = estimate_collection(collection, stats, sizes, fan_out, options, rtt)
+
+    baseline_mb = current_rss_mb()
+    recommendations, warnings = recommend(estimates, options, baseline_mb)
+
+    parallel_readers = min(options.get('parallel_readers', 1), len(collections))
+    if parallel_readers > 1:
+        groups = split_collections(estimates, parallel_readers)
+        estimated_seconds = max(group['estimated_seconds'] for group in groups)
+        peak_memory_mb = sum(sorted((e['peak_memory_mb'] for e in estimates.values()), reverse=True)[:parallel_readers])
+    else:
+        estimated_seconds = sum(e['estimated_seconds'] for e in estimates.values())
+        peak_memory_mb = max((e['peak_memory_mb'] for e in estimates.values()), default=0)
+
+    plan = {
+        'dry_run': True,
+        'round_trip_ms': {name: round(seconds * 1000, 2) for name, seconds in rtt.items()},
+        'estimates': estimates,
+        'totals': {
+            'documents': sum(e['documents'] for e in estimates.values()),
+            'bson_mb': round(sum(e['bson_mb'] for e in estimates.values()), 1),
+            'queries': sum(e['queries'] for e in estimates.values()),
+            'peak_memory_mb': round(baseline_mb + peak_memory_mb, 1),
+            'memory_limit_mb': options['memory_limit_mb'],
+            'estimated_seconds': round(estimated_seconds, 1),
+            'time_limit_seconds': options['time_limit_seconds']
+        },
+        'recommendations': recommendations,
+        'warnings': warnings
+    }
+    logger.info(f"이관 계획 수립 완료: {plan['totals']}, 권장 옵션: {recommendations}")
+    return plan
@@ -0,0 +1,120 @@
+import collections                  # 해싱 진행 중인 배치 대기열 (deque)
+import logging                      # 구조화된 로깅 시스템 (CloudWatch 로그 출력용)
+import os                           # 사용 가능한 CPU 코어 수 확인
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor  # 해싱 작업자 풀
+
+logger = logging.getLogger()
+
+# 웹(myShop_NoSQL/auth.js)의 saltRounds와 같은 bcrypt 작업 계수
+# 웹은 bcrypt.compare()로 로그인하므로 이관 시에도 같은 bcrypt 형식으로 해싱해야 함
+BCRYPT_ROUNDS = 10
+
+# 작업자 하나에 한 번에 넘기는 비밀번호 수
+HASH_BATCH_SIZE = 64
+
+# 이미 bcrypt로 해싱된 값의 접두어 (MySQL 웹에서 가입한 고객은 해싱된 비밀번호가 저장되어 있음)
+BCRYPT_PREFIXES = ('$2a$', '$2b$', '$2y$')
+
+def is_bcrypt_hash(value):
+    """bcrypt 해시 문자열인지 확인 (60자, $2a$/$2b$/$2y$ 접두어)"""
+    return isinstance(value, str) and len(value) == 60 and value.startswith(BCRYPT_PREFIXES)
+
+def hash_passwords(passwords, rounds=BCRYPT_ROUNDS):
+    """
+    비밀번호 목록을 bcrypt로 해싱 (프로세스 풀 작업자에서 실행되므로 모듈 최상위 함수로 정의)
+
+    Args:
+        passwords (list): (평문 비밀번호, 기존 MongoDB 해시 또는 None) 목록
+        rounds (int): bcrypt 작업 계수
+
+    Returns:
+        list: 해싱된 비밀번호 목록 (입력과 같은 순서)
+
+    Note:
+        - 이미 bcrypt 해시인 값은 그대로 유지
+        - 기존 해시가 같은 평문으로 검증되면 기존 해시를 유지하여 증분 이관 시 불필요한 변경을 만들지 않음
+    """
+    import bcrypt  # 해싱 옵션을 사용할 때만 필요하므로 지연 import
+
+    hashed = []
+    for plain, stored_hash in passwords:
+        if plain is None or is_bcrypt_hash(plain):
+            hashed.append(plain)
+        elif stored_hash and is_bcrypt_hash(stored_hash) and bcrypt.checkpw(plain.encode('utf-8'), stored_hash.encode('utf-8')):
+            hashed.append(stored_hash)
+        else:
+            hashed.append(bcrypt.hashpw(plain.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8'))
+    return hashed
+
+class PasswordHashingStage:
+    """
+    Customers 문서의 passwd를 작업자 풀에서 bcrypt로 해싱하는 파이프라인 단계
+    문서를 HASH_BATCH_SIZE씩 작업자에 넘기고, 해싱이 끝난 배치는 들어온 순서대로 sink에 전달하므로
+    MySQL 조회/문서 조립 및 MongoDB 삽입과 해싱이 겹쳐서 진행됨
+
+    Args:
+        workers (int): 작업자 수 (기본값: CPU 코어 수)
+        rounds (int): bcrypt 작업 계수
+        stored_hashes (dict): 증분 이관 시 고객ID별 기존 MongoDB passwd (검증되면 재사용)
+
+    Note:
+        AWS Lambda처럼 프로세스 풀을 만들 수 없는 환경에서는 스레드 풀로 대체
+        (bcrypt는 해싱 중 GIL을 해제하므로 스레드로도 여러 코어를 사용)
+    """
+
+    def __init__(self, workers=None, rounds=BCRYPT_ROUNDS, stored_hashes=None):
+        import bcrypt  # noqa: F401 - 작업자에서 실패하기 전에 의존성 누락을 바로 알림
+
+        self.workers = workers or os.cpu_count() or 1
+        self.rounds = rounds
+        self.stored_hashes = stored_hashes or {}
+        try:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        except OSError as e:
+            logger.warning(f"비밀번호 해싱 프로세스 풀 생성 실패, 스레드 풀 사용: {e}")
+            self.executor = ThreadPoolExecutor(max_workers=self.workers)
+        self.buffer = []
+        self.pending = collections.deque()  # (문서 배치, future) - 제출 순서 유지
+        self.sink = None
+        self.hashed = 0
+
+    def load_stored_hashes(self, collection):
+        """증분 이관 시 기존 Customers 문서의 passwd를 불러와 같은 평문이면 재사용"""
+        self.stored_hashes = {doc['_id']: doc.get('passwd') for doc in collection.find({}, {'passwd': 1})}
+
+    def start(self, sink):
+        """해싱이 끝난 문서 배치를 받을 함수 지정 (sink(docs))"""
+        self.sink = sink
+        self.buffer = []
+        self.pending.clear()
+
+    def add(self, doc):
+        """문서를 해싱 대기열에 추가"""
+        self.buffer.append(doc)
+        if len(self.buffer) >= HASH_BATCH_SIZE:
+            self._submit()
+
+    def _submit(self):
+        docs, self.buffer = self.buffer, []
+        passwords = [(doc['passwd'], self.stored_hashes.get(doc['_id'])) for doc in docs]
+        self.pending.append((docs, self.executor.submit(hash_passwords, passwords, self.rounds)))
+        # 모든 작업자가 쉬지 않을 만큼만 미리 제출하고, 그 이상 쌓이면 가장 오래된 배치부터 완료 대기
+        while len(self.pending) > self.workers * 2:
+            self._drain_one()
+
+    def _drain_one(self):
+        docs, future = self.pending.popleft()
+        for doc, hashed in zip(docs, future.result()):
+            doc['passwd'] = hashed
+        self.hashed += len(docs)
+        self.sink(docs)
+
+    def finish(self):
+        """남은 문서를 모두 해싱하여 sink로 전달"""
+        if self.buffer:
+            self._submit()
+        while self.pending:
+            self._drain_one()
+
+    def shutdown(self):
+        self.executor.shutdown()
@@ -0,0 +1,383 @@
+import bisect                       # 문자열 키 문자의 순위 조회 (키 범위 보간)
+import math                         # Wilson 신뢰구간 계산
+import os                           # MIN/MAX 키의 공통 접두어 계산 (os.path.commonprefix)
+import random                       # 층별 무작위 표본 키 위치 선택
+import string                       # 문자열 키 문자 종류 확장 (숫자, 영문 소문자/대문자)
+import logging                      # 구조화된 로깅 시스템 (CloudWatch 로그 출력용)
+from statistics import NormalDist   # 신뢰수준에 대응하는 정규분포 z 값
+
+# 기대 문서는 실제 이관(index.py)과 같은 build_* 함수로 다시 만들어야 비교 결과가 의미 있음
+from index import (
+    VOLATILE_FIELDS,
+    build_customer_doc,
+    build_order_doc,
+    build_order_item_doc,
+    build_product_doc,
+    build_review_doc,
+    deterministic_object_id,
+    fields_differ
+)
+from password_hashing import is_bcrypt_hash
+
+logger = logging.getLogger()
+
+# 컬렉션별 기본 표본 크기와 층(키 범위) 수
+# 표본 1000개에서 불일치가 0이면 95% 신뢰수준 오류율 상한은 약 0.4% (데이터 크기와 무관)
+DEFAULT_SAMPLE_SIZE = 1000
+DEFAULT_STRATA = 10
+DEFAULT_CONFIDENCE = 0.95
+
+# MySQL IN 조회 및 MongoDB $in 조회 한 번에 넣을 키 수
+LOOKUP_BATCH_SIZE = 500
+
+# 결과에 남길 불일치 예시 수
+MAX_MISMATCH_EXAMPLES = 20
+
+# 문자열 키를 수치로 보간할 때 사용할 앞부분 글자 수와 문자 집합을 모을 양 끝 키 수
+STRING_KEY_PREFIX_CHARS = 8
+ALPHABET_SCOUT_ROWS = 100
+
+# 층마다 이미 뽑힌 키가 다시 나왔을 때 추가로 시도할 배수
+SEEK_ATTEMPT_FACTOR = 3
+
+# 컬렉션별 표본 추출 기준
+# - table/key: 표본 키를 뽑을 MySQL 테이블과 기본키 (키 범위로 층을 나눔)
+# - mongo_key: MongoDB 문서를 찾을 필드, to_mongo_key: MySQL 키를 mongo_key 값으로 변환
+# - array_field/item_key: 비교 전 item_key 순으로 정렬할 내장 배열 (MySQL 조회 순서와 무관하게 비교)
+VALIDATION_SOURCES = {
+    'Products': {'table': 'Products', 'key': 'prod_cd', 'mongo_key': '_id'},
+    'Customers': {'table': 'Customers', 'key': 'cust_id', 'mongo_key': '_id',
+                  'array_field': 'cart', 'item_key': 'cart_seq_no'},
+    # 이전 버전에서 이관된 Orders 문서는 _id가 임의의 ObjectId이므로 ord_no로 조회하고 _id는 비교하지 않음
+    'Orders': {'table': 'Orders', 'key': 'ord_no', 'mongo_key': 'ord_no',
+               'array_field': 'items', 'item_key': 'ord_item_no', 'ignore': {'_id'}},
+    'Reviews': {'table': 'Prod_evals', 'key': 'eval_seq_no', 'mongo_key': '_id',
+                'to_mongo_key': deterministic_object_id},
+}
+
+class KeyCodec:
+    """
+    키 범위를 균등하게 나누기 위해 키를 수치로, 수치를 탐색 시작 키로 변환
+
+    Args:
+        alphabets (list): 문자열 키의 글자 위치별 문자 목록 (None이면 정수 키)
+
+    Note:
+        문자열 키는 위치마다 실제로 나타나는 문자만으로 된 혼합 진법 수로 보간하므로
+        'P0001'처럼 위치별로 쓰는 문자가 다른 키에서도 탐색 위치가 실제 키 사이에 고르게 분포함
+    """
+
+    def __init__(self, alphabets=None):
+        self.alphabets = None
+        if alphabets:
+            # 대소문자 무시 콜레이션의 정렬 순서에 가깝게 배치
+            self.alphabets = [sorted(chars, key=lambda char: (char.lower(), char)) for chars in alphabets]
+            self.sort_keys = [[(char.lower(), char) for char in chars] for chars in self.alphabets]
+
+    def to_number(self, key):
+        if self.alphabets is None:
+            return key
+        number = 0
+        key = str(key)
+        for position, chars in enumerate(self.alphabets):
+            char = key[position] if position < len(key) else chars[0]
+            rank = min(bisect.bisect_left(self.sort_keys[position], (char.lower(), char)), len(chars) - 1)
+            number = number * len(chars) + rank
+        return number
+
+    def to_key(self, number):
+        if self.alphabets is None:
+            return int(number)
+        chars = []
+        number = int(number)
+        for position_chars in reversed(self.alphabets):
+            number, rank = divmod(number, len(position_chars))
+            chars.append(position_chars[rank])
+        chars.reverse()
+        # 위치별 최소 문자로 채워진 끝부분은 제거 (더 짧은 실제 키보다 뒤로 밀리지 않도록)
+        while chars and chars[-1] == self.alphabets[len(chars) - 1][0]:
+            chars.pop()
+        return ''.join(chars)
+
+def expand_char_classes(chars):
+    """관측된 문자를 같은 종류 전체로 확장 (숫자 → 0-9, 영문 소문자 → a-z, 대문자 → A-Z, 그 외 문자는 그대로)"""
+    expanded = set(chars)
+    for char_class in (string.digits, string.ascii_lowercase, string.ascii_uppercase):
+        if expanded & set(char_class):
+            expanded.update(char_class)
+    return expanded
+
+def build_key_codec(mysql_cursor, table, key, min_key, max_key):
+    """
+    정수 키는 그대로, 문자열 키는 위치별 문자 집합으로 코덱 구성
+
+    Note:
+        - MIN/MAX 키의 공통 접두어 위치는 모든 키가 같은 문자이므로 그 문자만 사용
+        - 나머지 위치는 양 끝 ALPHABET_SCOUT_ROWS개 키(인덱스 양 끝만 읽음)에 나타난 문자를
+          같은 종류 전체로 확장하여 사용 (양 끝 키에 없는 중간 값의 문자도 포함되도록)
+    """
+    if isinstance(min_key, int):
+        return KeyCodec()
+    scout_keys = [str(min_key), str(max_key)]
+    for order in ('ASC', 'DESC'):
+        mysql_cursor.execute(f"SELECT {key} FROM {table} ORDER BY {key} {order} LIMIT %s", (ALPHABET_SCOUT_ROWS,))
+        scout_keys.extend(str(value) for (value,) in mysql_cursor.fetchall())
+
+    prefix_length = len(os.path.commonprefix([str(min_key), str(max_key)]))
+    all_chars = expand_char_classes({char for scout_key in scout_keys for char in scout_key})
+    alphabets = []
+    for position in range(STRING_KEY_PREFIX_CHARS):
+        if position < prefix_length:
+            alphabets.append({str(min_key)[position]})
+        else:
+            chars = {scout_key[position] for scout_key in scout_keys if position < len(scout_key)}
+            alphabets.append(expand_char_classes(chars) if chars else all_chars)
+    return KeyCodec(alphabets)
+
+def sample_keys(mysql_cursor, table, key, sample_size, strata, rng):
+    """
+    키 범위를 strata개 구간으로 나누고 구간마다 무작위 위치에서 가장 가까운 키를 찾아 표본 추출
+
+    Args:
+        mysql_cursor: MySQL 커서 객체
+        table (str): 테이블명
+        key (str): 기본키 컬럼명
+        sample_size (int): 추출할 키 수
+        strata (int): 키 범위 구간 수
+        rng (random.Random): 난수 생성기 (seed 지정 시 같은 표본 재현)
+
+    Returns:
+        list: 중복 없는 표본 키 목록
+
+    Note:
+        - 키마다 기본키 인덱스 탐색(WHERE key >= ? ORDER BY key LIMIT 1) 한 번이므로
+          비용은 표본 크기에만 비례하고 테이블 크기와 무관함 (COUNT(*)나 OFFSET 없음)
+        - 키 간격이 큰 구간 바로 뒤의 키가 더 자주 뽑히므로 완전한 균등 표본은 아니며,
+          층을 나누어 한 구간에 표본이 몰리지 않도록 편향을 줄임
+        - 문자열 키는 양 끝 키의 위치별 문자로만 보간하므로 중간 키에만 있는 문자가 많으면 구간 경계가 약간 어긋날 수 있음
+    """
+    mysql_cursor.execute(f"SELECT MIN({key}), MAX({key}) FROM {table}")
+    min_key, max_key = mysql_cursor.fetchone()
+    if min_key is None:
+        return []
+
+    codec = build_key_codec(mysql_cursor, table, key, min_key, max_key)
+    low, high = codec.to_number(min_key), codec.to_number(max_key)
+    seek_query = f"SELECT {key} FROM {table} WHERE {key} >= %s ORDER BY {key} LIMIT 1"
+    keys = []
+    seen = set()
+    per_stratum = max(1, math.ceil(sample_size / strata))
+    for stratum in range(strata):
+        stratum_low = low + (high - low) * stratum / strata
+        stratum_high = low + (high - low) * (stratum + 1) / strata
+        found_in_stratum = 0
+        for _ in range(per_stratum * SEEK_ATTEMPT_FACTOR):
+            probe = codec.to_key(rng.uniform(stratum_low, stratum_high))
+            mysql_cursor.execute(seek_query, (probe,))
+            row = mysql_cursor.fetchone()
+            found = row[0] if row else max_key
+            if found not in seen:
+                seen.add(found)
+                keys.append(found)
+                found_in_stratum += 1
+                if found_in_stratum >= per_stratum:
+                    break
+    return keys[:sample_size]
+
+def in_clause(keys):
+    return ', '.join(['%s'] * len(keys))
+
+def build_expected_docs(mysql_cursor, collection, keys, options):
+    """
+    표본 키의 MySQL 행을 migrate_* 함수와 같은 build_* 함수로 변환한 기대 문서
+
+    Returns:
+        dict: {MySQL 키: 기대 문서}
+    """
+    placeholders = in_clause(keys)
+    if collection == 'Products':
+        mysql_cursor.execute(f"SELECT * FROM Products WHERE prod_cd IN ({placeholders})", keys)
+        return {row[0]: build_product_doc(row) for row in mysql_cursor.fetchall()}
+
+    if collection == 'Reviews':
+        mysql_cursor.execute(f"""
+            SELECT pe.eval_seq_no, pe.eval_score, pe.eval_comment, pe.cust_id,
+                   pe.prod_cd, pe.ord_item_no, c.cust_name, oi.ord_no
+            FROM Prod_evals pe
+            JOIN Customers c ON pe.cust_id = c.cust_id
+            JOIN Ord_items oi ON pe.ord_item_no = oi.ord_item_no
+            WHERE pe.eval_seq_no IN ({placeholders})
+        """, keys)
+        return {row[0]: build_review_doc(row) for row in mysql_cursor.fetchall()}
+
+    if collection == 'Customers':
+        mysql_cursor.execute(f"SELECT * FROM Customers WHERE cust_id IN ({placeholders})", keys)
+        customers = mysql_cursor.fetchall()
+        mysql_cursor.execute(f"""
+            SELECT cust_id, cart_seq_no, prod_cd, prod_size, ord_qty, ord_yn
+            FROM Carts
+            WHERE cust_id IN ({placeholders})
+            ORDER BY cust_id, cart_seq_no
+        """, keys)
+        carts = {}
+        for row in mysql_cursor.fetchall():
+            carts.setdefault(row[0], []).append(row[1:])
+        expected = {}
+        for customer in customers:
+            doc = build_customer_doc(customer, carts.get(customer[0], []))
+            if options.get('archive_ordered_cart'):
+                # 주문완료 항목은 CartHistory로 분리되므로 Customers 문서에는 미주문 항목만 남음
+                doc['cart'] = [item for item in doc['cart'] if item['ord_yn'] != 'Y']
+            expected[customer[0]] = doc
+        return expected
+
+    # Orders: 주문 + 주문상품(상품명/단가 조인, 리뷰 작성 여부)
+    mysql_cursor.execute(f"SELECT * FROM Orders WHERE ord_no IN ({placeholders})", keys)
+    orders = mysql_cursor.fetchall()
+    mysql_cursor.execute(f"""
+        SELECT oi.ord_no, oi.ord_item_no, oi.cart_seq_no, oi.prod_cd, oi.prod_size, oi.ord_qty,
+               p.prod_name, p.price, p.prod_img,
+               (SELECT COUNT(*) FROM Prod_evals pe WHERE pe.ord_item_no = oi.ord_item_no) AS review_count
+        FROM Ord_items oi
+        JOIN Products p ON oi.prod_cd = p.prod_cd
+        WHERE oi.ord_no IN ({placeholders})
+    """, keys)
+    items = {}
+    for row in mysql_cursor.fetchall():
+        items.setdefault(row[0], []).append(build_order_item_doc(row[1:9], row[9]))
+    return {order[0]: build_order_doc(order, items.get(order[0], [])) for order in orders}
+
+def differing_fields(expected, actual, source, options):
+    """기대 문서와 실제 문서에서 값이 다른 최상위 필드 목록 (휘발성/무시 필드 제외)"""
+    ignore = VOLATILE_FIELDS | source.get('ignore', set())
+    array_field, item_key = source.get('array_field'), source.get('item_key')
+    fields = []
+    for field, value in expected.items():
+        if field in ignore:
+            continue
+        stored = actual.get(field)
+        if field == 'passwd' and options.get('hash_passwords'):
+            # 해싱된 비밀번호는 솔트가 달라 값 비교가 불가능하므로 bcrypt 형식인지만 확인
+            if not is_bcrypt_hash(stored):
+                fields.append(field)
+            continue
+        if field == array_field and isinstance(stored, list):
+            value = sorted(value, key=lambda item: item[item_key])
+            stored = sorted(stored, key=lambda item: item.get(item_key) if isinstance(item, dict) else 0)
+        if fields_differ(value, stored):
+            fields.append(field)
+    return fields
+
+def wilson_interval(errors, n, confidence=DEFAULT_CONFIDENCE):
+    """
+    이항 비율의 Wilson 점수 신뢰구간 (표본이 작거나 오류가 0건이어도 0~1 범위 안의 상한을 제공)
+
+    Returns:
+        tuple: (하한, 상한)
+    """
+    if n == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+    p = errors / n
+    denominator = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+def validate_collection_sample(mysql_cursor, mongodb, collection, sample_size=DEFAULT_SAMPLE_SIZE,
+                               strata=DEFAULT_STRATA, confidence=DEFAULT_CONFIDENCE, options=None, rng=None):
+    """
+    컬렉션 하나를 표본 추출로 검증
+
+    Args:
+        mysql_cursor: MySQL 커서 객체
+        mongodb: MongoDB 데이터베이스 객체
+        collection (str): 'Products', 'Customers', 'Orders', 'Reviews' 중 하나
+        sample_size (int): 표본 크기
+        strata (int): 키 범위 층 수
+        confidence (float): 신뢰수준 (예: 0.95)
+        options (dict): 이관 옵션 (archive_ordered_cart, hash_passwords - 기대 문서 구성에 반영)
+        rng (random.Random): 난수 생성기
+
+    Returns:
+        dict: 표본 수, 불일치 문서 수, 오류율 추정치와 신뢰구간, 필드별 불일치 수, 불일치 예시
+    """
+    options = options or {}
+    rng = rng or random.Random()
+    source = VALIDATION_SOURCES[collection]
+    to_mongo_key = source.get('to_mongo_key', lambda key: key)
+
+    keys = sample_keys(mysql_cursor, source['table'], source['key'], sample_size, strata, rng)
+    missing = 0
+    mismatched = 0
+    field_mismatches = {}
+    examples = []
+
+    for offset in range(0, len(keys), LOOKUP_BATCH_SIZE):
+        batch_keys = keys[offset:offset + LOOKUP_BATCH_SIZE]
+        expected_docs = build_expected_docs(mysql_cursor, collection, batch_keys, options)
+        mongo_keys = {to_mongo_key(key): key for key in expected_docs}
+        actual_docs = {doc[source['mongo_key']]: doc
+                       for doc in mongodb[collection].find({source['mongo_key']: {'$in': list(mongo_keys)}})}
+
+        for mongo_key, key in mongo_keys.items():
+            actual = actual_docs.get(mongo_key)
+            if actual is None:
+                missing += 1
+                mismatched += 1
+                if len(examples) < MAX_MISMATCH_EXAMPLES:
+                    examples.append({'key': str(key), 'missing': True})
+                continue
+            fields = differing_fields(expected_docs[key], actual, source, options)
+            if fields:
+                mismatched += 1
+                for field in fields:
+                    field_mismatches[field] = field_mismatches.get(field, 0) + 1
+                if len(examples) < MAX_MISMATCH_EXAMPLES:
+                    examples.append({'key': str(key), 'fields': fields})
+
+    sampled = len(keys)
+    lower, upper = wilson_interval(mismatched, sampled, confidence)
+    result = {
+        'sampled': sampled,
+        'mismatched': mismatched,
+        'missing': missing,
+        'error_rate': round(mismatched / sampled, 6) if sampled else None,
+        'confidence': confidence,
+        'error_rate_lower': round(lower, 6),
+        'error_rate_upper': round(upper, 6),
+        'field_mismatches': field_mismatches,
+        'examples': examples
+    }
+    logger.info(f"{collection} 표본 검증: {sampled}개 중 불일치 {mismatched}개 "
+                f"(오류율 {confidence:.0%} 신뢰구간 {lower:.4%} ~ {upper:.4%})")
+    return result
+
+def validate_migration_by_sampling(mysql_cursor, mongodb, collections, sample_size=DEFAULT_SAMPLE_SIZE,
+                                   strata=DEFAULT_STRATA, confidence=DEFAULT_CONFIDENCE, options=None, seed=None):
+    """
+    대용량 컬렉션을 전체 비교 대신 층화 표본으로 검증 (비용은 표본 크기에만 비례)
+
+    Args:
+        mysql_cursor: MySQL 커서 객체
+        mongodb: MongoDB 데이터베이스 객체
+        collections (list): 검증할 컬렉션 목록
+        sample_size (int): 컬렉션별 표본 크기
+        strata (int): 키 범위 층 수
+        confidence (float): 신뢰수준
+        options (dict): 이관 옵션 (archive_ordered_cart, hash_passwords)
+        seed (int): 난수 seed (지정 시 같은 표본으로 재검증 가능)
+
+    Returns:
+        dict: 컬렉션별 표본 검증 결과와 전체 통과 여부 (모든 표본이 일치하면 passed=True)
+    """
+    logger.info(f"표본 검증 시작: {collections} (컬렉션별 {sample_size}개, {strata}개 층)")
+    rng = random.Random(seed)
+    results = {}
+    for collection in collections:
+        if collection in VALIDATION_SOURCES:
+            results[collection] = validate_collection_sample(mysql_cursor, mongodb, collection, sample_size, strata,
+                                                             confidence, options, rng)
+    results['passed'] = all(result['mismatched'] == 0 for result in results.values())
+    results['seed'] = seed
+    return results
@@ -0,0 +1,123 @@
+import re                           # 검색어/상품명 정규화 (공백 및 특수문자 제거)
+import unicodedata                  # 전각/반각 및 호환 문자 통일 (NFKC)
+
+# MongoDB 기본 text 인덱스는 공백 단위로만 토큰을 나누어 '티셔츠'로 '기본티셔츠'를 찾지 못하므로
+# 상품명/소재/유형을 글자 n-gram과 초성으로 미리 분해하여 search_tokens 배열에 저장하고 일반(multikey) 인덱스로 조회
+
+# 저장할 n-gram 길이 (1글자 검색어는 unigram, 2글자는 bigram, 3글자 이상은 trigram으로 조회)
+SEARCH_NGRAM_SIZES = (1, 2, 3)
+
+# 한글 음절(가~힣)의 초성 19자 (유니코드 순서)
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+JUNGSUNG_JONGSUNG_COUNT = 21 * 28  # 초성 하나당 음절 수 (중성 21 x 종성 28)
+
+# NFKC는 호환 자모(ㄱ, U+3131)를 첫가끝 초성(U+1100)으로 바꾸므로 초성 검색어를 다시 호환 자모로 되돌림
+CONJOINING_TO_CHOSUNG = {0x1100 + index: char for index, char in enumerate(CHOSUNG)}
+
+# 검색 대상에서 제외할 문자 (한글 음절/자모, 영문, 숫자만 유지)
+NON_SEARCHABLE = re.compile(r'[^0-9a-z가-힣ㄱ-ㅎ]+')
+
+def normalize_search_text(text):
+    """NFKC 정규화 + 소문자 변환 후 한글/영문/숫자 외 문자(공백 포함) 제거"""
+    if not text:
+        return ""
+    text = unicodedata.normalize('NFKC', str(text)).translate(CONJOINING_TO_CHOSUNG)
+    return NON_SEARCHABLE.sub('', text.lower())
+
+def to_chosung(text):
+    """한글 음절을 초성으로 바꾼 문자열 반환 (예: '티셔츠' → 'ㅌㅅㅊ', 한글 외 문자는 그대로)"""
+    chars = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_SYLLABLE_START <= code <= HANGUL_SYLLABLE_END:
+            chars.append(CHOSUNG[(code - HANGUL_SYLLABLE_START) // JUNGSUNG_JONGSUNG_COUNT])
+        else:
+            chars.append(char)
+    return ''.join(chars)
+
+def ngrams(text, size):
+    """문자열의 글자 n-gram 목록 (문자열이 n보다 짧으면 빈 목록)"""
+    return [text[start:start + size] for start in range(len(text) - size + 1)]
+
+def build_search_tokens(*values):
+    """
+    상품명/소재/유형 등의 값에서 검색 토큰 목록 생성
+
+    Args:
+        values: 토큰화할 문자열 값들 (None은 무시)
+
+    Returns:
+        list: 정렬된 중복 없는 토큰 목록 (정규화 문자열과 초성 문자열의 1~3글자 n-gram)
+
+    Note:
+        정렬된 결과를 반환하므로 같은 입력이면 항상 같은 배열이 되어 증분 이관 시 불필요한 변경이 생기지 않음
+    """
+    tokens = set()
+    for value in values:
+        text = normalize_search_text(value)
+        for variant in {text, to_chosung(text)}:
+            for size in SEARCH_NGRAM_SIZES:
+                tokens.update(ngrams(variant, size))
+    return sorted(tokens)
+
+def build_search_query(query):
+    """
+    검색어를 search_tokens 인덱스 조회 조건으로 변환
+
+    Args:
+        query (str): 사용자 검색어 (예: '티셔츠', 'ㅌㅅㅊ', '면 100')
+
+    Returns:
+        dict: MongoDB 필터 (검색어가 비어 있으면 None)
+
+    Note:
+        검색어의 n-gram이 모두 포함된 문서만 찾으므로 인덱스만으로 후보를 좁히고,
+        n-gram 위치까지 맞는지는 search_products에서 다시 확인
+    """
+    text = normalize_search_text(query)
+    if not text:
+        return None
+    size = min(len(text), max(SEARCH_NGRAM_SIZES))
+    return {'search_tokens': {'$all': sorted(set(ngrams(text, size)))}}
+
+def matches_search_text(product, query_text, fields=('prod_name', 'material', 'prod_type')):
+    """상품 문서의 필드 중 하나가 정규화된 검색어(또는 그 초성)를 연속된 문자열로 포함하는지 확인"""
+    for field in fields:
+        text = normalize_search_text(product.get(field))
+        if query_text in text or query_text in to_chosung(text):
+            return True
+    return False
+
+def search_products(collection, query, limit=20, projection=None):
+    """
+    search_tokens 인덱스로 상품 검색
+
+    Args:
+        collection: MongoDB Products 컬렉션
+        query (str): 사용자 검색어
+        limit (int): 최대 반환 상품 수
+        projection (dict): 반환 필드 포함 목록 (prod_name/material/prod_type은 재확인용으로 항상 포함)
+
+    Returns:
+        list: 검색어를 포함하는 상품 문서 목록
+
+    Example:
+        search_products(mongodb.Products, '티셔츠')   # '기본 티셔츠', '오버핏티셔츠' 모두 검색
+        search_products(mongodb.Products, 'ㄱㅂ')     # 초성 검색 ('기본 티셔츠')
+    """
+    mongo_filter = build_search_query(query)
+    if mongo_filter is None:
+        return []
+    if projection is not None:
+        projection = dict(projection, prod_name=1, material=1, prod_type=1)
+
+    query_text = normalize_search_text(query)
+    results = []
+    for product in collection.find(mongo_filter, projection):
+        if matches_search_text(product, query_text):
+            results.append(product)
+            if len(results) >= limit:
+                break
+    return results
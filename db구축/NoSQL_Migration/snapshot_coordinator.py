@@ -0,0 +1,148 @@
+import logging                      # 구조화된 로깅 시스템 (CloudWatch 로그 출력용)
+import random                       # gtid 재시도 대기 시간 지터 (주기적인 커밋과 시점이 계속 겹치지 않도록)
+import time                         # gtid 재시도 사이 대기
+import mysql.connector              # MySQL 데이터베이스 연결 및 쿼리 실행을 위한 공식 드라이버
+
+logger = logging.getLogger()
+
+# 스냅샷 시점 맞추기 방식
+# - ftwrl: FLUSH TABLES WITH READ LOCK으로 쓰기를 잠시 막은 상태에서 모든 연결의 스냅샷 시작 (RELOAD 권한 필요)
+# - gtid: 모든 스냅샷 시작 전후의 gtid_executed가 같을 때까지 재시도 (RDS 등 FTWRL 불가 환경, GTID 모드 필요)
+# - auto: ftwrl을 먼저 시도하고 권한 오류 시 gtid로 대체
+SNAPSHOT_STRATEGIES = ('auto', 'ftwrl', 'gtid')
+
+# gtid 방식에서 스냅샷 시작 중 커밋이 끼어들었을 때 재시도 설정
+# - 커밋이 계속 들어오는 서버에서도 커밋 사이의 빈 구간을 잡도록 재시도마다 0초 ~ 지수적으로 늘어나는 상한
+#   (GTID_RETRY_MAX_SECONDS) 사이의 임의 시간만큼 대기
+GTID_SNAPSHOT_MAX_ATTEMPTS = 30
+GTID_RETRY_BASE_SECONDS = 0.05
+GTID_RETRY_MAX_SECONDS = 2
+
+def start_snapshot(conn):
+    """읽기 전용 REPEATABLE READ 일관된 스냅샷 트랜잭션 시작"""
+    conn.start_transaction(consistent_snapshot=True, isolation_level='REPEATABLE READ', readonly=True)
+
+def query_scalar(conn, query):
+    """단일 값을 반환하는 쿼리 실행"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(query)
+        return cursor.fetchone()[0]
+    finally:
+        cursor.close()
+
+def snapshot_with_global_lock(lock_conn, connections):
+    """
+    전역 읽기 잠금을 건 상태에서 모든 연결의 스냅샷을 시작
+
+    Args:
+        lock_conn: 잠금 전용 MySQL 연결 (UNLOCK TABLES가 작업자 트랜잭션에 영향을 주지 않도록 분리)
+        connections (list): 스냅샷을 시작할 MySQL 연결 목록
+
+    Returns:
+        str: 스냅샷 시점의 gtid_executed (GTID 모드가 아니면 빈 문자열)
+
+    Note:
+        잠금은 연결 수만큼의 START TRANSACTION 동안만 유지되므로 쓰기 차단 시간은 수 밀리초 수준
+        (단, 장시간 실행 중인 쿼리가 있으면 FTWRL 자체가 그 쿼리 종료까지 대기)
+    """
+    lock_cursor = lock_conn.cursor()
+    lock_cursor.execute("FLUSH TABLES WITH READ LOCK")
+    try:
+        for conn in connections:
+            start_snapshot(conn)
+        lock_cursor.execute("SELECT @@GLOBAL.gtid_executed")
+        return lock_cursor.fetchone()[0]
+    finally:
+        lock_cursor.execute("UNLOCK TABLES")
+        lock_cursor.close()
+
+def snapshot_with_gtid_check(connections, max_attempts=GTID_SNAPSHOT_MAX_ATTEMPTS):
+    """
+    잠금 없이 모든 연결의 스냅샷을 시작하고, 그 사이 커밋된 트랜잭션이 없는지 gtid_executed로 확인
+
+    Args:
+        connections (list): 스냅샷을 시작할 MySQL 연결 목록
+        max_attempts (int): 최대 재시도 횟수
+
+    Returns:
+        tuple: (스냅샷 시점의 gtid_executed, 시도 횟수)
+
+    Raises:
+        RuntimeError: GTID 모드가 아니거나 max_attempts 안에 같은 시점을 잡지 못한 경우
+    """
+    if query_scalar(connections[0], "SELECT @@GLOBAL.gtid_mode") != 'ON':
+        raise RuntimeError("gtid 스냅샷 방식은 gtid_mode=ON인 서버에서만 사용할 수 있습니다")
+
+    for attempt in range(1, max_attempts + 1):
+        before = query_scalar(connections[0], "SELECT @@GLOBAL.gtid_executed")
+        for conn in connections:
+            start_snapshot(conn)
+        # 전역 변수는 스냅샷과 무관하게 현재 값을 반환하므로 트랜잭션 안에서도 조회 가능
+        after = query_scalar(connections[0], "SELECT @@GLOBAL.gtid_executed")
+        if before == after:
+            return after, attempt
+
+        logger.info(f"스냅샷 시작 중 커밋 발생 - 재시도 ({attempt}/{max_attempts})")
+        for conn in connections:
+            conn.rollback()
+        if attempt < max_attempts:
+            time.sleep(random.uniform(0, min(GTID_RETRY_MAX_SECONDS, GTID_RETRY_BASE_SECONDS * 2 ** attempt)))
+
+    raise RuntimeError(f"{max_attempts}회 시도 동안 일관된 스냅샷 시점을 잡지 못했습니다")
+
+def open_snapshot_connections(mysql_config, count, strategy='auto'):
+    """
+    같은 일관된 시점을 보는 MySQL 연결 여러 개를 생성
+    각 연결은 병렬 조회 작업자 하나가 사용하며, 부모/자식 테이블을 서로 다른 연결에서 읽어도 같은 시점 데이터가 보장됨
+
+    Args:
+        mysql_config (dict): MySQL 연결 정보 (host, user, password, database)
+        count (int): 생성할 연결 수
+        strategy (str): 'auto', 'ftwrl', 'gtid' 중 하나
+
+    Returns:
+        tuple: (연결 목록, 스냅샷 정보 dict)
+    """
+    if strategy not in SNAPSHOT_STRATEGIES:
+        raise ValueError(f"지원하지 않는 스냅샷 방식입니다: {strategy}")
+
+    # 잠금 시간을 줄이기 위해 연결 수립은 잠금 전에 모두 완료
+    connections = [mysql.connector.connect(**mysql_config) for _ in range(count)]
+    snapshot_info = {'connections': count, 'strategy': strategy, 'attempts': 1}
+
+    try:
+        if strategy in ('auto', 'ftwrl'):
+            lock_conn = mysql.connector.connect(**mysql_config)
+            try:
+                snapshot_info['gtid_executed'] = snapshot_with_global_lock(lock_conn, connections)
+                snapshot_info['strategy'] = 'ftwrl'
+            except mysql.connector.Error as e:
+                if strategy == 'ftwrl':
+                    raise
+                logger.info(f"FLUSH TABLES WITH READ LOCK 사용 불가, gtid 방식으로 대체: {e}")
+                for conn in connections:
+                    conn.rollback()
+                strategy = 'gtid'
+            finally:
+                lock_conn.close()
+
+        if strategy == 'gtid':
+            gtid_executed, attempts = snapshot_with_gtid_check(connections)
+            snapshot_info.update(strategy='gtid', gtid_executed=gtid_executed, attempts=attempts)
+    except Exception:
+        close_snapshot_connections(connections)
+        raise
+
+    logger.info(f"{count}개 연결에서 일관된 스냅샷 시작 (방식: {snapshot_info['strategy']})")
+    return connections, snapshot_info
+
+def close_snapshot_connections(connections):
+    """스냅샷 트랜잭션을 종료하고 모든 연결을 닫음 (오류가 나도 나머지 연결은 계속 정리)"""
+    for conn in connections:
+        try:
+            if conn.in_transaction:
+                conn.rollback()  # 읽기 전용 트랜잭션이므로 롤백해도 변경 사항 없음
+            conn.close()
+        except mysql.connector.Error as e:
+            logger.warning(f"MySQL 연결 정리 실패: {e}")
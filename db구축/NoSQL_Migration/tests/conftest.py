@@ -0,0 +1,4 @@
+import os                           # 이관 모듈 디렉터리 경로 계산
+import sys                          # 이관 모듈을 Lambda 배포 패키지처럼 최상위 모듈로 import하도록 경로 추가
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
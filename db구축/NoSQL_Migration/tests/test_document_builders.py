@@ -0,0 +1,76 @@
+from datetime import datetime
+
+import pytest
+
+from index import (CART_HISTORY_BUCKET_SIZE, LATEST_REVIEWS_PER_PRODUCT, build_cart_history_buckets,
+                   build_product_stats_docs, deterministic_object_id, round_average_score)
+from sampling_validator import KeyCodec, wilson_interval
+from search_tokens import build_search_tokens
+
+
+def review(eval_seq_no, prod_cd, eval_score):
+    return {'_id': deterministic_object_id(eval_seq_no), 'prod_cd': prod_cd, 'eval_score': eval_score,
+            'cust_name': '홍길동', 'ord_item_no': eval_seq_no, 'eval_comment': None, 'eval_date': datetime(2024, 1, 1)}
+
+
+def test_cart_history_buckets_are_split_by_size():
+    items = [{'cart_seq_no': seq} for seq in range(CART_HISTORY_BUCKET_SIZE * 2 + 1)]
+    buckets = build_cart_history_buckets('kim@test.com', items)
+    assert [bucket['_id'] for bucket in buckets] == ['kim@test.com#0', 'kim@test.com#1', 'kim@test.com#2']
+    assert [len(bucket['items']) for bucket in buckets] == [CART_HISTORY_BUCKET_SIZE, CART_HISTORY_BUCKET_SIZE, 1]
+    assert build_cart_history_buckets('kim@test.com', []) == []
+
+
+def test_product_stats_count_histogram_and_latest_reviews():
+    reviews = [review(seq, 'P001', score) for seq, score in enumerate([5, 4, 4, 4, 3, 1, 5], start=1)]
+    reviews.append(review(8, 'P002', 2))
+    stats = {doc['_id']: doc for doc in build_product_stats_docs(reviews)}
+    assert stats['P001']['review_count'] == 7
+    assert stats['P001']['score_sum'] == 26
+    assert stats['P001']['score_histogram'] == {'1': 1, '2': 0, '3': 1, '4': 3, '5': 2}
+    latest = stats['P001']['latest_reviews']
+    assert len(latest) == LATEST_REVIEWS_PER_PRODUCT
+    assert [entry['ord_item_no'] for entry in latest] == [7, 6, 5, 4, 3]
+    assert latest[0]['cust_name'] == '홍**'
+    assert latest[0]['eval_comment'] == ""
+    assert stats['P002']['avg_score'] == 2.0
+
+
+def test_average_score_rounds_half_up_like_to_fixed():
+    # prodDetail.js의 toFixed(1)과 같은 결과 (round()는 4.25를 4.2로 반올림)
+    assert round_average_score(17, 4) == 4.3
+    assert round_average_score(7, 2) == 3.5
+    assert round_average_score(13, 3) == 4.3
+    stats = build_product_stats_docs([review(seq, 'P001', score) for seq, score in enumerate([5, 4, 4, 4], start=1)])
+    assert stats[0]['avg_score'] == 4.3
+
+
+def test_search_tokens_include_ngrams_and_chosung():
+    tokens = build_search_tokens('기본 티셔츠', '면', None)
+    assert {'티셔츠', '셔츠', '티', 'ㅌㅅㅊ', 'ㄱㅂ', '면', 'ㅁ'} <= set(tokens)
+    assert tokens == sorted(set(tokens))
+    assert build_search_tokens('기본 티셔츠', '면') == tokens
+
+
+def test_key_codec_round_trips_integer_keys():
+    codec = KeyCodec()
+    assert codec.to_number(123) == 123
+    assert codec.to_key(123.7) == 123
+
+
+def test_key_codec_preserves_string_key_order():
+    codec = KeyCodec([['P'], list('0123456789'), list('0123456789')])
+    keys = ['P05', 'P10', 'P99']
+    numbers = [codec.to_number(key) for key in keys]
+    assert numbers == sorted(numbers)
+    assert codec.to_key(codec.to_number('P42')) == 'P42'
+
+
+def test_wilson_interval_bounds():
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+    lower, upper = wilson_interval(0, 1000)
+    assert lower == pytest.approx(0.0, abs=1e-12) and 0 < upper < 0.005
+    lower, upper = wilson_interval(50, 1000)
+    assert lower < 0.05 < upper
+    narrow = wilson_interval(50, 1000, confidence=0.9)
+    assert narrow[0] > lower and narrow[1] < upper
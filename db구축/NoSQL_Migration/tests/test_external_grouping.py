@@ -0,0 +1,47 @@
+from external_grouping import ExternalGrouper, collation_key, merge_join
+
+
+def test_groups_are_sorted_across_spilled_runs(tmp_path):
+    rows = [(key % 7, key) for key in range(50)]
+    with ExternalGrouper(lambda row: (row[0], row[1]), 8, str(tmp_path)) as grouper:
+        for row in rows:
+            grouper.add(row)
+        assert len(grouper.run_paths) == 6
+        groups = list(grouper.groups())
+    assert [key for key, _ in groups] == list(range(7))
+    assert groups[3][1] == sorted(row for row in rows if row[0] == 3)
+
+
+def test_groups_without_spill_stay_in_memory(tmp_path):
+    with ExternalGrouper(lambda row: (row[0],), 100, str(tmp_path)) as grouper:
+        grouper.add((2, 'b'))
+        grouper.add((1, 'a'))
+        assert grouper.run_paths == []
+        assert list(grouper.groups()) == [(1, [(1, 'a')]), (2, [(2, 'b')])]
+
+
+def test_merge_join_keeps_parents_without_children_and_drops_orphans():
+    parents = [(1, [('order1',)]), (3, [('order3',)])]
+    children = [(1, ['item1a', 'item1b']), (2, ['orphan']), (4, ['orphan'])]
+    assert list(merge_join(parents, children)) == [(('order1',), ['item1a', 'item1b']), (('order3',), [])]
+
+
+def test_merge_join_matches_keys_case_insensitively(tmp_path):
+    # MySQL의 대소문자 무시 콜레이션처럼 cust_id 대소문자가 달라도 같은 고객의 장바구니로 조인
+    with ExternalGrouper(lambda row: (collation_key(row[0]),), 1, str(tmp_path)) as customers, \
+         ExternalGrouper(lambda row: (collation_key(row[0]), row[1]), 1, str(tmp_path)) as carts:
+        for row in [('b@test.com',), ('Kim@test.com',), ('lee@test.com',)]:
+            customers.add(row)
+        for row in [('kim@test.com', 2), ('KIM@TEST.COM', 1), ('B@test.com', 1), ('nobody@test.com', 1)]:
+            carts.add(row)
+        joined = list(merge_join(customers.groups(), carts.groups()))
+    assert joined == [
+        (('b@test.com',), [('B@test.com', 1)]),
+        (('Kim@test.com',), [('KIM@TEST.COM', 1), ('kim@test.com', 2)]),
+        (('lee@test.com',), [])
+    ]
+
+
+def test_collation_key_leaves_numbers_unchanged():
+    assert collation_key(10) == 10
+    assert collation_key('Kim@Test.com') == 'kim@test.com'
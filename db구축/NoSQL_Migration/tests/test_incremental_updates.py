@@ -0,0 +1,92 @@
+from datetime import datetime
+
+from pymongo import UpdateOne
+
+from index import build_incremental_updates, fields_differ
+
+
+def customer(cart, **fields):
+    """cart 배열만 다른 Customers 문서"""
+    return dict({'_id': 'kim@test.com', 'cust_name': '김철수', 'created_at': datetime(2024, 1, 1), 'cart': cart}, **fields)
+
+
+def cart_item(cart_seq_no, ord_qty=1, ord_yn='N', **fields):
+    return dict({'cart_seq_no': cart_seq_no, 'prod_cd': f'P{cart_seq_no:03d}', 'ord_qty': ord_qty, 'ord_yn': ord_yn,
+                 'added_date': datetime(2024, 1, 1)}, **fields)
+
+
+def updates(new_doc, stored_doc, **kwargs):
+    return build_incremental_updates(new_doc, stored_doc, '_id', 'cart', 'cart_seq_no', **kwargs)
+
+
+def test_unchanged_document_produces_no_operations():
+    stored = customer([cart_item(1)])
+    # 휘발성 필드(created_at, added_date)만 다르면 변경 없음
+    new = customer([cart_item(1, added_date=datetime(2025, 1, 1))], created_at=datetime(2025, 1, 1))
+    assert updates(new, stored) == []
+
+
+def test_top_level_change_uses_set():
+    assert updates(customer([], cust_name='김영희'), customer([])) == [
+        UpdateOne({'_id': 'kim@test.com'}, {'$set': {'cust_name': '김영희'}})
+    ]
+
+
+def test_new_items_are_pushed_and_changed_items_use_positional_set():
+    stored = customer([cart_item(1), cart_item(2)])
+    new = customer([cart_item(1, ord_qty=3), cart_item(2), cart_item(3)])
+    assert updates(new, stored) == [
+        UpdateOne({'_id': 'kim@test.com'}, {'$push': {'cart': {'$each': [cart_item(3)]}}}),
+        UpdateOne({'_id': 'kim@test.com', 'cart.cart_seq_no': 1}, {'$set': {'cart.$.ord_qty': 3}})
+    ]
+
+
+def test_missing_items_are_kept_unless_prune_deleted():
+    stored = customer([cart_item(1), cart_item(2)])
+    new = customer([cart_item(1)])
+    assert updates(new, stored) == []
+    assert updates(new, stored, prune_deleted=True) == [
+        UpdateOne({'_id': 'kim@test.com'}, {'$pull': {'cart': {'cart_seq_no': {'$in': [2]}}}})
+    ]
+
+
+def test_removed_item_keys_are_pulled_without_prune_deleted():
+    # CartHistory로 옮긴 항목(2)만 제거하고 웹에서 추가한 항목(9)은 보존
+    stored = customer([cart_item(1), cart_item(2), cart_item(9)])
+    new = customer([cart_item(1)])
+    assert updates(new, stored, removed_item_keys=[2, 5]) == [
+        UpdateOne({'_id': 'kim@test.com'}, {'$pull': {'cart': {'cart_seq_no': {'$in': [2]}}}})
+    ]
+
+
+def test_fields_added_by_web_are_preserved():
+    # cartView.js가 주문 시 추가한 ord_no/ord_date는 새 문서에 없으므로 비교 대상이 아님
+    stored = customer([cart_item(1, ord_no=1700000000000, ord_date=datetime(2024, 2, 1))])
+    assert updates(customer([cart_item(1)]), stored) == []
+
+
+def test_web_completed_ord_yn_is_not_reverted():
+    stored = customer([cart_item(1, ord_yn='Y'), cart_item(2, ord_yn='N')])
+    new = customer([cart_item(1, ord_yn='N', ord_qty=2), cart_item(2, ord_yn='Y')])
+    assert updates(new, stored) == [
+        UpdateOne({'_id': 'kim@test.com', 'cart.cart_seq_no': 1}, {'$set': {'cart.$.ord_qty': 2}}),
+        UpdateOne({'_id': 'kim@test.com', 'cart.cart_seq_no': 2}, {'$set': {'cart.$.ord_yn': 'Y'}})
+    ]
+
+
+def test_web_completed_review_written_is_not_reverted():
+    stored = {'ord_no': 7, 'cust_id': 'kim@test.com', 'items': [{'ord_item_no': 1, 'review_written': True}]}
+    new = {'ord_no': 7, 'cust_id': 'kim@test.com', 'items': [{'ord_item_no': 1, 'review_written': False}]}
+    assert build_incremental_updates(new, stored, 'ord_no', 'items', 'ord_item_no') == []
+
+
+def test_document_without_array_field():
+    stored = {'_id': 'P001', 'price': 10000, 'detail': {'prod_intro': '면 티셔츠'}}
+    new = {'_id': 'P001', 'price': 12000, 'detail': {'prod_intro': '면 티셔츠'}}
+    assert build_incremental_updates(new, stored, '_id') == [UpdateOne({'_id': 'P001'}, {'$set': {'price': 12000}})]
+
+
+def test_fields_differ_compares_nested_values():
+    assert not fields_differ({'a': 1, 'created_at': 1}, {'a': 1, 'created_at': 2, 'extra': 3})
+    assert fields_differ({'a': [1, 2]}, {'a': [1]})
+    assert fields_differ({'a': {'b': 1}}, {'a': {'b': 2}})